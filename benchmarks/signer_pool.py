@@ -0,0 +1,75 @@
+"""Signing throughput of a single spawned Node process per signature, one
+persistent signing worker and signer pools of increasing size
+
+Usage: python benchmarks/signer_pool.py [--count 2000] [--command ...]
+"""
+
+import os
+import sys
+import argparse
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zerochain.bls import SignerPool, SigningWorker, spawn_sign_payload
+
+PRIVATE_KEY = "d2a87be4da594dd01fb1be18fad4dd2d2341be4ae5b5584229121cbe91b1e411"
+
+
+def hashes(count):
+    return [f"{num:064x}" for num in range(count)]
+
+
+def report(name, count, duration):
+    print(
+        f"{name:<24} {count:>6} signatures {duration:>8.3f}s {count / duration:>10.1f}/s"
+    )
+
+
+def bench_spawn(count):
+    start = perf_counter()
+    for hash_payload in hashes(count):
+        spawn_sign_payload(PRIVATE_KEY, hash_payload)
+    report("spawn per signature", count, perf_counter() - start)
+
+
+def bench_worker(count, command):
+    worker = SigningWorker(command)
+    worker.sign(PRIVATE_KEY, "00")
+    start = perf_counter()
+    for hash_payload in hashes(count):
+        worker.sign(PRIVATE_KEY, hash_payload)
+    report("persistent worker", count, perf_counter() - start)
+    worker.close()
+
+
+def bench_pool(count, size, command):
+    pool = SignerPool(size, command)
+    # Start every process before timing
+    list(pool.sign_many(PRIVATE_KEY, hashes(size * 4)))
+    start = perf_counter()
+    for _ in pool.sign_many(PRIVATE_KEY, hashes(count)):
+        pass
+    report(f"pool of {size}", count, perf_counter() - start)
+    pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--spawn-count", type=int, default=20)
+    parser.add_argument("--command", nargs="+", help="signing process command")
+    args = parser.parse_args()
+
+    if not args.command:
+        bench_spawn(args.spawn_count)
+    bench_worker(args.count, args.command)
+
+    size = 1
+    while size <= os.cpu_count():
+        bench_pool(args.count, size, args.command)
+        size *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Per signature latency of each signer backend, backends that cannot run
+here are reported as unavailable
+
+Usage: python benchmarks/signers.py [--count 500] [--command ...]
+"""
+
+import os
+import sys
+import argparse
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zerochain.signer import NativeSigner, NodeSigner, PersistentSigner
+
+PRIVATE_KEY = "d2a87be4da594dd01fb1be18fad4dd2d2341be4ae5b5584229121cbe91b1e411"
+
+
+def bench(name, signer, count):
+    signer.sign(PRIVATE_KEY, "00" * 32)
+    start = perf_counter()
+    for num in range(count):
+        signer.sign(PRIVATE_KEY, f"{num:064x}")
+    duration = perf_counter() - start
+    print(
+        f"{name:<12} {count:>6} signatures {duration * 1000000 / count:>12.1f}us each"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--node-count", type=int, default=20)
+    parser.add_argument("--command", nargs="+", help="persistent signer command")
+    args = parser.parse_args()
+
+    bench("node", NodeSigner(), args.node_count)
+
+    signer = PersistentSigner(command=args.command)
+    bench("persistent", signer, args.count)
+    signer.close()
+
+    try:
+        bench("native", NativeSigner(), args.count)
+    except ImportError as e:
+        print(f"{'native':<12} unavailable - {e}")
+
+
+if __name__ == "__main__":
+    main()
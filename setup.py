@@ -10,6 +10,7 @@ setup(
     license="BSD 2-clause",
     packages=["zerochain"],
     install_requires=["reedsolo==1.5.4", "requests==2.26.0", "bip39==0.0.2"],
+    extras_require={"async": ["aiohttp>=3.8"]},
     classifiers=[
         "Development Status :: 1 - Beta",
         "Intended Audience :: Developers",
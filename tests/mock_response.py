@@ -16,3 +16,9 @@ class MockResponse:
         if not self.data:
             raise ConnectionError
         return json.dumps(self.data)
+
+    @property
+    def content(self):
+        if isinstance(self.data, str):
+            return self.data.encode()
+        return json.dumps(self.data).encode()
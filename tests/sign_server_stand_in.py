@@ -0,0 +1,51 @@
+"""Stand-in for sign_server.js speaking the same line protocol, signatures
+are a hash of the key and payload so results can be checked per request"""
+
+import sys
+import json
+import time
+from hashlib import sha256
+
+
+def sign(request):
+    payload = f"{request['private_key']}{request['hash']}".encode()
+    return sha256(payload).hexdigest()
+
+
+def verify(request):
+    payload = f"{request['public_key']}{request['hash']}".encode()
+    return sha256(payload).hexdigest() == request["signature"]
+
+
+def generate_keys(request):
+    return {
+        "public_key": "public_key",
+        "private_key": "private_key",
+        "client_id": sha256(request["mnemonic"].encode()).hexdigest(),
+    }
+
+
+def crash(request):
+    sys.exit(1)
+
+
+def hang(request):
+    time.sleep(60)
+
+
+methods = {
+    "sign": sign,
+    "verify": verify,
+    "generate_keys": generate_keys,
+    "crash": crash,
+    "hang": hang,
+}
+
+for line in sys.stdin:
+    request = json.loads(line)
+    try:
+        response = {"id": request["id"], "result": methods[request["method"]](request)}
+    except KeyError as e:
+        response = {"id": request["id"], "error": f"Unknown method {e}"}
+    sys.stdout.write(json.dumps(response) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,242 @@
+import os
+import json
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tests.utils import TEST_DIR
+
+from zerochain.utils import from_json
+from zerochain.client import Client
+from zerochain.network import Network
+from zerochain.async_client import AsyncClient
+from zerochain.allocation import AsyncAllocation
+from zerochain.workers import Miner, Sharder
+from zerochain.exceptions import ConsensusError, DeadlineExceededError
+from zerochain.const import ConsensusStrategy, Endpoints
+
+WORKER_NAMES = ["worker01", "worker02", "worker03"]
+
+
+def load_mock(path):
+    return from_json(os.path.join(TEST_DIR, f"__mocks__/{path}"))
+
+
+class StandInServer:
+    """Local HTTP server standing in for every miner and sharder, each
+    worker is served under its own path prefix"""
+
+    def __init__(self) -> None:
+        self.routes = {}
+        self.requests = []
+        self.delay = 0
+        self.delays = {}
+        app = web.Application()
+        app.router.add_route("*", "/{worker}/{endpoint:.*}", self.handle)
+        self.server = TestServer(app)
+
+    async def handle(self, request):
+        worker = request.match_info["worker"]
+        endpoint = request.match_info["endpoint"]
+        self.requests.append((worker, request.method, endpoint))
+        await asyncio.sleep(self.delays.get(worker, self.delay))
+        status, data = self.routes.get((worker, endpoint)) or self.routes.get(
+            endpoint, (404, "not found")
+        )
+        if not isinstance(data, str):
+            data = json.dumps(data)
+        return web.Response(status=status, text=data)
+
+    def url(self, worker):
+        return str(self.server.make_url(f"/{worker}"))
+
+
+class TestAsyncClient(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.stand_in = StandInServer()
+        await self.stand_in.server.start_server()
+
+        urls = [self.stand_in.url(name) for name in WORKER_NAMES]
+        network = Network(
+            self.stand_in.url(""),
+            [Miner(url) for url in urls],
+            [Sharder(url) for url in urls],
+            [],
+            50,
+        )
+        self.client = AsyncClient(
+            "client_id", "client_key", "public_key", "private_key", "", "", network
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.stand_in.server.close()
+
+    async def test_consensus_read(self):
+        """Test worker responses are consolidated into consensus"""
+        self.stand_in.routes["v1/chain/get/stats"] = (
+            200,
+            load_mock("network/chain_stats.json"),
+        )
+        data = await self.client.get_chain_stats()
+        self.assertIn("current_round", data)
+
+    async def test_consensus_ignores_minority(self):
+        """Test a single disagreeing worker does not change the result"""
+        self.stand_in.routes["v1/chain/get/stats"] = (200, {"round": 1})
+        self.stand_in.routes[("worker02", "v1/chain/get/stats")] = (200, {"round": 2})
+        data = await self.client.get_chain_stats()
+        self.assertEqual(data, {"round": 1})
+
+    async def test_hedged_consensus(self):
+        """Test hedged strategy only queries enough workers for consensus"""
+        self.stand_in.routes["v1/chain/get/stats"] = (200, {"round": 1})
+        self.client.network.consensus_strategy = ConsensusStrategy.HEDGED
+        data = await self.client.get_chain_stats()
+        self.assertEqual(data, {"round": 1})
+        self.assertEqual(len(self.stand_in.requests), 2)
+
+    async def test_min_consensus_error(self):
+        """Test error raised when workers cannot reach minimum consensus"""
+        for num, name in enumerate(WORKER_NAMES):
+            self.stand_in.routes[(name, "v1/chain/get/stats")] = (200, {"round": num})
+        with self.assertRaises(ConsensusError):
+            await self.client.get_chain_stats()
+
+    async def test_deadline_exceeded(self):
+        """Test a bound deadline ends the call while workers hang"""
+        self.stand_in.routes["v1/chain/get/stats"] = (200, {"round": 1})
+        self.stand_in.delay = 5
+        with self.assertRaises(DeadlineExceededError):
+            await self.client.with_deadline(0.1).get_chain_stats()
+
+    async def test_get_balance_empty(self):
+        """Test unfunded wallet balance returns empty value"""
+        self.stand_in.routes["v1/client/get/balance"] = (
+            400,
+            json.dumps({"error": "value not present"}),
+        )
+        balance = await self.client.get_balance()
+        self.assertEqual(balance, 0)
+
+    async def test_send_token(self):
+        """Test transaction is submitted to miners and confirmed by sharders"""
+        self.client.sign = MagicMock(return_value="signature")
+        submitted = {}
+
+        async def put_transaction(request):
+            submitted.update(await request.json())
+            return web.json_response({"entity": {"hash": submitted["hash"]}})
+
+        async def confirmation(request):
+            self.assertEqual(request.query["hash"], submitted["hash"])
+            return web.json_response(load_mock("wallet/confirmed_transaction.json"))
+
+        app = web.Application()
+        app.router.add_post("/{worker}/v1/transaction/put", put_transaction)
+        app.router.add_get("/{worker}/v1/transaction/get/confirmation", confirmation)
+        server = TestServer(app)
+        await server.start_server()
+        urls = [str(server.make_url(f"/{name}")) for name in WORKER_NAMES]
+        self.client.network.miners = [Miner(url) for url in urls]
+        self.client.network.sharders = [Sharder(url) for url in urls]
+
+        try:
+            data = await self.client.send_token("to_client", 1)
+        finally:
+            await server.close()
+
+        self.assertEqual(submitted["to_client_id"], "to_client")
+        self.assertIn("txn", data)
+
+    async def test_broadcast_quorum_ack(self):
+        """Test a broadcast returns once enough workers acknowledge, the slow
+        worker still receives it in the background"""
+        self.stand_in.routes["v1/transaction/put"] = (200, {"entity": {"hash": "h"}})
+        self.stand_in.delays["worker03"] = 0.5
+        data = await self.client._broadcast_to_workers(
+            "miners",
+            "v1/transaction/put",
+            data="{}",
+            is_ack=lambda data: data["entity"]["hash"] == "h",
+            min_acks=2,
+        )
+        self.assertEqual(data, {"entity": {"hash": "h"}})
+        self.assertEqual(len(self.client._background_tasks), 1)
+
+        await asyncio.gather(*self.client._background_tasks)
+        self.assertEqual(len(self.stand_in.requests), 3)
+
+    async def test_concurrent_reads(self):
+        """Test one event loop drives many in-flight consensus reads"""
+        self.stand_in.routes["v1/chain/get/stats"] = (200, {"round": 1})
+        results = await asyncio.gather(
+            *[self.client.get_chain_stats() for _ in range(500)]
+        )
+        self.assertEqual(len(results), 500)
+        self.assertTrue(all(res == {"round": 1} for res in results))
+
+    async def test_provision_wallets(self):
+        """Test wallets are registered concurrently and yielded as they finish"""
+        self.stand_in.routes["v1/client/put"] = (
+            200,
+            load_mock("network/create_wallet.json"),
+        )
+        signer = MagicMock()
+        signer.generate_keys = MagicMock(
+            return_value=load_mock("network/gen_keys.json")
+        )
+        clients = [
+            client
+            async for client in AsyncClient.provision_wallets(
+                self.client.network, 4, max_in_flight=2, signer=signer
+            )
+        ]
+        self.assertEqual(len(clients), 4)
+        self.assertIsInstance(clients[0], AsyncClient)
+
+    async def test_provision_wallets_share_session(self):
+        """Test every registration of a batch reuses one session"""
+        self.stand_in.routes["v1/client/put"] = (
+            200,
+            load_mock("network/create_wallet.json"),
+        )
+        signer = MagicMock()
+        signer.generate_keys = MagicMock(
+            return_value=load_mock("network/gen_keys.json")
+        )
+        with patch(
+            "zerochain.async_connection.aiohttp.ClientSession",
+            side_effect=aiohttp.ClientSession,
+        ) as client_session:
+            wallets = [
+                wallet
+                async for wallet in AsyncClient.provision_wallets(
+                    self.client.network, 6, max_in_flight=3, signer=signer
+                )
+            ]
+        self.assertEqual(len(wallets), 6)
+        self.assertEqual(client_session.call_count, 1)
+
+    async def test_get_allocation(self):
+        """Test the allocation of an async client requests the network with
+        coroutines"""
+        allocations = load_mock("allocation/list_allocations.json")
+        self.stand_in.routes[Endpoints.SC_REST_ALLOCATIONS] = (200, allocations)
+        allocation_info = load_mock("allocation/allocation_info.json")
+        self.stand_in.routes[Endpoints.SC_REST_ALLOCATION] = (200, allocation_info)
+
+        allocation = await self.client.get_allocation(allocations[0]["id"])
+        self.assertIsInstance(allocation, AsyncAllocation)
+        self.assertEqual(await allocation.get_allocation_info(), allocation_info)
+
+    def test_same_method_surface(self):
+        """Test every public client method exists on the async client"""
+        public_methods = [name for name in dir(Client) if not name.startswith("_")]
+        for name in public_methods:
+            self.assertTrue(hasattr(AsyncClient, name), name)
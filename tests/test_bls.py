@@ -0,0 +1,123 @@
+import os
+import sys
+from hashlib import sha256
+from unittest.case import TestCase
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.utils import TEST_DIR
+
+from zerochain.bls import SignerPool, SigningWorker
+from zerochain.exceptions import SigningError
+
+STAND_IN_COMMAND = [sys.executable, os.path.join(TEST_DIR, "sign_server_stand_in.py")]
+
+
+def expected_signature(private_key, hash_payload):
+    return sha256(f"{private_key}{hash_payload}".encode()).hexdigest()
+
+
+class TestSigningWorker(TestCase):
+    def setUp(self) -> None:
+        self.worker = SigningWorker(STAND_IN_COMMAND, timeout=5)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.worker.close()
+        return super().tearDown()
+
+    def test_sign(self):
+        signature = self.worker.sign("key", "hash")
+        self.assertEqual(signature, expected_signature("key", "hash"))
+
+    def test_process_reused(self):
+        """Test one process serves every signature"""
+        self.worker.sign("key", "hash")
+        process = self.worker._process
+        self.worker.sign("key", "other_hash")
+        self.assertIs(self.worker._process, process)
+
+    def test_concurrent_signatures(self):
+        """Test each concurrent caller receives the signature of its payload"""
+        hashes = [f"hash{num}" for num in range(50)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            signatures = list(
+                executor.map(lambda hash: self.worker.sign("key", hash), hashes)
+            )
+
+        self.assertEqual(
+            signatures, [expected_signature("key", hash) for hash in hashes]
+        )
+        self.assertEqual(self.worker.in_flight, 0)
+
+    def test_restarts_after_exit(self):
+        """Test the process is restarted after it exits"""
+        self.worker.sign("key", "hash")
+        with self.assertRaises(SigningError):
+            self.worker.request("crash")
+
+        signature = self.worker.sign("key", "hash")
+        self.assertEqual(signature, expected_signature("key", "hash"))
+        self.assertEqual(self.worker.num_restarts, 1)
+
+    def test_restarts_after_timeout(self):
+        """Test a request left unanswered is dropped and the hung process
+        replaced"""
+        worker = SigningWorker(STAND_IN_COMMAND, timeout=0.5)
+        self.addCleanup(worker.close)
+        with self.assertRaises(SigningError):
+            worker.request("hang")
+        self.assertEqual(worker.in_flight, 0)
+
+        signature = worker.sign("key", "hash")
+        self.assertEqual(signature, expected_signature("key", "hash"))
+        self.assertEqual(worker.num_restarts, 1)
+
+    def test_error_response(self):
+        with self.assertRaises(SigningError):
+            self.worker.request("unknown")
+
+    def test_generate_keys(self):
+        keys = self.worker.generate_keys("mnemonic")
+        self.assertEqual(keys["mnemonic"], "mnemonic")
+        self.assertIn("public_key", keys)
+
+    def test_unable_to_start(self):
+        worker = SigningWorker(["/nonexistent/signer"])
+        with self.assertRaises(SigningError):
+            worker.sign("key", "hash")
+
+
+class TestSignerPool(TestCase):
+    def setUp(self) -> None:
+        self.pool = SignerPool(3, STAND_IN_COMMAND, timeout=5)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.pool.close()
+        return super().tearDown()
+
+    def test_default_size(self):
+        pool = SignerPool(command=STAND_IN_COMMAND)
+        self.assertEqual(pool.size, os.cpu_count())
+
+    def test_sign_many_in_order(self):
+        """Test batch signatures are yielded in the order of the hashes"""
+        hashes = [f"hash{num}" for num in range(100)]
+        signatures = list(self.pool.sign_many("key", hashes, window=10))
+        self.assertEqual(
+            signatures, [expected_signature("key", hash) for hash in hashes]
+        )
+
+    def test_load_spread_across_workers(self):
+        """Test concurrent requests are spread over every worker"""
+        futures = [
+            self.pool.submit("sign", private_key="key", hash=f"hash{num}")
+            for num in range(30)
+        ]
+        for future in futures:
+            future.result(5)
+        self.assertTrue(all(worker._process for worker in self.pool.workers))
+
+    def test_sign_many_generator_input(self):
+        hashes = (f"hash{num}" for num in range(5))
+        self.assertEqual(len(list(self.pool.sign_many("key", hashes))), 5)
@@ -0,0 +1,193 @@
+import os
+import json
+import tempfile
+from time import monotonic, sleep
+from threading import Lock
+from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.case import TestCase
+
+from tests.utils import build_client
+from tests.mock_response import MockResponse
+
+from zerochain.utils import hash_string
+from zerochain.exceptions import (
+    ConsensusError,
+    DeadlineExceededError,
+    SigningError,
+)
+from zerochain.bundle import BundleBroadcaster, read_bundle, write_bundle
+
+
+def transfers(num_transactions):
+    return [
+        {"input": f"transfer {num}", "sc_address": "to_client_id", "value": 1}
+        for num in range(num_transactions)
+    ]
+
+
+def build_signing_client():
+    client = build_client()
+    client.signer = MagicMock()
+    client.signer.sign_many = MagicMock(
+        side_effect=lambda private_key, hashes: [f"signed {hash}" for hash in hashes]
+    )
+    return client
+
+
+class TestWriteBundle(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "bundle.jsonl")
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_signed_records(self):
+        """Test each line is a signed transaction body ready to post"""
+        client = build_signing_client()
+        num_written = write_bundle(client, transfers(5), self.path, chunk_size=2)
+        records = list(read_bundle(self.path))
+
+        self.assertEqual(num_written, 5)
+        self.assertEqual(len(records), 5)
+        for record in records:
+            self.assertEqual(record["signature"], f"signed {record['hash']}")
+            self.assertEqual(record["client_id"], client.id)
+            hash_data = f"{record['creation_date']}:{client.id}:to_client_id:{record['transaction_value']}:{hash_string(record['transaction_data'])}"
+            self.assertEqual(record["hash"], hash_string(hash_data))
+
+    def test_signs_in_chunks(self):
+        client = build_signing_client()
+        write_bundle(client, transfers(5), self.path, chunk_size=2)
+        self.assertEqual(client.signer.sign_many.call_count, 3)
+
+    def test_signing_failure(self):
+        client = build_signing_client()
+        client.signer.sign_many = MagicMock(return_value=[False])
+        with self.assertRaises(SigningError):
+            write_bundle(client, transfers(1), self.path)
+
+
+class MockMiners:
+    """Broadcast stand-in accepting every transaction, tracks how many
+    broadcasts run at once"""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = Lock()
+
+    def __call__(self, worker, endpoint, data=None, is_ack=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        response_data = {"entity": {"hash": json.loads(data)["hash"]}}
+        assert is_ack(response_data)
+        return response_data
+
+
+def signed_records(num_records):
+    return [{"hash": f"hash {num}", "signature": "sig"} for num in range(num_records)]
+
+
+class TestBundleBroadcaster(TestCase):
+    def test_results_in_order(self):
+        client = build_client()
+        client._broadcast_to_workers = MagicMock(side_effect=MockMiners())
+        with BundleBroadcaster(client, max_in_flight=4) as broadcaster:
+            results = list(broadcaster.broadcast(signed_records(10)))
+
+        self.assertEqual(
+            [result["hash"] for result in results], [f"hash {num}" for num in range(10)]
+        )
+        self.assertTrue(all(result["accepted"] for result in results))
+        self.assertEqual(broadcaster.num_accepted, 10)
+
+    def test_bounded_in_flight(self):
+        miners = MockMiners()
+        client = build_client()
+        client._broadcast_to_workers = MagicMock(side_effect=miners)
+        with BundleBroadcaster(client, max_in_flight=3) as broadcaster:
+            list(broadcaster.broadcast(signed_records(20)))
+        self.assertLessEqual(miners.max_in_flight, 3)
+
+    def test_fan_out_not_limited_by_network_executor(self):
+        """Test transactions in flight each reach every miner at once, even
+        when the network executor is narrow"""
+        client = build_client()
+        client.network.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(client.network.executor.shutdown)
+
+        def request(url, data=None, **kwargs):
+            sleep(0.1)
+            return MockResponse(200, {"entity": {"hash": json.loads(data)["hash"]}})
+
+        client._request = MagicMock(side_effect=request)
+        start = monotonic()
+        with BundleBroadcaster(client, max_in_flight=16) as broadcaster:
+            results = list(broadcaster.broadcast(signed_records(16)))
+
+        self.assertTrue(all(result["accepted"] for result in results))
+        # 48 requests through the 2 network threads would take 2.4s
+        self.assertLess(monotonic() - start, 1)
+
+    def test_broadcast_bundle_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bundle.jsonl")
+            write_bundle(build_signing_client(), transfers(3), path)
+
+            client = build_client()
+            client._broadcast_to_workers = MagicMock(side_effect=MockMiners())
+            with BundleBroadcaster(client) as broadcaster:
+                results = list(broadcaster.broadcast(path))
+        self.assertEqual(len(results), 3)
+
+    def test_rejected(self):
+        """Test rejections and unreachable miners are reported per transaction"""
+        client = build_client()
+        client._broadcast_to_workers = MagicMock(
+            side_effect=["invalid signature", ConsensusError("no miners")]
+        )
+        with BundleBroadcaster(client, max_in_flight=1) as broadcaster:
+            results = list(broadcaster.broadcast(signed_records(2)))
+
+        self.assertFalse(any(result["accepted"] for result in results))
+        self.assertEqual(results[0]["response"], "invalid signature")
+        self.assertEqual(broadcaster.num_rejected, 2)
+
+    def test_unexpected_error(self):
+        """Test any broadcast failure rejects its transaction alone"""
+        client = build_client()
+        miners = MockMiners()
+        responses = iter([DeadlineExceededError("deadline"), None, None])
+
+        def broadcast(*args, **kwargs):
+            response = next(responses)
+            if response:
+                raise response
+            return miners(*args, **kwargs)
+
+        client._broadcast_to_workers = MagicMock(side_effect=broadcast)
+        with BundleBroadcaster(client, max_in_flight=1) as broadcaster:
+            results = list(broadcaster.broadcast(signed_records(3)))
+
+        self.assertEqual(
+            [result["accepted"] for result in results], [False, True, True]
+        )
+        self.assertEqual(results[0]["response"], "deadline")
+
+    def test_confirm(self):
+        client = build_client()
+        client._broadcast_to_workers = MagicMock(side_effect=MockMiners())
+        tracker = MagicMock()
+        client._get_confirmation_tracker = MagicMock(return_value=tracker)
+        with BundleBroadcaster(client, confirm=True) as broadcaster:
+            results = list(broadcaster.broadcast(signed_records(2)))
+        self.assertIn("confirmation", results[0])
+        tracker.track.assert_called_with("hash 1")
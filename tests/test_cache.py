@@ -0,0 +1,127 @@
+from time import sleep
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import build_network
+from tests.mock_response import MockResponse
+
+from zerochain.cache import ResponseCache
+from zerochain.const import Endpoints
+
+
+class TestResponseCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = ResponseCache({"config": 60, "short": 0.05}, max_size=2)
+        return super().setUp()
+
+    def test_hit_and_miss(self):
+        key = self.cache.key("sharders", "GET", "config")
+        self.assertEqual(self.cache.get(key), (False, None))
+        self.cache.set(key, "config", {"a": 1})
+        self.assertEqual(self.cache.get(key), (True, {"a": 1}))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.json()["hit_rate"], 0.5)
+
+    def test_expires_after_ttl(self):
+        key = self.cache.key("sharders", "GET", "short")
+        self.cache.set(key, "short", {"a": 1})
+        sleep(0.1)
+        self.assertEqual(self.cache.get(key), (False, None))
+
+    def test_lru_eviction(self):
+        keys = [
+            self.cache.key("sharders", "GET", f"config?id={num}") for num in range(3)
+        ]
+        self.cache.set(keys[0], "config", 0)
+        self.cache.set(keys[1], "config", 1)
+        # Reading the first key makes the second the least recently used
+        self.cache.get(keys[0])
+        self.cache.set(keys[2], "config", 2)
+
+        self.assertTrue(self.cache.get(keys[0])[0])
+        self.assertFalse(self.cache.get(keys[1])[0])
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_invalidate_endpoint(self):
+        key = self.cache.key("sharders", "GET", "config?id=1")
+        other_key = self.cache.key("sharders", "GET", "short")
+        self.cache.set(key, "config", {"a": 1})
+        self.cache.set(other_key, "short", {"a": 1})
+        self.cache.invalidate("config")
+        self.assertFalse(self.cache.get(key)[0])
+        self.assertTrue(self.cache.get(other_key)[0])
+
+    def test_cached_data_is_copied(self):
+        key = self.cache.key("sharders", "GET", "config")
+        self.cache.set(key, "config", {"a": 1})
+        self.cache.get(key)[1]["a"] = 2
+        self.assertEqual(self.cache.get(key)[1], {"a": 1})
+
+    def test_only_reads_with_ttl_cacheable(self):
+        self.assertTrue(self.cache.is_cacheable("GET", "config"))
+        self.assertFalse(self.cache.is_cacheable("GET", "other"))
+        self.assertFalse(self.cache.is_cacheable("POST", "config", data="{}"))
+
+    def test_ttls_by_endpoint_name(self):
+        cache = ResponseCache({"SC_GET_CONFIG": 10})
+        self.assertEqual(cache.ttl(Endpoints.SC_GET_CONFIG), 10)
+
+
+class TestConsensusCache(TestCase):
+    def setUp(self) -> None:
+        self.network = build_network(50)
+        self.network.cache = ResponseCache()
+        return super().setUp()
+
+    def test_config_read_cached(self):
+        """Test repeat config reads are served without a fan-out"""
+        self.network._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        self.network._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+        data = self.network._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+        self.assertEqual(data, {"a": 1})
+        self.assertEqual(self.network._request.call_count, 3)
+        self.assertEqual(self.network.cache.hits, 1)
+
+    def test_uncached_endpoint(self):
+        self.network._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        self.network._consensus_from_workers("sharders", Endpoints.GET_CHAIN_STATS)
+        self.network._consensus_from_workers("sharders", Endpoints.GET_CHAIN_STATS)
+        self.assertEqual(self.network._request.call_count, 6)
+
+    def test_error_not_cached(self):
+        self.network._request = MagicMock(return_value=MockResponse(400, "error"))
+        self.network._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+        self.network._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+        self.assertEqual(self.network._request.call_count, 6)
+
+    def test_consensus_arguments_cached_apart(self):
+        """Test a strict quorum read is not answered by a cached lenient one"""
+        self.network._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        self.network._consensus_from_workers(
+            "sharders", Endpoints.SC_GET_CONFIG, min_confirmation=10
+        )
+        self.network._consensus_from_workers(
+            "sharders", Endpoints.SC_GET_CONFIG, min_confirmation=90
+        )
+        self.network._consensus_from_workers(
+            "sharders",
+            Endpoints.SC_GET_CONFIG,
+            min_confirmation=90,
+            empty_return_value={"a": 0},
+        )
+        self.assertEqual(self.network._request.call_count, 9)
+        self.assertEqual(self.network.cache.hits, 0)
+
+    def test_cache_opt_in(self):
+        """Test networks only cache when configured to"""
+        self.assertIsNone(build_network(50).cache)
+        self.assertIsNone(ResponseCache.from_object({}))
+        self.assertIsNotNone(ResponseCache.from_object({"cache": True}))
+
+    def test_cache_disabled(self):
+        self.network.cache = None
+        self.network._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        self.network._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+        self.network._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+        self.assertEqual(self.network._request.call_count, 6)
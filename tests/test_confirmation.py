@@ -0,0 +1,120 @@
+from time import monotonic
+from threading import Lock
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import build_client
+
+from zerochain.confirmation import ConfirmationTracker
+
+
+class MockChain:
+    """Finalized blocks of a chain stand-in, a block is finalized per call
+    of get_latest_finalized_block"""
+
+    def __init__(self, blocks, start_round=100) -> None:
+        self.blocks = blocks
+        self.start_round = start_round
+        self.round = start_round
+        self.requested_rounds = []
+        self._lock = Lock()
+
+    def get_latest_finalized_block(self):
+        with self._lock:
+            self.round = min(self.round + 1, self.start_round + len(self.blocks))
+            return {"round": self.round, "hash": f"block {self.round}"}
+
+    def get_block_by_round(self, round_num, content=None):
+        self.requested_rounds.append(round_num)
+        hashes = self.blocks[round_num - self.start_round - 1]
+        transactions = [{"hash": hash, "transaction_status": 1} for hash in hashes]
+        return {
+            "block": {
+                "hash": f"block {round_num}",
+                "round": round_num,
+                "transactions": transactions,
+            }
+        }
+
+
+def build_tracker(chain, **kwargs):
+    client = build_client()
+    client.network.block_time = 0.01
+    client.network.block_time_observed_at = monotonic()
+    client.get_latest_finalized_block = MagicMock(
+        side_effect=chain.get_latest_finalized_block
+    )
+    client.get_block_by_round = MagicMock(side_effect=chain.get_block_by_round)
+    client.check_transaction_status = MagicMock(return_value={})
+    return ConfirmationTracker(client, **kwargs)
+
+
+class TestConfirmationTracker(TestCase):
+    def test_confirms_from_blocks(self):
+        """Test every pending hash is resolved from the block it is in"""
+        chain = MockChain([[], ["a", "b", "other"], [], ["c"]], start_round=100)
+        tracker = build_tracker(chain, lookback=0, straggler_blocks=100)
+        futures = {hash: tracker.track(hash) for hash in "abc"}
+
+        for hash, future in futures.items():
+            confirmation_data = future.result(5)
+            self.assertEqual(confirmation_data["hash"], hash)
+            self.assertEqual(confirmation_data["transaction_status"], 1)
+        self.assertEqual(futures["a"].result()["round"], 102)
+        self.assertEqual(futures["c"].result()["block_hash"], "block 104")
+        self.assertEqual(tracker.num_confirmed_by_block, 3)
+        tracker.client.check_transaction_status.assert_not_called()
+
+    def test_requests_each_block_once(self):
+        chain = MockChain([["a"], [], [], ["b"]], start_round=0)
+        tracker = build_tracker(chain, lookback=1, straggler_blocks=100)
+        futures = [tracker.track(hash) for hash in "ab"]
+        for future in futures:
+            future.result(5)
+        self.assertEqual(
+            sorted(chain.requested_rounds), sorted(set(chain.requested_rounds))
+        )
+
+    def test_queries_stragglers(self):
+        """Test a hash missing from the blocks followed is queried on its own"""
+        chain = MockChain([[]] * 1000)
+        tracker = build_tracker(chain, straggler_blocks=2)
+        tracker.client.check_transaction_status = MagicMock(
+            return_value={"hash": "a", "transaction_status": 1}
+        )
+        confirmation_data = tracker.track("a").result(5)
+        self.assertEqual(confirmation_data["transaction_status"], 1)
+        self.assertEqual(tracker.num_confirmed_by_query, 1)
+        tracker.client.check_transaction_status.assert_called_with("a")
+
+    def test_expires_unconfirmed(self):
+        chain = MockChain([[]] * 1000)
+        tracker = build_tracker(chain, straggler_blocks=100)
+        self.assertIsNone(tracker.track("a", timeout=0.05).result(5))
+        self.assertEqual(tracker.num_expired, 1)
+
+    def test_stops_when_idle(self):
+        """Test the thread exits once nothing is pending and restarts on track"""
+        chain = MockChain([["a"], ["b"], [], [], []], start_round=0)
+        tracker = build_tracker(chain, lookback=0, straggler_blocks=100)
+        tracker.track("a").result(5)
+        tracker._thread and tracker._thread.join(5)
+        self.assertIsNone(tracker._thread)
+
+        tracker.track("b", timeout=5)
+        self.assertIsNotNone(tracker._thread)
+
+    def test_close(self):
+        chain = MockChain([[]] * 1000)
+        tracker = build_tracker(chain, straggler_blocks=100)
+        future = tracker.track("a")
+        tracker.close()
+        self.assertIsNone(future.result(5))
+        with self.assertRaises(RuntimeError):
+            tracker.track("b")
+
+    def test_network_tracker_shared(self):
+        client = build_client()
+        tracker = client._get_confirmation_tracker()
+        self.assertIs(client.network.confirmation_tracker, tracker)
+        self.assertIs(client._get_confirmation_tracker(), tracker)
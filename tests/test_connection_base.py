@@ -1,13 +1,19 @@
 import os
 import json
+from time import time
+from threading import Barrier, Event
 from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
 from unittest.case import TestCase
 
 
-from tests.utils import TEST_DIR, build_network
+from tests.utils import TEST_DIR, build_client, build_network
 from tests.mock_response import MockResponse
 
-from zerochain.const import Endpoints
+from zerochain.const import ConsensusFingerprint, ConsensusStrategy, Endpoints
+from zerochain.network import Network
+from zerochain.workers import Sharder
+from zerochain.exceptions import ConsensusError
 from zerochain.utils import from_json
 from zerochain.connection import ConnectionBase
 
@@ -115,6 +121,264 @@ class TestGetConsensus(TestCase):
         )
         self.assertIn("balance", data)
 
+    def test_majority_last_response(self):
+        """Test consensus is returned when the majority response arrives last"""
+        responses = [
+            MockResponse(200, {"round": 2}),
+            MockResponse(200, {"round": 1}),
+            MockResponse(200, {"round": 1}),
+        ]
+        self.connection.executor = ThreadPoolExecutor(max_workers=1)
+        self.connection._request = MagicMock(side_effect=responses)
+        data = self.connection._consensus_from_workers(
+            "sharders", "http://placeholder.com"
+        )
+        self.assertEqual(data, {"round": 1})
+
+    def _setup_key_order_mock(self):
+        responses = [
+            MockResponse(200, '{"round": 1, "hash": "a"}'),
+            MockResponse(200, '{"hash": "a", "round": 1}'),
+            MockResponse(200, '{"round": 1, "hash": "a"}'),
+        ]
+        self.connection.executor = ThreadPoolExecutor(max_workers=1)
+        self.connection._request = MagicMock(side_effect=responses)
+
+    def test_raw_fingerprint_key_order(self):
+        """Test raw fingerprint treats differently ordered bodies as different"""
+        self._setup_key_order_mock()
+        self.connection.min_confirmation = 67
+        with self.assertRaises(ConsensusError):
+            self.connection._consensus_from_workers("sharders", "v1/chain/get/stats")
+
+    def test_canonical_fingerprint_key_order(self):
+        """Test canonical fingerprint ignores key order"""
+        self._setup_key_order_mock()
+        self.connection.min_confirmation = 67
+        data = self.connection._consensus_from_workers(
+            "sharders",
+            "v1/chain/get/stats",
+            fingerprint=ConsensusFingerprint.CANONICAL,
+        )
+        self.assertIn("round", data)
+
+    def test_only_winner_parsed(self):
+        """Test only the winning response body is parsed"""
+        responses = [MockResponse(200, {"round": 1}) for _ in range(3)]
+        for response in responses:
+            response.json = MagicMock(return_value={"round": 1})
+        self.connection._request = MagicMock(side_effect=responses)
+        self.connection._consensus_from_workers("sharders", "v1/chain/get/stats")
+        num_parsed = sum(response.json.call_count for response in responses)
+        self.assertEqual(num_parsed, 1)
+
+    def test_text_body_half_weight(self):
+        """Test a 200 body that is not JSON, such as an error page, counts
+        for half a confirmation"""
+        self._setup_mock(200, "<html>Bad Gateway</html>")
+        self.connection.min_confirmation = 67
+        with self.assertRaises(ConsensusError):
+            self.connection._consensus_from_workers("sharders", "v1/chain/get/stats")
+
+    def test_fails_fast_when_consensus_impossible(self):
+        """Test consensus error raised before the slowest worker responds"""
+        release = Event()
+
+        def request(url, **kwargs):
+            if url.startswith("http://worker03.com"):
+                release.wait(5)
+                return MockResponse(200, {"round": 3})
+            if url.startswith("http://worker02.com"):
+                return MockResponse(200, {"round": 2})
+            return MockResponse(200, {"round": 1})
+
+        self.connection.min_confirmation = 67
+        self.connection._request = MagicMock(side_effect=request)
+
+        start = time()
+        with self.assertRaises(ConsensusError) as context:
+            self.connection._consensus_from_workers("sharders", "v1/chain/get/stats")
+        duration = time() - start
+        release.set()
+
+        self.assertLess(duration, 1)
+        self.assertIn("2/3 workers responded", str(context.exception))
+
     # TODO - TESTS
     def test_handle_empty_return_value(self):
         pass
+
+
+class TestHedgedConsensus(TestCase):
+    def setUp(self) -> None:
+        sharders = [Sharder(f"http://worker0{num}.com") for num in range(1, 6)]
+        self.connection = Network(
+            "http://placeholder.com",
+            [],
+            sharders,
+            [],
+            50,
+            consensus_strategy=ConsensusStrategy.HEDGED,
+        )
+        return super().setUp()
+
+    def test_queries_minimum_workers_on_agreement(self):
+        """Test only enough workers for consensus are queried when they agree"""
+        self.connection._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        data = self.connection._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"a": 1})
+        self.assertEqual(self.connection._request.call_count, 3)
+
+    def test_expands_on_disagreement(self):
+        """Test another worker is queried when responses disagree"""
+        responses = [
+            MockResponse(200, {"a": 1}),
+            MockResponse(200, {"a": 2}),
+            MockResponse(200, {"a": 1}),
+            MockResponse(200, {"a": 1}),
+        ]
+        self.connection.executor = ThreadPoolExecutor(max_workers=1)
+        self.connection._request = MagicMock(side_effect=responses)
+        data = self.connection._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"a": 1})
+        self.assertEqual(self.connection._request.call_count, 4)
+
+    def test_hedges_slow_worker(self):
+        """Test a slow worker is hedged with another after hedge delay"""
+        release = Event()
+
+        def request(url, **kwargs):
+            if url.startswith("http://worker01.com"):
+                release.wait(5)
+            return MockResponse(200, {"a": 1})
+
+        self.connection._request = MagicMock(side_effect=request)
+
+        start = time()
+        data = self.connection._consensus_from_workers(
+            "sharders", "v1/chain/get/stats", hedge_delay=0.05
+        )
+        duration = time() - start
+        release.set()
+
+        self.assertEqual(data, {"a": 1})
+        self.assertLess(duration, 1)
+
+    def test_strategy_per_call(self):
+        """Test strategy can be overridden per call"""
+        # Every worker must be requested before any response is returned
+        barrier = Barrier(5, timeout=1)
+
+        def request(url, **kwargs):
+            barrier.wait()
+            return MockResponse(200, {"a": 1})
+
+        self.connection._request = MagicMock(side_effect=request)
+        data = self.connection._consensus_from_workers(
+            "sharders", "v1/chain/get/stats", strategy=ConsensusStrategy.ALL
+        )
+        self.assertEqual(data, {"a": 1})
+        self.assertEqual(self.connection._request.call_count, 5)
+
+    def test_with_strategy(self):
+        """Test a bound copy overrides the strategy of the network"""
+        barrier = Barrier(5, timeout=1)
+
+        def request(url, **kwargs):
+            barrier.wait()
+            return MockResponse(200, {"a": 1})
+
+        self.connection._request = MagicMock(side_effect=request)
+        bound = self.connection.with_strategy(ConsensusStrategy.ALL)
+        data = bound._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"a": 1})
+        self.assertEqual(self.connection._request.call_count, 5)
+        self.assertEqual(
+            self.connection._get_consensus_strategy(), ConsensusStrategy.HEDGED
+        )
+
+    def test_with_strategy_hedge_delay(self):
+        """Test a client bound to a hedged strategy hedges after its own delay"""
+        release = Event()
+
+        def request(url, **kwargs):
+            if url.startswith("http://worker01.com"):
+                release.wait(5)
+            return MockResponse(200, {"a": 1})
+
+        self.connection.consensus_strategy = ConsensusStrategy.ALL
+        self.connection.hedge_delay = 10
+        client = build_client()
+        client.network = self.connection
+        client._request = MagicMock(side_effect=request)
+        bound = client.with_strategy(ConsensusStrategy.HEDGED, hedge_delay=0.05)
+
+        start = time()
+        data = bound._consensus_from_workers("sharders", "v1/chain/get/stats")
+        duration = time() - start
+        release.set()
+
+        self.assertEqual(data, {"a": 1})
+        self.assertLess(duration, 1)
+        self.assertIsNone(client.consensus_strategy)
+
+
+class TestBroadcast(TestCase):
+    def setUp(self) -> None:
+        self.connection = build_network(50)
+        return super().setUp()
+
+    def test_returns_after_min_acks(self):
+        """Test the broadcast returns once min acks arrive, without waiting
+        on the slow worker"""
+        release = Event()
+        requested = []
+
+        def request(url, **kwargs):
+            requested.append(url)
+            if url.startswith("http://worker03.com"):
+                release.wait(5)
+            return MockResponse(200, {"entity": {"hash": "h"}})
+
+        self.connection._request = MagicMock(side_effect=request)
+        start = time()
+        data = self.connection._broadcast_to_workers(
+            "miners", Endpoints.PUT_TRANSACTION, data="{}", min_acks=2
+        )
+        duration = time() - start
+        release.set()
+
+        self.assertEqual(data, {"entity": {"hash": "h"}})
+        self.assertLess(duration, 1)
+        self.assertEqual(len(requested), 3)
+
+    def test_min_acks_from_network(self):
+        self.connection.broadcast_min_acks = 3
+        self.connection._request = MagicMock(
+            return_value=MockResponse(200, {"entity": {"hash": "h"}})
+        )
+        self.connection._broadcast_to_workers("miners", Endpoints.PUT_TRANSACTION)
+        self.assertEqual(self.connection._request.call_count, 3)
+
+    def test_rejected(self):
+        """Test rejection data is returned once acks can no longer be met"""
+        responses = [
+            MockResponse(200, {"entity": {"hash": "h"}}),
+            MockResponse(200, {"entity": {"hash": "other"}}),
+            MockResponse(200, {"entity": {"hash": "other"}}),
+        ]
+        self.connection.executor = ThreadPoolExecutor(max_workers=1)
+        self.connection._request = MagicMock(side_effect=responses)
+        data = self.connection._broadcast_to_workers(
+            "miners",
+            Endpoints.PUT_TRANSACTION,
+            is_ack=lambda data: data["entity"]["hash"] == "h",
+            min_acks=2,
+        )
+        self.assertEqual(data, {"entity": {"hash": "other"}})
+
+    def test_unreachable(self):
+        """Test error raised when no worker answers"""
+        self.connection._request = MagicMock(return_value=ConnectionError("down"))
+        with self.assertRaises(ConsensusError):
+            self.connection._broadcast_to_workers("miners", Endpoints.PUT_TRANSACTION)
@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from zerochain.consensus import AckTally, ConsensusTally
+
+
+class TestConsensusTally(TestCase):
+    def setUp(self) -> None:
+        self.tally = ConsensusTally(num_workers=4, min_confirmation=50)
+        return super().setUp()
+
+    def test_leader_tracks_highest_bucket(self):
+        """Test leader moves to the bucket with the most confirmations"""
+        self.tally.add("a", {"round": 1})
+        self.tally.add("b", {"round": 2})
+        self.tally.add("b", {"round": 2})
+        self.assertEqual(self.tally.leader_key, "b")
+        self.assertEqual(self.tally.leader_weight, 2)
+        self.assertEqual(self.tally.leader_data, {"round": 2})
+
+    def test_keeps_first_payload_per_bucket(self):
+        """Test a bucket stores a single representative payload"""
+        first = {"round": 1}
+        self.tally.add("a", first)
+        self.tally.add("a", {"round": 1})
+        self.assertIs(self.tally.leader_data, first)
+        self.assertEqual(self.tally.summary(), {"a": 2})
+
+    def test_reached_before_all_responses(self):
+        """Test consensus is reached once the leader passes min confirmation"""
+        self.tally.add("a", {})
+        self.tally.add("a", {})
+        self.assertFalse(self.tally.is_reached())
+        self.tally.add("a", {})
+        self.assertTrue(self.tally.is_reached())
+
+    def test_reached_when_complete(self):
+        """Test meeting min confirmation is enough once every worker responded"""
+        tally = ConsensusTally(num_workers=2, min_confirmation=50)
+        tally.add("a", {})
+        tally.add("b", {})
+        self.assertTrue(tally.is_complete())
+        self.assertTrue(tally.is_reached())
+
+    def test_weighted_responses(self):
+        """Test fractional weights count towards the leader"""
+        self.tally.add("error", "error text", 0.5)
+        self.tally.add("error", "error text", 0.5)
+        self.assertEqual(self.tally.leader_weight, 1)
+        self.assertEqual(self.tally.percentage(), 25)
+
+    def test_impossible(self):
+        """Test quorum is impossible once outstanding workers cannot lift
+        the leader to min confirmation"""
+        tally = ConsensusTally(num_workers=4, min_confirmation=75)
+        tally.add("a", {})
+        tally.add("b", {})
+        self.assertFalse(tally.is_impossible())
+        tally.add("c", {})
+        self.assertTrue(tally.is_impossible())
+
+    def test_empty_tally(self):
+        """Test empty tally has no leader"""
+        self.assertIsNone(self.tally.leader_data)
+        self.assertEqual(self.tally.percentage(), 0)
+
+    def test_describe(self):
+        """Test diagnostic lists responses and bucket tallies"""
+        self.tally.add("aaaaaaaaaaaa", {})
+        self.tally.add("bbbbbbbbbbbb", {}, 0.5)
+        description = self.tally.describe()
+        self.assertIn("2/4 workers responded", description)
+        self.assertIn("aaaaaaaa: 1", description)
+        self.assertIn("bbbbbbbb: 0.5", description)
+
+
+class TestAckTally(TestCase):
+    def test_reached(self):
+        tally = AckTally(num_workers=3, min_acks=2)
+        tally.add({"a": 1}, True)
+        self.assertFalse(tally.is_reached())
+        tally.add({"a": 2}, True)
+        self.assertTrue(tally.is_reached())
+        self.assertEqual(tally.ack_data, {"a": 1})
+
+    def test_impossible(self):
+        """Test acks are impossible once too few workers are outstanding"""
+        tally = AckTally(num_workers=3, min_acks=2)
+        tally.add("rejected", False)
+        self.assertFalse(tally.is_impossible())
+        tally.skip()
+        self.assertTrue(tally.is_impossible())
+        self.assertEqual(tally.rejection_data, "rejected")
+
+    def test_min_acks_capped(self):
+        """Test fewer workers than min acks need every worker to acknowledge"""
+        tally = AckTally(num_workers=1, min_acks=2)
+        tally.add({}, True)
+        self.assertTrue(tally.is_reached())
@@ -0,0 +1,154 @@
+from time import time
+from threading import Event
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import build_client, build_network
+from tests.mock_response import MockResponse
+
+from zerochain.deadline import Deadline
+from zerochain.transaction import Transaction
+from zerochain.exceptions import DeadlineExceededError
+
+
+class TestDeadline(TestCase):
+    def test_remaining(self):
+        deadline = Deadline(10)
+        self.assertGreater(deadline.remaining(), 9)
+        self.assertFalse(deadline.expired())
+
+    def test_expired_raises(self):
+        deadline = Deadline(0)
+        self.assertTrue(deadline.expired())
+        with self.assertRaises(DeadlineExceededError):
+            deadline.check()
+
+    def test_cap(self):
+        deadline = Deadline(1)
+        self.assertEqual(deadline.cap(0.1), 0.1)
+        self.assertLessEqual(deadline.cap(30), 1)
+        self.assertLessEqual(deadline.cap(None), 1)
+
+    def test_from_value(self):
+        deadline = Deadline(1)
+        self.assertIs(Deadline.from_value(deadline), deadline)
+        self.assertIsNone(Deadline.from_value(None))
+        self.assertEqual(Deadline.from_value(2).seconds, 2)
+
+    def test_deadline_error_is_timeout(self):
+        self.assertTrue(issubclass(DeadlineExceededError, TimeoutError))
+
+
+class TestRequestDeadline(TestCase):
+    def setUp(self) -> None:
+        self.network = build_network(50)
+        self.network.session_pool = MagicMock()
+        self.network.session_pool.request = MagicMock(
+            return_value=MockResponse(200, {})
+        )
+        return super().setUp()
+
+    def test_network_timeout_used(self):
+        """Test connect and read timeout of network are sent with requests"""
+        self.network.timeout = (1, 2)
+        self.network._request("http://worker01.com")
+        kwargs = self.network.session_pool.request.call_args.kwargs
+        self.assertEqual(kwargs["timeout"], (1, 2))
+
+    def test_timeout_capped_by_deadline(self):
+        """Test request timeouts never run past the deadline"""
+        self.network.with_deadline(0.5)._request("http://worker01.com")
+        connect_timeout, read_timeout = (
+            self.network.session_pool.request.call_args.kwargs["timeout"]
+        )
+        self.assertLessEqual(connect_timeout, 0.5)
+        self.assertLessEqual(read_timeout, 0.5)
+
+    def test_with_deadline_copies(self):
+        """Test binding a deadline leaves the original object unbound"""
+        bound = self.network.with_deadline(1)
+        self.assertIsNone(self.network.deadline)
+        self.assertEqual(bound.deadline.seconds, 1)
+        self.assertIs(bound.session_pool, self.network.session_pool)
+
+
+class TestConsensusDeadline(TestCase):
+    def setUp(self) -> None:
+        self.network = build_network(50)
+        return super().setUp()
+
+    def test_raises_when_workers_hang(self):
+        """Test consensus returns by the deadline when workers do not respond"""
+        release = Event()
+
+        def request(url, **kwargs):
+            release.wait(5)
+            return MockResponse(200, {"a": 1})
+
+        self.network._request = MagicMock(side_effect=request)
+
+        start = time()
+        with self.assertRaises(DeadlineExceededError):
+            self.network._consensus_from_workers(
+                "sharders", "v1/chain/get/stats", deadline=0.1
+            )
+        duration = time() - start
+        release.set()
+
+        self.assertLess(duration, 1)
+
+    def test_bound_deadline_used(self):
+        """Test consensus of a bound copy uses its deadline"""
+        release = Event()
+
+        def request(url, **kwargs):
+            release.wait(5)
+            return MockResponse(200, {"a": 1})
+
+        self.network._request = MagicMock(side_effect=request)
+        with self.assertRaises(DeadlineExceededError):
+            self.network.with_deadline(0.1)._consensus_from_workers(
+                "sharders", "v1/chain/get/stats"
+            )
+        release.set()
+
+    def test_expired_deadline_sends_nothing(self):
+        self.network._request = MagicMock(return_value=MockResponse(200, {}))
+        with self.assertRaises(DeadlineExceededError):
+            self.network._consensus_from_workers(
+                "sharders", "v1/chain/get/stats", deadline=Deadline(0)
+            )
+        self.network._request.assert_not_called()
+
+    def test_consensus_within_deadline(self):
+        self.network._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        data = self.network._consensus_from_workers(
+            "sharders", "v1/chain/get/stats", deadline=5
+        )
+        self.assertEqual(data, {"a": 1})
+
+
+class TestTransactionDeadline(TestCase):
+    def setUp(self) -> None:
+        self.client = build_client().with_deadline(0.2)
+        self.client.check_transaction_status = MagicMock(
+            return_value={"transaction_status": 0}
+        )
+        return super().setUp()
+
+    def test_confirmation_polling_bound(self):
+        """Test confirmation polling stops at the deadline of the client"""
+        transaction = Transaction(
+            sc_address="",
+            transaction_name="",
+            transaction_type=0,
+            input={},
+            value=0,
+            client=self.client,
+            raise_exception=True,
+        )
+
+        start = time()
+        with self.assertRaises(DeadlineExceededError):
+            transaction.validate("hash")
+        self.assertLess(time() - start, 1)
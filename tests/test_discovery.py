@@ -0,0 +1,161 @@
+import os
+import tempfile
+from threading import Event
+from unittest.mock import MagicMock, patch
+from unittest.case import TestCase
+
+from zerochain.network import Network
+from zerochain.discovery import WorkerDiscovery
+
+HOSTNAME = "https://beta.0chain.net"
+
+DNS_WORKERS = {
+    "miners": ["http://miner01.com", "http://miner02.com"],
+    "sharders": ["http://sharder01.com"],
+}
+
+
+class TestWorkerDiscovery(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_obj = {
+            "block_worker": f"{HOSTNAME}/dns",
+            "preferred_blobbers": [],
+            "min_confirmation": 50,
+            "discovery_dir": self.tmp_dir.name,
+        }
+        self.dns = MagicMock(return_value=DNS_WORKERS)
+        self.magic_block_number = MagicMock(return_value=7)
+        patches = [
+            patch("zerochain.discovery.request_dns_workers", self.dns),
+            patch("zerochain.network.request_dns_workers", self.dns),
+            patch.object(
+                WorkerDiscovery, "_get_magic_block_number", self.magic_block_number
+            ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def build_network(self):
+        network = Network.from_object(self.config_obj)
+        network.discovery.revalidation.join(5)
+        return network
+
+    def save_snapshot(self, magic_block_number=7, **workers):
+        snapshot = {
+            "miners": ["http://miner01.com", "http://miner03.com"],
+            "sharders": ["http://sharder01.com"],
+            **workers,
+        }
+        WorkerDiscovery(self.tmp_dir.name).save(
+            HOSTNAME, snapshot["miners"], snapshot["sharders"], magic_block_number
+        )
+
+    def test_cold_start(self):
+        """Test workers are requested from DNS once and saved with the
+        magic block number"""
+        network = self.build_network()
+        self.assertEqual(self.dns.call_count, 1)
+        self.assertEqual(
+            [worker.url for worker in network.miners], DNS_WORKERS["miners"]
+        )
+
+        snapshot = WorkerDiscovery(self.tmp_dir.name).load(HOSTNAME)
+        self.assertEqual(snapshot["sharders"], DNS_WORKERS["sharders"])
+        self.assertEqual(snapshot["magic_block_number"], 7)
+
+    def test_starts_from_snapshot(self):
+        """Test a valid snapshot starts the network without any DNS request"""
+        self.save_snapshot()
+        network = self.build_network()
+        self.dns.assert_not_called()
+        self.assertEqual(network.miners[1].url, "http://miner03.com")
+
+    def test_stale_snapshot_refreshed(self):
+        """Test a changed magic block replaces the workers from a single DNS
+        request, known workers keep their statistics"""
+        self.save_snapshot(magic_block_number=6)
+        network = Network.from_object(self.config_obj)
+        miner = network.miners[0]
+        network.discovery.revalidation.join(5)
+
+        self.assertEqual(self.dns.call_count, 1)
+        self.assertEqual(
+            [worker.url for worker in network.miners], DNS_WORKERS["miners"]
+        )
+        self.assertIs(network.miners[0], miner)
+        self.assertIsNotNone(network.miners[1].breaker)
+        snapshot = WorkerDiscovery(self.tmp_dir.name).load(HOSTNAME)
+        self.assertEqual(snapshot["miners"], DNS_WORKERS["miners"])
+
+    def test_expired_snapshot_refreshed(self):
+        self.save_snapshot()
+        self.config_obj["discovery_max_age"] = -1
+        self.build_network()
+        self.assertEqual(self.dns.call_count, 1)
+
+    def test_unreadable_snapshot(self):
+        with open(WorkerDiscovery(self.tmp_dir.name).path(HOSTNAME), "w") as f:
+            f.write("{")
+        self.build_network()
+        self.assertEqual(self.dns.call_count, 1)
+
+    def test_revalidation_shared(self):
+        """Test networks started while a revalidation runs join it and are
+        given the workers it finds"""
+        self.save_snapshot(magic_block_number=6)
+        release = Event()
+
+        def magic_block_number(network):
+            release.wait(5)
+            return 7
+
+        self.magic_block_number.side_effect = magic_block_number
+        first = Network.from_object(self.config_obj)
+        second = Network.from_object(self.config_obj)
+        self.assertIs(first.discovery.revalidation, second.discovery.revalidation)
+
+        release.set()
+        first.discovery.revalidation.join(5)
+        self.assertEqual(self.dns.call_count, 1)
+        for network in (first, second):
+            self.assertEqual(
+                [worker.url for worker in network.miners], DNS_WORKERS["miners"]
+            )
+
+    def test_opt_in(self):
+        """Test discovery is off unless discovery_dir is set"""
+        del self.config_obj["discovery_dir"]
+        network = Network.from_object(self.config_obj)
+        self.assertIsNone(network.discovery)
+        self.assertEqual(self.dns.call_count, 1)
+        self.assertIsNotNone(WorkerDiscovery.from_object({"discovery_dir": True}))
+
+    def test_disabled(self):
+        """Test a single DNS request without discovery"""
+        self.config_obj["discovery_dir"] = False
+        network = Network.from_object(self.config_obj)
+        self.assertIsNone(network.discovery)
+        self.assertEqual(self.dns.call_count, 1)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+class TestLazyConfig(TestCase):
+    def test_not_parsed_on_import(self):
+        """Test default configs are only parsed once accessed"""
+        import zerochain.config as config
+
+        loader = MagicMock(return_value={"block_worker": f"{HOSTNAME}/dns"})
+        config.__dict__.pop("default_network_config_obj", None)
+        with patch.dict(config.CONFIG_LOADERS, default_network_config_obj=loader):
+            loader.assert_not_called()
+            self.assertEqual(config.default_network_config_obj, loader.return_value)
+            config.default_network_config_obj
+            loader.assert_called_once()
+        del config.default_network_config_obj
@@ -0,0 +1,73 @@
+from threading import Event
+from time import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.utils import build_client, build_network
+from tests.mock_response import MockResponse
+
+from zerochain.executor import get_default_executor, set_default_executor
+
+
+class TestExecutor(TestCase):
+    def test_default_executor_shared(self):
+        """Test networks share the process wide executor"""
+        first = build_network(50)
+        second = build_network(50)
+        self.assertIs(first._get_executor(), second._get_executor())
+        self.assertIs(first._get_executor(), get_default_executor())
+
+    def test_default_executor_size(self):
+        """Test the shared executor fans out several rounds at once"""
+        self.assertGreaterEqual(get_default_executor()._max_workers, 32)
+
+    def test_with_executor(self):
+        """Test a bound copy fans out on its own executor, the network and
+        the original keep theirs"""
+        client = build_client()
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        bound = client.with_executor(executor)
+        self.assertIs(bound._get_executor(), executor)
+        self.assertIs(client._get_executor(), get_default_executor())
+
+        bound._request = MagicMock(return_value=MockResponse(200, {"round": 1}))
+        data = bound._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"round": 1})
+
+    def test_set_default_executor(self):
+        """Test existing networks keep working after the process wide
+        executor is replaced"""
+        network = build_network(50)
+        previous_executor = network._get_executor()
+        executor = set_default_executor(4)
+        self.addCleanup(set_default_executor)
+        self.assertIs(network._get_executor(), executor)
+
+        network._request = MagicMock(return_value=MockResponse(200, {"round": 1}))
+        data = network._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"round": 1})
+        previous_executor.submit(lambda: None).result()
+
+    def test_returns_without_waiting_for_stragglers(self):
+        """Test consensus returns once quorum is reached, not when the
+        slowest worker responds"""
+        network = build_network(50)
+        release = Event()
+        response = MockResponse(200, {"round": 1})
+
+        def request(url, **kwargs):
+            if url.startswith("http://worker03.com"):
+                release.wait(5)
+            return response
+
+        network._request = MagicMock(side_effect=request)
+
+        start = time()
+        data = network._consensus_from_workers("sharders", "v1/chain/get/stats")
+        duration = time() - start
+        release.set()
+
+        self.assertEqual(data, {"round": 1})
+        self.assertLess(duration, 1)
@@ -0,0 +1,121 @@
+import os
+import tempfile
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import build_client
+from tests.test_transaction import MockMiners, build_batch_client
+
+from zerochain.const import TransactionState
+from zerochain.journal import TransactionJournal
+from zerochain.transaction import Transaction
+
+
+class TestTransactionJournal(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "journal.db")
+        self.journal = TransactionJournal(self.path)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.journal.close()
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_record_keeps_data(self):
+        """Test updating a state keeps the transaction data recorded earlier"""
+        self.journal.record("a", "wallet", TransactionState.BUILT, {"hash": "a"})
+        self.journal.record("a", "wallet", TransactionState.SUBMITTED)
+        entry = self.journal.get("a")
+        self.assertEqual(entry["state"], TransactionState.SUBMITTED)
+        self.assertEqual(entry["data"], {"hash": "a"})
+
+    def test_unresolved(self):
+        self.journal.record("a", "wallet", TransactionState.BUILT)
+        self.journal.record("b", "wallet", TransactionState.SUBMITTED)
+        self.journal.record("c", "other", TransactionState.SUBMITTED)
+        self.journal.record("d", "wallet", TransactionState.CONFIRMED)
+        self.assertEqual(
+            [entry["hash"] for entry in self.journal.unresolved()], ["a", "b", "c"]
+        )
+        self.assertEqual(len(self.journal.unresolved("wallet")), 2)
+
+    def test_survives_reopen(self):
+        """Test entries are read back by a new process"""
+        self.journal.record("a", "wallet", TransactionState.SUBMITTED, {"hash": "a"})
+        reopened = TransactionJournal(self.path)
+        self.assertEqual(reopened.unresolved()[0]["data"], {"hash": "a"})
+        reopened.close()
+
+    def test_record_confirmation(self):
+        self.journal.record_confirmation("a", "wallet", {"transaction_status": 1})
+        self.journal.record_confirmation("b", "wallet", {"transaction_status": 2})
+        self.journal.record_confirmation("c", "wallet", None)
+        self.journal.record_confirmation("d", "wallet", "transaction not found")
+        self.assertEqual(self.journal.get("a")["state"], TransactionState.CONFIRMED)
+        self.assertEqual(self.journal.get("b")["state"], TransactionState.FAILED)
+        self.assertEqual(self.journal.get("c")["state"], TransactionState.EXPIRED)
+        self.assertEqual(self.journal.get("d")["state"], TransactionState.EXPIRED)
+
+    def test_resume(self):
+        """Test only unresolved transactions are tracked, outcomes are recorded"""
+        self.journal.record("a", "wallet", TransactionState.SUBMITTED)
+        self.journal.record("b", "wallet", TransactionState.CONFIRMED)
+        tracked = Future()
+        client = build_client()
+        client._get_confirmation_tracker = MagicMock()
+        client._get_confirmation_tracker().track = MagicMock(return_value=tracked)
+
+        futures = self.journal.resume(client)
+        self.assertEqual(list(futures), ["a"])
+        tracked.set_result({"transaction_status": 1})
+        self.assertEqual(self.journal.get("a")["state"], TransactionState.CONFIRMED)
+
+    def test_prune(self):
+        self.journal.record("a", "wallet", TransactionState.SUBMITTED)
+        self.journal.record("b", "wallet", TransactionState.CONFIRMED)
+        self.assertEqual(self.journal.prune(), 1)
+        self.assertIsNone(self.journal.get("b"))
+
+    def test_transaction_journaled(self):
+        """Test a transaction is recorded as it is built, submitted and confirmed"""
+        client = build_batch_client(MockMiners())
+        client.network.journal = self.journal
+        transaction = Transaction.from_args(client, {"input": "{}"})
+        transaction.execute()
+        entry = self.journal.get(transaction.hash)
+        self.assertEqual(entry["state"], TransactionState.SUBMITTED)
+        self.assertEqual(entry["data"]["signature"], "signature")
+
+        transaction.validate()
+        self.assertEqual(
+            self.journal.get(transaction.hash)["state"], TransactionState.CONFIRMED
+        )
+
+    def test_unconfirmed_transaction_journaled(self):
+        """Test a transaction the sharders answer with error text for is
+        journaled as expired"""
+        client = build_batch_client(MockMiners())
+        client.network.journal = self.journal
+        transaction = Transaction.from_args(client, {"input": "{}"})
+        transaction.timeout = 0.05
+        transaction.execute()
+        client._consensus_from_workers = MagicMock(return_value="transaction not found")
+
+        self.assertEqual(transaction.validate(), transaction.response_data)
+        self.assertIsNone(transaction.confirmation_data)
+        self.assertEqual(
+            self.journal.get(transaction.hash)["state"], TransactionState.EXPIRED
+        )
+
+    def test_rejected_transaction_journaled(self):
+        client = build_batch_client(MockMiners())
+        client.network.journal = self.journal
+        client._broadcast_to_workers = MagicMock(return_value="invalid signature")
+        transaction = Transaction.from_args(client, {"input": "{}"})
+        transaction.execute()
+        self.assertEqual(
+            self.journal.get(transaction.hash)["state"], TransactionState.FAILED
+        )
@@ -1,7 +1,15 @@
 import os
+import json
+import tempfile
+from time import monotonic, sleep
+from threading import Barrier, Lock
+from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+
 from zerochain.utils import from_json
 from zerochain.client import Client
 from tests.base_test import BaseTest
+from tests.mock_response import MockResponse
 from tests.utils import build_client, create_mock_response, TEST_DIR
 
 from zerochain.actions import network
@@ -118,3 +126,122 @@ class TestNetwork(BaseTest):
         keys = from_json(os.path.join(TEST_DIR, f"__mocks__/network/gen_keys.json"))
         data = network.register_wallet(keys, self.client.network)
         self.assertIn("id", data)
+
+    def _setup_provisioning(self):
+        keys = from_json(os.path.join(TEST_DIR, f"__mocks__/network/gen_keys.json"))
+        self.signer = MagicMock()
+        self.signer.generate_keys = MagicMock(return_value=keys)
+        mock_response = create_mock_response(path="network/create_wallet.json")
+        self.client.network._consensus_from_workers = mock_response
+
+    def test_provision_wallets(self):
+        """Test wallets are generated and registered in bulk"""
+        self._setup_provisioning()
+        clients = list(
+            network.provision_wallets(
+                self.client.network, 10, max_in_flight=3, signer=self.signer
+            )
+        )
+        self.assertEqual(len(clients), 10)
+        self.assertIsInstance(clients[0], Client)
+        self.assertEqual(self.signer.generate_keys.call_count, 10)
+
+    def test_provision_wallets_to_disk(self):
+        """Test wallets are streamed to a JSON lines file"""
+        self._setup_provisioning()
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, "wallets.jsonl")
+            wallets = list(
+                network.provision_wallets(
+                    self.client.network,
+                    5,
+                    output_path,
+                    signer=self.signer,
+                    return_instance=False,
+                )
+            )
+            with open(output_path) as f:
+                saved_wallets = [json.loads(line) for line in f]
+
+        self.assertEqual(saved_wallets, wallets)
+        self.assertIn("private_key", saved_wallets[0]["keys"][0])
+
+    def test_provision_wallets_not_limited_by_network_executor(self):
+        """Test registrations in flight each reach every miner at once, even
+        when the network executor is narrow"""
+        self._setup_provisioning()
+        del self.client.network._consensus_from_workers
+        self.client.network.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.client.network.executor.shutdown)
+        wallet = from_json(
+            os.path.join(TEST_DIR, "__mocks__/network/create_wallet.json")
+        )
+
+        def request(url, **kwargs):
+            sleep(0.1)
+            return MockResponse(200, wallet)
+
+        self.client.network._request = MagicMock(side_effect=request)
+        start = monotonic()
+        wallets = list(
+            network.provision_wallets(
+                self.client.network, 16, max_in_flight=16, signer=self.signer
+            )
+        )
+        self.assertEqual(len(wallets), 16)
+        # 48 requests through the 2 network threads would take 2.4s
+        self.assertLess(monotonic() - start, 1)
+
+    @patch("zerochain.actions.network.PersistentSigner")
+    def test_provision_wallets_signer_closed_last(self, signer_class):
+        """Test an own signer is closed only once every wallet in progress
+        is done with it"""
+        self._setup_provisioning()
+        keys = self.signer.generate_keys.return_value
+        events = []
+        lock = Lock()
+        started = Barrier(2)
+
+        def generate_keys(mnemonic):
+            started.wait()
+            with lock:
+                failed = not events
+                if failed:
+                    events.append("failed")
+            if failed:
+                return None
+            sleep(0.1)
+            events.append("generated")
+            return keys
+
+        signer_class.return_value.generate_keys = MagicMock(side_effect=generate_keys)
+        signer_class.return_value.close = MagicMock(
+            side_effect=lambda: events.append("closed")
+        )
+        self.client.network.signer = None
+        with self.assertRaises(ConnectionError):
+            list(
+                network.provision_wallets(
+                    self.client.network, 2, max_in_flight=2, raise_exception=True
+                )
+            )
+        self.assertEqual(events[-1], "closed")
+        self.assertIn("generated", events)
+
+    def test_provision_wallets_skips_failures(self):
+        self._setup_provisioning()
+        self.client.network._consensus_from_workers = MagicMock(
+            side_effect=[ConnectionError("failed")]
+            + [
+                from_json(
+                    os.path.join(TEST_DIR, "__mocks__/network/create_wallet.json")
+                )
+            ]
+            * 2
+        )
+        wallets = list(
+            network.provision_wallets(
+                self.client.network, 3, max_in_flight=1, signer=self.signer
+            )
+        )
+        self.assertEqual(len(wallets), 2)
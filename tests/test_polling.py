@@ -0,0 +1,96 @@
+import os
+from time import monotonic, time
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import TEST_DIR, build_client
+
+from zerochain.utils import from_json
+from zerochain.deadline import Deadline
+from zerochain.polling import ConfirmationPoller
+from zerochain.transaction import Transaction
+from zerochain.const import DEFAULT_BLOCK_TIME
+
+
+def first_delays(poller, num_delays):
+    delays = []
+    for delay in poller:
+        delays.append(delay)
+        if len(delays) == num_delays:
+            break
+    return delays
+
+
+class TestConfirmationPoller(TestCase):
+    def test_first_delay_one_block(self):
+        delays = first_delays(ConfirmationPoller(block_time=0.4), 1)
+        self.assertAlmostEqual(delays[0], 0.4, places=2)
+
+    def test_elapsed_time_counts_towards_first_delay(self):
+        poller = ConfirmationPoller(block_time=0.4, started_at=monotonic() - 0.3)
+        self.assertLess(first_delays(poller, 1)[0], 0.11)
+
+    def test_backoff_with_jitter(self):
+        """Test delays grow from half a block and stay within jitter bounds"""
+        poller = ConfirmationPoller(block_time=1, multiplier=2, max_delay=4)
+        delays = first_delays(poller, 6)[1:]
+        backoffs = [0.5, 1, 2, 4, 4]
+        for delay, backoff in zip(delays, backoffs):
+            self.assertGreaterEqual(delay, backoff / 2)
+            self.assertLessEqual(delay, backoff)
+
+    def test_stops_after_timeout(self):
+        poller = ConfirmationPoller(block_time=1, timeout=0)
+        self.assertEqual(len(list(poller)), 1)
+
+    def test_delay_capped_by_timeout(self):
+        poller = ConfirmationPoller(block_time=10, timeout=0.5)
+        self.assertLessEqual(first_delays(poller, 1)[0], 0.5)
+
+    def test_delay_capped_by_deadline(self):
+        poller = ConfirmationPoller(block_time=10, deadline=Deadline(0.5))
+        self.assertLessEqual(first_delays(poller, 1)[0], 0.5)
+
+
+class TestTransactionPolling(TestCase):
+    def setUp(self) -> None:
+        self.client = build_client()
+        self.transaction = Transaction(
+            sc_address="",
+            transaction_name="",
+            transaction_type=0,
+            input={},
+            value=0,
+            client=self.client,
+            raise_exception=True,
+        )
+        return super().setUp()
+
+    def test_returns_on_confirmation(self):
+        """Test confirmation is returned as soon as it arrives"""
+        self.client.network.block_time = 0.05
+        self.client.network.block_time_observed_at = monotonic()
+        self.client.check_transaction_status = MagicMock(
+            side_effect=[{"transaction_status": 0}] * 2 + [{"transaction_status": 1}]
+        )
+
+        start = time()
+        data = self.transaction.validate("hash")
+        self.assertEqual(data, {"transaction_status": 1})
+        self.assertEqual(self.client.check_transaction_status.call_count, 3)
+        self.assertLess(time() - start, 0.5)
+
+    def test_block_time_observed_once(self):
+        """Test chain stats are requested once and cached on the network"""
+        chain_stats = from_json(
+            os.path.join(TEST_DIR, "__mocks__/network/chain_stats.json")
+        )
+        self.client.get_chain_stats = MagicMock(return_value=chain_stats)
+
+        self.assertAlmostEqual(self.transaction._get_block_time(), 0.414, places=3)
+        self.transaction._get_block_time()
+        self.assertEqual(self.client.get_chain_stats.call_count, 1)
+
+    def test_default_block_time_without_stats(self):
+        self.client.get_chain_stats = MagicMock(side_effect=ConnectionError)
+        self.assertEqual(self.transaction._get_block_time(), DEFAULT_BLOCK_TIME)
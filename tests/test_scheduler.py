@@ -0,0 +1,242 @@
+import queue
+from time import monotonic, sleep
+from threading import Event
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import build_network
+
+from zerochain.scheduler import TokenBucket, TransactionScheduler
+
+
+class MockTransaction:
+    """Transaction stand-in recording submission order, resolves its future
+    as soon as it is submitted"""
+
+    def __init__(self, client, name, log, release=None) -> None:
+        self.client = client
+        self.name = name
+        self.log = log
+        self.release = release
+
+    def _submit_and_track(self, future):
+        if self.release:
+            self.release.wait(5)
+        self.log.append((self.client.id, self.name))
+        future.set_result(self.name)
+
+
+def build_wallet(wallet_id, network=None):
+    client = MagicMock()
+    client.id = wallet_id
+    client._get_workers = MagicMock(return_value=(network or build_network(50)).miners)
+    return client
+
+
+class TestTokenBucket(TestCase):
+    def test_rate_limited(self):
+        """Test tokens beyond the burst are handed out at the rate"""
+        bucket = TokenBucket(rate=50, burst=1)
+        start = monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(monotonic() - start, 0.09)
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, burst=5)
+        start = monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(monotonic() - start, 0.5)
+
+
+class TestTransactionScheduler(TestCase):
+    def test_wallet_order(self):
+        """Test each wallet submits in queued order"""
+        log = []
+        wallets = [build_wallet(f"wallet {num}") for num in range(3)]
+        with TransactionScheduler(max_in_flight=8) as scheduler:
+            futures = [
+                scheduler.submit(MockTransaction(wallet, num, log))
+                for num in range(10)
+                for wallet in wallets
+            ]
+            for future in futures:
+                future.result(5)
+
+        for wallet in wallets:
+            names = [name for wallet_id, name in log if wallet_id == wallet.id]
+            self.assertEqual(names, list(range(10)))
+
+    def test_one_submission_per_wallet(self):
+        """Test a wallet's next transaction waits on its previous one"""
+        release = Event()
+        log = []
+        wallet = build_wallet("wallet")
+        scheduler = TransactionScheduler()
+        first = scheduler.submit(MockTransaction(wallet, 1, log, release))
+        second = scheduler.submit(MockTransaction(wallet, 2, log))
+        sleep(0.05)
+        self.assertEqual(scheduler.in_flight, 1)
+        self.assertFalse(second.done())
+        release.set()
+        self.assertEqual(second.result(5), 2)
+        self.assertEqual(first.result(5), 1)
+        scheduler.close()
+
+    def test_backpressure(self):
+        """Test a full queue blocks, or raises when not blocking"""
+        release = Event()
+        scheduler = TransactionScheduler(max_in_flight=1, max_queue_size=2)
+        wallet = build_wallet("wallet")
+        for num in range(3):
+            scheduler.submit(MockTransaction(wallet, num, [], release))
+        sleep(0.05)
+
+        with self.assertRaises(queue.Full):
+            scheduler.submit(MockTransaction(wallet, 3, []), block=False)
+        with self.assertRaises(queue.Full):
+            scheduler.submit(MockTransaction(wallet, 3, []), timeout=0.05)
+        self.assertEqual(scheduler.json()["queue_depth"], 2)
+        release.set()
+        scheduler.close()
+
+    def test_rate_limit(self):
+        wallets = [build_wallet(f"wallet {num}") for num in range(5)]
+        start = monotonic()
+        with TransactionScheduler(rate=50, burst=1) as scheduler:
+            futures = [
+                scheduler.submit(MockTransaction(wallet, 0, [])) for wallet in wallets
+            ]
+            for future in futures:
+                future.result(5)
+        self.assertGreaterEqual(monotonic() - start, 0.07)
+
+    def test_miner_cap(self):
+        """Test submission waits while a miner is at its cap"""
+        network = build_network(50)
+        stats = network.miners[0].stats
+        stats.start_request()
+        stats.start_request()
+        wallet = build_wallet("wallet", network)
+        scheduler = TransactionScheduler(max_per_miner=2)
+        future = scheduler.submit(MockTransaction(wallet, 0, []))
+        sleep(0.05)
+        self.assertFalse(future.done())
+        stats.cancel_request()
+        self.assertEqual(future.result(5), 0)
+        scheduler.close()
+
+    def test_miner_cap_held(self):
+        """Test a miner at its cap holds submission until it has capacity"""
+        network = build_network(50)
+        stats = network.miners[0].stats
+        stats.start_request()
+        wallet = build_wallet("wallet", network)
+        scheduler = TransactionScheduler(max_per_miner=1)
+        future = scheduler.submit(MockTransaction(wallet, 0, []))
+        sleep(1.5)
+        self.assertFalse(future.done())
+        stats.cancel_request()
+        self.assertEqual(future.result(5), 0)
+        scheduler.close()
+
+    def test_miner_cap_skips_open_breaker(self):
+        """Test a miner with an open breaker is not waited on"""
+        network = build_network(50)
+        network.miners[0].stats.start_request()
+        for _ in range(network.miners[0].breaker.failure_threshold):
+            network.miners[0].breaker.record(False)
+        wallet = build_wallet("wallet", network)
+        with TransactionScheduler(max_per_miner=1) as scheduler:
+            future = scheduler.submit(MockTransaction(wallet, 0, []))
+            self.assertEqual(future.result(5), 0)
+
+    def test_miner_cap_saturated(self):
+        """Test no miner serves more than its cap with submissions and other
+        requests sharing it"""
+        network = build_network(50)
+        wallets = [build_wallet(f"wallet {num}", network) for num in range(20)]
+        peak = []
+
+        class BroadcastingTransaction(MockTransaction):
+            def _submit_and_track(self, future):
+                for miner in network.miners:
+                    miner.stats.start_request()
+                peak.append(max(miner.stats.in_flight for miner in network.miners))
+                sleep(0.01)
+                for miner in network.miners:
+                    miner.stats.cancel_request()
+                future.set_result(self.name)
+
+        # Other requests hold most of the cap of the first miner
+        for _ in range(2):
+            network.miners[0].stats.start_request()
+        with TransactionScheduler(max_in_flight=16, max_per_miner=4) as scheduler:
+            futures = [
+                scheduler.submit(BroadcastingTransaction(wallet, num, []))
+                for num in range(3)
+                for wallet in wallets
+            ]
+            for future in futures:
+                future.result(5)
+
+        self.assertEqual(len(peak), 60)
+        self.assertLessEqual(max(peak), 4)
+        self.assertEqual(network.miners[0].stats.reserved, 0)
+
+    def test_dispatch_error(self):
+        """Test an error preparing a submission fails its transaction and
+        leaves the scheduler running"""
+        wallet = build_wallet("wallet")
+        wallet._get_workers = MagicMock(side_effect=[ValueError("no miners"), []])
+        with TransactionScheduler() as scheduler:
+            future = scheduler.submit(MockTransaction(wallet, 0, []))
+            with self.assertRaises(ValueError):
+                future.result(5)
+            self.assertEqual(
+                scheduler.submit(MockTransaction(wallet, 1, [])).result(5), 1
+            )
+        self.assertEqual(scheduler.num_failed, 1)
+        self.assertEqual(scheduler.in_flight, 0)
+
+    def test_failed_submission(self):
+        wallet = build_wallet("wallet")
+        transaction = MockTransaction(wallet, 0, [])
+        transaction._submit_and_track = MagicMock(side_effect=ValueError("rejected"))
+        with TransactionScheduler() as scheduler:
+            future = scheduler.submit(transaction)
+            with self.assertRaises(ValueError):
+                future.result(5)
+            # The wallet is released for its next transaction
+            self.assertEqual(
+                scheduler.submit(MockTransaction(wallet, 1, [])).result(5), 1
+            )
+        self.assertEqual(scheduler.num_failed, 1)
+
+    def test_metrics(self):
+        wallet = build_wallet("wallet")
+        with TransactionScheduler() as scheduler:
+            scheduler.submit(MockTransaction(wallet, 0, [])).result(5)
+        metrics = scheduler.json()
+        self.assertEqual(metrics["num_submitted"], 1)
+        self.assertEqual(metrics["max_queue_depth"], 1)
+        self.assertIsNotNone(metrics["ewma_queue_latency"])
+        self.assertIsNotNone(metrics["ewma_submit_latency"])
+
+    def test_closed(self):
+        scheduler = TransactionScheduler()
+        scheduler.close()
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(MockTransaction(build_wallet("wallet"), 0, []))
+
+
+class TestAsyncScheduler(IsolatedAsyncioTestCase):
+    async def test_submit_async(self):
+        scheduler = TransactionScheduler()
+        future = await scheduler.submit_async(
+            MockTransaction(build_wallet("wallet"), 0, [])
+        )
+        self.assertEqual(await future, 0)
+        scheduler.close()
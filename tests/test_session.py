@@ -0,0 +1,73 @@
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from tests.utils import build_network
+from tests.mock_response import MockResponse
+
+from zerochain.session import SessionPool
+
+
+class TestSessionPool(TestCase):
+    def setUp(self) -> None:
+        self.session_pool = SessionPool(pool_maxsize=4)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.session_pool.close()
+        return super().tearDown()
+
+    def test_same_host_shares_session(self):
+        """Test workers on the same host reuse one session"""
+        first = self.session_pool.get_session("https://worker.com/sharder01/v1")
+        second = self.session_pool.get_session("https://worker.com/sharder02/v1")
+        self.assertIs(first, second)
+
+    def test_different_hosts_get_own_session(self):
+        """Test each worker host gets its own session"""
+        first = self.session_pool.get_session("https://worker01.com/v1")
+        second = self.session_pool.get_session("https://worker02.com/v1")
+        self.assertIsNot(first, second)
+
+    def test_pool_size_configured(self):
+        """Test adapter connection pool uses configured size"""
+        session = self.session_pool.get_session("https://worker.com")
+        adapter = session.get_adapter("https://worker.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_keep_alive_disabled(self):
+        """Test sessions close connections when keep alive is disabled"""
+        session_pool = SessionPool(keep_alive=False)
+        session = session_pool.get_session("https://worker.com")
+        self.assertEqual(session.headers["Connection"], "close")
+
+    def test_concurrent_get_session(self):
+        """Test concurrent threads all receive the same session"""
+        sessions = []
+
+        def get_session():
+            sessions.append(self.session_pool.get_session("https://worker.com"))
+
+        threads = [Thread(target=get_session) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(id(session) for session in sessions)), 1)
+
+    def test_from_object(self):
+        """Test session pool is built from network config"""
+        session_pool = SessionPool.from_object({"pool_maxsize": 20, "max_retries": 2})
+        self.assertEqual(session_pool.pool_maxsize, 20)
+        self.assertEqual(session_pool.max_retries, 2)
+        self.assertTrue(session_pool.keep_alive)
+
+
+class TestNetworkRequest(TestCase):
+    def test_request_uses_network_sessions(self):
+        """Test network requests go through the shared session pool"""
+        network = build_network(50)
+        network.session_pool.request = MagicMock(return_value=MockResponse(200, {}))
+        network._request("http://worker01.com/v1/chain/get/stats")
+        network.session_pool.request.assert_called_once()
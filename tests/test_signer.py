@@ -0,0 +1,122 @@
+import os
+import sys
+from hashlib import sha256
+from unittest.mock import MagicMock, patch
+from unittest.case import TestCase, skipUnless
+
+from tests.utils import TEST_DIR, build_client
+
+from zerochain.const import SignerBackend
+from zerochain.signer import (
+    NativeSigner,
+    NodeSigner,
+    PersistentSigner,
+    Signer,
+    build_signer,
+    get_default_signer,
+)
+
+STAND_IN_COMMAND = [sys.executable, os.path.join(TEST_DIR, "sign_server_stand_in.py")]
+BLS_LIBRARY = os.environ.get("ZEROCHAIN_BLS_LIBRARY")
+
+HASH = sha256(b"payload").hexdigest()
+
+
+def expected_signature(private_key, hash_payload):
+    return sha256(f"{private_key}{hash_payload}".encode()).hexdigest()
+
+
+class TestPersistentSigner(TestCase):
+    def setUp(self) -> None:
+        self.signer = PersistentSigner(2, STAND_IN_COMMAND)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.signer.close()
+        return super().tearDown()
+
+    def test_sign(self):
+        self.assertEqual(self.signer.sign("key", HASH), expected_signature("key", HASH))
+
+    def test_verify(self):
+        signature = self.signer.sign("key", HASH)
+        self.assertTrue(self.signer.verify("key", signature, HASH))
+        self.assertFalse(self.signer.verify("other_key", signature, HASH))
+
+    def test_generate_keys(self):
+        keys = self.signer.generate_keys("mnemonic")
+        self.assertEqual(keys["mnemonic"], "mnemonic")
+
+    def test_sign_many(self):
+        hashes = [f"{num:064x}" for num in range(20)]
+        signatures = list(self.signer.sign_many("key", hashes))
+        self.assertEqual(
+            signatures, [expected_signature("key", hash) for hash in hashes]
+        )
+
+    def test_failed_signature_is_false(self):
+        self.signer.worker = MagicMock()
+        self.signer.worker.sign = MagicMock(return_value="short")
+        self.assertFalse(self.signer.sign("key", HASH))
+
+
+class TestSignerSelection(TestCase):
+    def setUp(self) -> None:
+        self.client = build_client()
+        return super().setUp()
+
+    def test_default_signer(self):
+        self.assertIs(self.client._get_signer(), get_default_signer())
+
+    def test_network_signer(self):
+        """Test clients sign with the signer of their network"""
+        self.client.network.signer = MagicMock()
+        self.client.network.signer.sign = MagicMock(return_value="signature")
+        self.assertEqual(self.client.sign(HASH), "signature")
+        self.client.network.signer.sign.assert_called_with(
+            self.client.private_key, HASH
+        )
+
+    def test_client_signer(self):
+        """Test a client signer takes precedence over the network signer"""
+        self.client.network.signer = MagicMock()
+        self.client.signer = MagicMock()
+        self.client.signer.verify = MagicMock(return_value=True)
+        self.assertTrue(self.client.verify("signature", HASH))
+        self.client.network.signer.verify.assert_not_called()
+
+    def test_build_signer(self):
+        self.assertIsInstance(build_signer(SignerBackend.NODE), NodeSigner)
+        self.assertIsInstance(build_signer(SignerBackend.PERSISTENT), PersistentSigner)
+        with self.assertRaises(ValueError):
+            build_signer("unknown")
+
+    def test_signer_from_config(self):
+        self.assertIsNone(Signer.from_object({}))
+        signer = Signer.from_object({"signer": SignerBackend.NODE})
+        self.assertIsInstance(signer, NodeSigner)
+
+
+class TestNativeSigner(TestCase):
+    def test_missing_library(self):
+        with patch.dict(os.environ, {"ZEROCHAIN_BLS_LIBRARY": ""}), patch(
+            "ctypes.util.find_library", return_value=None
+        ):
+            with self.assertRaises(ImportError):
+                NativeSigner()
+
+    @skipUnless(BLS_LIBRARY, "ZEROCHAIN_BLS_LIBRARY not set")
+    def test_sign_and_verify(self):
+        signer = NativeSigner()
+        keys = signer.generate_keys("mnemonic")
+        signature = signer.sign(keys["private_key"], HASH)
+        self.assertEqual(len(signature), 64)
+        self.assertTrue(signer.verify(keys["public_key"], signature, HASH))
+        self.assertFalse(signer.verify(keys["public_key"], signature, "00" * 32))
+
+    @skipUnless(BLS_LIBRARY, "ZEROCHAIN_BLS_LIBRARY not set")
+    def test_generate_keys_deterministic(self):
+        signer = NativeSigner()
+        self.assertEqual(
+            signer.generate_keys("mnemonic"), signer.generate_keys("mnemonic")
+        )
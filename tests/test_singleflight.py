@@ -0,0 +1,247 @@
+import asyncio
+from time import sleep
+from threading import Event, Thread
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+
+from tests.utils import build_network
+from tests.mock_response import MockResponse
+
+from zerochain.const import Endpoints
+from zerochain.deadline import Deadline
+from zerochain.singleflight import SingleFlight
+from zerochain.exceptions import DeadlineExceededError
+
+
+def wait_until(condition, timeout=1):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        sleep(0.01)
+    raise AssertionError("Condition not met in time")
+
+
+class TestSingleFlight(TestCase):
+    def setUp(self) -> None:
+        self.single_flight = SingleFlight()
+        self.started = Event()
+        self.release = Event()
+        return super().setUp()
+
+    def _slow_call(self, result):
+        def call():
+            self.started.set()
+            self.release.wait(5)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return MagicMock(side_effect=call)
+
+    def _join_callers(self, fn, num_callers, deadline=None):
+        results = []
+
+        def caller():
+            try:
+                results.append(self.single_flight.do("key", fn, deadline))
+            except Exception as e:
+                results.append(e)
+
+        threads = [Thread(target=caller) for _ in range(num_callers)]
+        threads[0].start()
+        self.started.wait(1)
+        for thread in threads[1:]:
+            thread.start()
+        wait_until(lambda: self.single_flight.num_shared == num_callers - 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(1)
+        return results
+
+    def test_concurrent_calls_share_result(self):
+        fn = self._slow_call({"a": 1})
+        results = self._join_callers(fn, 5)
+        self.assertEqual(results, [{"a": 1}] * 5)
+        self.assertEqual(fn.call_count, 1)
+
+    def test_exception_shared(self):
+        fn = self._slow_call(ValueError("failed"))
+        results = self._join_callers(fn, 3)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(fn.call_count, 1)
+
+    def test_sequential_calls_not_shared(self):
+        fn = MagicMock(return_value=1)
+        self.single_flight.do("key", fn)
+        self.single_flight.do("key", fn)
+        self.assertEqual(fn.call_count, 2)
+
+    def test_joining_caller_deadline(self):
+        fn = self._slow_call(1)
+        leader = Thread(target=self.single_flight.do, args=("key", fn))
+        leader.start()
+        self.started.wait(1)
+        with self.assertRaises(DeadlineExceededError):
+            self.single_flight.do("key", fn, Deadline(0.05))
+        self.release.set()
+        leader.join(1)
+
+    def test_leader_deadline_not_shared(self):
+        """Test a caller without a deadline makes its own call when the
+        leader runs out of its deadline"""
+        fn = self._slow_call(DeadlineExceededError("leader deadline"))
+        own_fn = MagicMock(return_value=1)
+        results = []
+        leader = Thread(target=self._call, args=(fn, results))
+        leader.start()
+        self.started.wait(1)
+        follower = Thread(target=self._call, args=(own_fn, results))
+        follower.start()
+        wait_until(lambda: self.single_flight.num_shared == 1)
+        self.release.set()
+        leader.join(1)
+        follower.join(1)
+
+        self.assertIsInstance(results[0], DeadlineExceededError)
+        self.assertEqual(results[1], 1)
+        own_fn.assert_called_once()
+
+    def _call(self, fn, results):
+        try:
+            results.append(self.single_flight.do("key", fn))
+        except Exception as e:
+            results.append(e)
+
+
+class TestAsyncSingleFlight(IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_result(self):
+        single_flight = SingleFlight()
+        fn = MagicMock()
+
+        async def call():
+            fn()
+            await asyncio.sleep(0.05)
+            return {"a": 1}
+
+        results = await asyncio.gather(
+            *[single_flight.do_async("key", call) for _ in range(5)]
+        )
+        self.assertEqual(results, [{"a": 1}] * 5)
+        self.assertEqual(fn.call_count, 1)
+
+    async def test_leader_cancelled(self):
+        """Test cancelling the leader leaves the call running for joined
+        callers"""
+        single_flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return {"a": 1}
+
+        leader = asyncio.create_task(single_flight.do_async("key", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do_async("key", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        self.assertEqual(await follower, {"a": 1})
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(single_flight.num_calls, 1)
+
+    async def test_cancelled_without_callers(self):
+        """Test the call is cancelled once every caller has left"""
+        single_flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def call():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        leader = asyncio.create_task(single_flight.do_async("key", call))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        self.assertEqual(single_flight.json()["in_flight"], 0)
+
+    async def test_leader_deadline_not_shared(self):
+        single_flight = SingleFlight()
+
+        async def leader_call():
+            await asyncio.sleep(0.05)
+            raise DeadlineExceededError("leader deadline")
+
+        async def own_call():
+            return 1
+
+        leader = asyncio.create_task(single_flight.do_async("key", leader_call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight.do_async("key", own_call))
+
+        self.assertEqual(await follower, 1)
+        with self.assertRaises(DeadlineExceededError):
+            await leader
+
+
+class TestConsensusSingleFlight(TestCase):
+    def setUp(self) -> None:
+        self.network = build_network(50)
+        self.release = Event()
+
+        def request(url, **kwargs):
+            self.release.wait(5)
+            return MockResponse(200, {"balance": 1})
+
+        self.network._request = MagicMock(side_effect=request)
+        return super().setUp()
+
+    def _concurrent_reads(self, method="GET"):
+        threads = [
+            Thread(
+                target=self.network._consensus_from_workers,
+                args=("sharders", Endpoints.GET_BALANCE, method),
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def test_identical_reads_share_round(self):
+        """Test concurrent identical reads make a single fan-out"""
+        threads = self._concurrent_reads()
+        wait_until(lambda: self.network.single_flight.num_shared == 3)
+        self.release.set()
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(self.network._request.call_count, 3)
+
+    def test_consensus_arguments_not_coalesced(self):
+        """Test reads asking for different quorums each make a round"""
+        threads = [
+            Thread(
+                target=self.network._consensus_from_workers,
+                args=("sharders", Endpoints.GET_BALANCE),
+                kwargs={"min_confirmation": min_confirmation},
+            )
+            for min_confirmation in (10, 90)
+        ]
+        for thread in threads:
+            thread.start()
+        wait_until(lambda: self.network._request.call_count == 6)
+        self.release.set()
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(self.network.single_flight.num_shared, 0)
+
+    def test_writes_not_coalesced(self):
+        threads = self._concurrent_reads("POST")
+        wait_until(lambda: self.network._request.call_count > 3)
+        self.release.set()
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(self.network.single_flight.num_calls, 0)
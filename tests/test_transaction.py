@@ -0,0 +1,234 @@
+import json
+from time import monotonic, sleep
+from threading import Event, Lock
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+from unittest.case import TestCase
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from tests.utils import build_client
+from tests.mock_response import MockResponse
+
+from zerochain.client import Client
+from zerochain.async_client import AsyncClient
+from zerochain.confirmation import ConfirmationTracker
+from zerochain.transaction import Transaction, TransactionFuture
+from zerochain.exceptions import TransactionError
+
+
+class MockMiners:
+    """Consensus stand-in accepting every transaction and confirming it,
+    tracks how many submissions run at once"""
+
+    def __init__(self, submit_delay=0) -> None:
+        self.submit_delay = submit_delay
+        self.confirm = Event()
+        self.confirm.set()
+        self.status = 1
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = Lock()
+
+    def broadcast(self, worker, endpoint, data=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        sleep(self.submit_delay)
+        with self._lock:
+            self.in_flight -= 1
+        return {"entity": {"hash": json.loads(data)["hash"]}}
+
+    def __call__(self, worker, endpoint, **kwargs):
+        self.confirm.wait(5)
+        return {"transaction_status": self.status}
+
+
+def build_batch_client(miners):
+    client = build_client()
+    client.signer = MagicMock()
+    client.signer.sign = MagicMock(return_value="signature")
+    client.network.block_time = 0.01
+    client.network.block_time_observed_at = monotonic()
+    client._consensus_from_workers = MagicMock(side_effect=miners)
+    client._broadcast_to_workers = MagicMock(side_effect=miners.broadcast)
+    return client
+
+
+def transfers(num_transactions):
+    return [
+        {"input": f"transfer {num}", "sc_address": "to_client_id", "value": 1}
+        for num in range(num_transactions)
+    ]
+
+
+class TestSubmitMany(TestCase):
+    def test_returns_future_per_transaction(self):
+        miners = MockMiners()
+        client = build_batch_client(miners)
+        futures = client.submit_many(transfers(5))
+
+        self.assertEqual(len(futures), 5)
+        self.assertIsInstance(futures[0], TransactionFuture)
+        for future in futures:
+            self.assertEqual(future.result(5), {"transaction_status": 1})
+        self.assertEqual(len({future.hash for future in futures}), 5)
+
+    def test_returns_before_confirmation(self):
+        """Test handles are returned without waiting on confirmation"""
+        miners = MockMiners()
+        miners.confirm.clear()
+        client = build_batch_client(miners)
+
+        futures = client.submit_many(transfers(3))
+        self.assertFalse(any(future.done() for future in futures))
+        miners.confirm.set()
+        self.assertTrue(all(future.result(5) for future in futures))
+
+    def test_submissions_bounded(self):
+        """Test no more than max_in_flight submissions run at once"""
+        miners = MockMiners(submit_delay=0.02)
+        client = build_batch_client(miners)
+        futures = client.submit_many(transfers(12), max_in_flight=3)
+        for future in futures:
+            future.result(5)
+        self.assertLessEqual(miners.max_in_flight, 3)
+        self.assertGreater(miners.max_in_flight, 1)
+
+    def test_failed_submission(self):
+        client = build_batch_client(MockMiners())
+        client._broadcast_to_workers = MagicMock(return_value="error")
+        future = client.submit_many(transfers(1))[0]
+        with self.assertRaises(TransactionError):
+            future.result(5)
+
+    def test_transaction_from_args_defaults(self):
+        transaction = Transaction.from_args(build_client(), {"input": "{}"})
+        self.assertEqual(transaction.value, 0)
+        self.assertIsNone(transaction.name)
+
+
+class TestSubmitManyFanOut(TestCase):
+    def test_not_limited_by_network_executor(self):
+        """Test submissions in flight each reach every miner at once, even
+        when the network executor is narrow"""
+        client = build_client()
+        client.signer = MagicMock()
+        client.signer.sign = MagicMock(return_value="signature")
+        client.network.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(client.network.executor.shutdown)
+
+        def request(url, data=None, **kwargs):
+            sleep(0.1)
+            return MockResponse(200, {"entity": {"hash": json.loads(data)["hash"]}})
+
+        def track(hash, *args):
+            tracked = Future()
+            tracked.set_result({"transaction_status": 1})
+            return tracked
+
+        client._request = MagicMock(side_effect=request)
+        client.network.confirmation_tracker = MagicMock()
+        client.network.confirmation_tracker.track = MagicMock(side_effect=track)
+
+        start = monotonic()
+        futures = client.submit_many(transfers(16), max_in_flight=16)
+        for future in futures:
+            self.assertEqual(future.result(5), {"transaction_status": 1})
+        # 48 requests through the 2 network threads would take 2.4s
+        self.assertLess(monotonic() - start, 1)
+
+
+class TestSubmit(TestCase):
+    def test_returns_once_accepted(self):
+        """Test the handle is returned before the transaction is confirmed"""
+        miners = MockMiners()
+        miners.confirm.clear()
+        client = build_batch_client(miners)
+
+        future = client.submit_transaction("{}")
+        self.assertIsInstance(future, TransactionFuture)
+        self.assertFalse(future.done())
+        miners.confirm.set()
+        self.assertEqual(future.result(5), {"transaction_status": 1})
+        self.assertTrue(future.done())
+
+    def test_done_callback(self):
+        client = build_batch_client(MockMiners())
+        resolved = Event()
+        future = client.submit_transaction("{}")
+        future.add_done_callback(lambda future: resolved.set())
+        self.assertTrue(resolved.wait(5))
+        self.assertEqual(future.transaction.status, 1)
+
+    def test_not_accepted(self):
+        """Test a rejected submission raises rather than returning a handle"""
+        client = build_batch_client(MockMiners())
+        client._broadcast_to_workers = MagicMock(return_value="error")
+        with self.assertRaises(TransactionError):
+            client.submit_transaction("{}")
+
+    def test_unconfirmed(self):
+        miners = MockMiners()
+        miners.status = 0
+        client = build_batch_client(miners)
+        transaction = Transaction.from_args(
+            client, {"input": "{}"}, raise_exception=True
+        )
+        transaction.timeout = 0.05
+        with self.assertRaises(TransactionError):
+            transaction.submit().result(5)
+
+
+class TestAwaitSubmit(IsolatedAsyncioTestCase):
+    async def test_await_future(self):
+        client = build_batch_client(MockMiners())
+        future = client.submit_transaction("{}")
+        self.assertEqual(await future, {"transaction_status": 1})
+
+
+def build_async_batch_client(miners):
+    """Async client submitting through the mock miners, confirmations are
+    tracked by the network tracker reading through a mocked blocking client"""
+    sync_client = build_batch_client(miners)
+    client = AsyncClient(
+        "client_id", "", "public_key", "private_key", "", "", sync_client.network
+    )
+    client.signer = sync_client.signer
+
+    async def consensus(*args, **kwargs):
+        return miners(*args, **kwargs)
+
+    async def broadcast(*args, **kwargs):
+        return miners.broadcast(*args, **kwargs)
+
+    client._consensus_from_workers = consensus
+    client._broadcast_to_workers = broadcast
+    client.network.confirmation_tracker = ConfirmationTracker(sync_client)
+    return client
+
+
+class TestAsyncSubmitMany(IsolatedAsyncioTestCase):
+    async def test_submit_many(self):
+        client = build_async_batch_client(MockMiners())
+        tasks = await client.submit_many(transfers(4), max_in_flight=2)
+        for task in tasks:
+            self.assertEqual(await task, {"transaction_status": 1})
+        tracker = client.network.confirmation_tracker
+        self.assertEqual(tracker.num_confirmed_by_query, 4)
+
+    async def test_submit_tracked(self):
+        """Test an async submission is confirmed by the network tracker"""
+        client = build_async_batch_client(MockMiners())
+        future = await client.submit_transaction("{}")
+        self.assertIsInstance(future, TransactionFuture)
+        self.assertEqual(await future, {"transaction_status": 1})
+        tracker = client.network.confirmation_tracker
+        self.assertEqual(tracker.num_confirmed_by_query, 1)
+
+    def test_tracker_reads_blocking(self):
+        """Test the tracker started by an async client reads through a
+        blocking client"""
+        client = AsyncClient("", "", "", "", "", "", build_client().network)
+        tracker = client._get_confirmation_tracker()
+        self.assertIsInstance(tracker.client, Client)
+        self.assertIs(tracker.client.network, client.network)
@@ -0,0 +1,201 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tests.utils import build_network
+from tests.mock_response import MockResponse
+
+from zerochain.const import BreakerState, QuorumPolicy
+from zerochain.exceptions import ConsensusError
+from zerochain.workers import CircuitBreaker, Sharder, WorkerStats
+
+
+class TestWorkerStats(TestCase):
+    def setUp(self) -> None:
+        self.stats = WorkerStats()
+        return super().setUp()
+
+    def test_records_latency(self):
+        """Test successful requests update latency and last success"""
+        start_time = self.stats.start_request()
+        self.assertEqual(self.stats.in_flight, 1)
+        self.stats.end_request(start_time - 0.1, True)
+        self.assertEqual(self.stats.in_flight, 0)
+        self.assertAlmostEqual(self.stats.ewma_latency, 0.1, places=2)
+        self.assertIsNotNone(self.stats.last_success)
+        self.assertGreater(self.stats.latency_estimate(), self.stats.ewma_latency)
+
+    def test_records_errors(self):
+        """Test failed requests raise error rate without touching latency"""
+        self.stats.end_request(self.stats.start_request(), False)
+        self.assertGreater(self.stats.error_rate, 0)
+        self.assertIsNone(self.stats.ewma_latency)
+        self.assertIsNone(self.stats.last_success)
+
+    def test_score_prefers_healthy_workers(self):
+        """Test erroring workers score worse than healthy ones"""
+        healthy = WorkerStats()
+        failing = WorkerStats()
+        for stats in (healthy, failing):
+            stats.end_request(stats.start_request() - 0.1, True)
+        failing.end_request(failing.start_request(), False)
+        self.assertLess(healthy.score(), failing.score())
+
+    def test_score_failed_without_latency(self):
+        """Test a worker that has only failed scores worse than a healthy one
+        and an untried one"""
+        healthy = WorkerStats()
+        healthy.end_request(healthy.start_request() - 0.1, True)
+        failing = WorkerStats()
+        failing.end_request(failing.start_request(), False)
+        self.assertLess(healthy.score(), failing.score())
+        self.assertLess(WorkerStats().score(), failing.score())
+
+    def test_reserve(self):
+        """Test reservations count against capacity until released"""
+        self.stats.start_request()
+        self.assertTrue(self.stats.reserve(2, timeout=0))
+        self.assertFalse(self.stats.reserve(2, timeout=0))
+        self.assertFalse(self.stats.wait_for_capacity(2, timeout=0))
+        self.stats.release()
+        self.assertTrue(self.stats.wait_for_capacity(2, timeout=0))
+        self.assertEqual(self.stats.reserved, 0)
+
+
+class TestWorkerStatsTracking(TestCase):
+    def setUp(self) -> None:
+        self.network = build_network(50)
+        return super().setUp()
+
+    def test_request_updates_worker_stats(self):
+        """Test requests record statistics on the worker"""
+        worker = self.network.sharders[0]
+        self.network.session_pool.request = MagicMock(
+            return_value=MockResponse(200, {})
+        )
+        self.network._request(worker.url, worker=worker)
+        self.assertEqual(worker.stats.num_requests, 1)
+        self.assertEqual(worker.stats.error_rate, 0)
+
+    def test_connection_error_counted(self):
+        """Test connection errors count against the worker"""
+        worker = self.network.sharders[0]
+        self.network.session_pool.request = MagicMock(
+            side_effect=requests.exceptions.ConnectionError()
+        )
+        self.network._request(worker.url, worker=worker)
+        self.assertGreater(worker.stats.error_rate, 0)
+
+    def test_orders_fast_workers_first(self):
+        """Test fast workers are ordered before slow ones"""
+        slow, fast = Sharder("http://slow.com"), Sharder("http://fast.com")
+        slow.stats.end_request(slow.stats.start_request() - 1, True)
+        fast.stats.end_request(fast.stats.start_request() - 0.01, True)
+        ordered = self.network._order_workers([slow, fast])
+        self.assertEqual(ordered, [fast, slow])
+
+    def test_network_json_includes_stats(self):
+        """Test worker statistics are exposed through network json"""
+        data = self.network.json()
+        sharder_stats = data["worker_stats"]["sharders"]
+        self.assertIn("http://worker01.com", sharder_stats)
+        self.assertIn("ewma_latency", sharder_stats["http://worker01.com"])
+
+
+class TestCircuitBreaker(TestCase):
+    def setUp(self) -> None:
+        self.breaker = CircuitBreaker(failure_threshold=2, cooldown=30)
+        return super().setUp()
+
+    def test_opens_after_failures(self):
+        """Test consecutive failures open the breaker"""
+        self.breaker.record(False)
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record(False)
+        self.assertEqual(self.breaker.state, BreakerState.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_success_resets_failures(self):
+        """Test a success in between resets the failure count"""
+        self.breaker.record(False)
+        self.breaker.record(True)
+        self.breaker.record(False)
+        self.assertEqual(self.breaker.state, BreakerState.CLOSED)
+
+    def test_half_open_probe_after_cooldown(self):
+        """Test a single probe is allowed once the cool down passed"""
+        self.breaker.record(False)
+        self.breaker.record(False)
+        self.breaker.opened_at -= 31
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, BreakerState.HALF_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        """Test a failed probe opens the breaker again"""
+        self.breaker.record(False)
+        self.breaker.record(False)
+        self.breaker.opened_at -= 31
+        self.breaker.allow_request()
+        self.breaker.record(False)
+        self.assertEqual(self.breaker.state, BreakerState.OPEN)
+
+    def test_successful_probe_closes(self):
+        """Test a successful probe closes the breaker"""
+        self.breaker.record(False)
+        self.breaker.record(False)
+        self.breaker.opened_at -= 31
+        self.breaker.allow_request()
+        self.breaker.record(True)
+        self.assertEqual(self.breaker.state, BreakerState.CLOSED)
+
+
+class TestCircuitBreakerConsensus(TestCase):
+    def setUp(self) -> None:
+        self.network = build_network(67)
+        self.network._request = MagicMock(return_value=MockResponse(200, {"a": 1}))
+        self._open_breaker(self.network.sharders[0])
+        return super().setUp()
+
+    def _open_breaker(self, worker):
+        for _ in range(worker.breaker.failure_threshold):
+            worker.breaker.record(False)
+
+    def test_open_workers_skipped(self):
+        """Test workers with an open breaker are not requested"""
+        self.network.min_confirmation = 50
+        data = self.network._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"a": 1})
+        urls = [call.kwargs["url"] for call in self.network._request.call_args_list]
+        self.assertNotIn("http://worker01.com/v1/chain/get/stats", urls)
+
+    def test_all_policy_counts_open_workers(self):
+        """Test open workers count against consensus under the all policy"""
+        with self.assertRaises(ConsensusError):
+            self.network._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.network._request.assert_not_called()
+
+    def test_available_policy_excludes_open_workers(self):
+        """Test open workers are left out of the quorum under the available policy"""
+        self.network.quorum_policy = QuorumPolicy.AVAILABLE
+        data = self.network._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"a": 1})
+
+    def test_connection_error_response(self):
+        """Test unreachable workers count as responded without weight"""
+        self.network.min_confirmation = 50
+        self.network.sharders[0].breaker.record(True)
+        responses = iter(
+            [
+                requests.exceptions.ConnectionError(),
+                MockResponse(200, {"a": 1}),
+                MockResponse(200, {"a": 1}),
+            ]
+        )
+        self.network.executor = ThreadPoolExecutor(max_workers=1)
+        # _request returns request exceptions rather than raising them
+        self.network._request = MagicMock(side_effect=lambda **kwargs: next(responses))
+        data = self.network._consensus_from_workers("sharders", "v1/chain/get/stats")
+        self.assertEqual(data, {"a": 1})
@@ -1,8 +1,10 @@
+import os
 import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from zerochain.const import Endpoints, STORAGE_SMART_CONTRACT_ADDRESS
+from zerochain.signer import PersistentSigner
 from zerochain.utils import generate_mnemonic, create_wallet_util, request_dns_workers
-from zerochain.bls import generate_keys
 
 
 def list_miners(client):
@@ -50,8 +52,10 @@ def get_block_by_hash(client, block_id):
     return res
 
 
-def get_block_by_round(client, round_num):
+def get_block_by_round(client, round_num, content=None):
     endpoint = f"{Endpoints.GET_BLOCK_INFO}?round={round_num}"
+    if content:
+        endpoint = f"{endpoint}&content={content}"
     res = client._consensus_from_workers("sharders", endpoint)
     return res
 
@@ -102,11 +106,115 @@ def get_worker_id(client, worker_url):
     return details
 
 
+def generate_keys(mnemonic, network):
+    """Wallet keys of a mnemonic, generated by the signer of the network"""
+    return network._get_signer().generate_keys(mnemonic)
+
+
 def create_wallet(network, return_instance=True):
     mnemonic = generate_mnemonic()
-    keys = generate_keys(mnemonic)
+    keys = generate_keys(mnemonic, network)
     res = register_wallet(keys, network)
-    data = {
+    data = wallet_data(keys, mnemonic, res)
+    if return_instance:
+        return create_wallet_util(data, network)
+    else:
+        return res
+
+
+def provision_wallets(
+    network,
+    count,
+    output_path=None,
+    max_in_flight=16,
+    signer=None,
+    return_instance=True,
+    raise_exception=False,
+):
+    """Create and register many wallets, each is yielded as soon as it is
+    registered so results can be consumed while the rest are provisioned
+
+    Keys are generated across the signing processes of the signer while
+    registrations run concurrently, at most max_in_flight wallets are in
+    progress at once.
+    :param network: Network to register wallets on
+    :param count: Int, number of wallets to create
+    :param output_path: String, JSON lines file each wallet is appended to
+    :param max_in_flight: Int, wallets generated and registered at once
+    :param signer: Signer generating keys, defaults to the network signer or
+        a pool of signing processes, one per core
+    :param return_instance: Bool, yield Client instances rather than wallet data
+    :param raise_exception: Bool, raise on the first failed wallet rather than skip it
+    """
+    own_signer = None
+    if not signer:
+        signer = network.signer
+    if not signer:
+        signer = own_signer = PersistentSigner(os.cpu_count() or 1)
+
+    # Each registration fans out to every miner, on an executor sized for
+    # every registration in flight rather than the network executor
+    num_miners = max(len(network.miners), 1)
+    fan_out_executor = ThreadPoolExecutor(
+        max_in_flight * num_miners, thread_name_prefix="zerochain-wallets-fan-out"
+    )
+    fan_out_network = network.with_executor(fan_out_executor)
+
+    def provision_wallet():
+        mnemonic = generate_mnemonic()
+        keys = signer.generate_keys(mnemonic)
+        if not keys:
+            raise ConnectionError("Wallet keys could not be generated")
+        res = register_wallet(keys, fan_out_network)
+        if not isinstance(res, dict) or "id" not in res:
+            raise ConnectionError(f"Wallet registration failed - {res}")
+        return wallet_data(keys, mnemonic, res)
+
+    output_file = open(output_path, "a") if output_path else None
+    # Registration waits on a consensus run by the network executor, so the
+    # pipeline has its own threads rather than sharing the network executor
+    executor = ThreadPoolExecutor(max_in_flight, thread_name_prefix="zerochain-wallets")
+    try:
+        num_submitted = min(count, max_in_flight)
+        pending = {executor.submit(provision_wallet) for _ in range(num_submitted)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if num_submitted < count:
+                    pending.add(executor.submit(provision_wallet))
+                    num_submitted += 1
+
+                try:
+                    data = future.result()
+                except Exception:
+                    if raise_exception:
+                        raise
+                    continue
+
+                if output_file:
+                    output_file.write(json.dumps(data) + "\n")
+                    output_file.flush()
+
+                if return_instance:
+                    yield create_wallet_util(data, network)
+                else:
+                    yield data
+    finally:
+        for future in pending:
+            future.cancel()
+        # Wallets already being provisioned finish before their signer closes
+        executor.shutdown(wait=True)
+        fan_out_executor.shutdown(wait=False)
+        if output_file:
+            output_file.close()
+        if own_signer:
+            own_signer.close()
+
+
+def wallet_data(keys, mnemonic, res):
+    """Saved wallet format of generated keys and their registration"""
+    return {
         "client_id": res["id"],
         "client_key": keys["public_key"],
         "keys": [
@@ -119,10 +227,6 @@ def create_wallet(network, return_instance=True):
         "version": res["version"],
         "date_created": res["creation_date"],
     }
-    if return_instance:
-        return create_wallet_util(data, network)
-    else:
-        return res
 
 
 # def restore_wallet(mnemonic, network, return_instance=True):
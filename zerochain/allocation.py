@@ -10,12 +10,16 @@ class Allocation:
         self.id = id
         self.client = client
 
+    def get_allocation_info(self):
+        return self.client.get_allocation_info(self.id)
+
     def save(self, allocation_name=None):
+        self._write(allocation_name, self.get_allocation_info())
+
+    def _write(self, allocation_name, data):
         if not allocation_name:
             allocation_name = generate_random_letters()
 
-        data = self.get_allocation_info()
-
         with open(
             os.path.join(
                 Path.home(), f".zcn/test_allocations/allocation_{allocation_name}.json"
@@ -36,3 +40,17 @@ class Allocation:
 
     def __repr__(self) -> str:
         return f"Allocation(id, client)"
+
+
+class AsyncAllocation(Allocation):
+    """Allocation of an AsyncClient, methods requesting the network are
+    coroutines"""
+
+    async def get_allocation_info(self):
+        return await self.client.get_allocation_info(self.id)
+
+    async def save(self, allocation_name=None):
+        self._write(allocation_name, await self.get_allocation_info())
+
+    def __repr__(self) -> str:
+        return f"AsyncAllocation(id, client)"
@@ -0,0 +1,768 @@
+import os
+import json
+import asyncio
+from time import time
+from datetime import timedelta
+
+from zerochain.client import Client
+from zerochain.confirmation import ConfirmationTracker
+from zerochain.network import Network
+from zerochain.allocation import AsyncAllocation
+from zerochain.async_connection import AsyncConnectionBase
+from zerochain.async_transaction import AsyncTransaction
+from zerochain.actions import (
+    miner,
+    vesting,
+    allocation,
+    blobber,
+    interest,
+    wallet,
+)
+from zerochain.actions.allocation import AllocationConfig
+from zerochain.actions.miner import miner_delegate_pool
+from zerochain.actions.network import wallet_data
+from zerochain.utils import generate_mnemonic
+from zerochain.signer import PersistentSigner
+from zerochain.const import (
+    Endpoints,
+    STORAGE_SMART_CONTRACT_ADDRESS,
+    TransactionName,
+    TransactionType,
+)
+
+
+class AsyncClient(AsyncConnectionBase):
+    """Asyncio client with the same method surface as Client, every network
+    method is a coroutine
+
+    Transaction methods reuse the input builders in zerochain.actions, those
+    functions return the coroutine of AsyncClient._handle_transaction which
+    is then awaited here.
+    """
+
+    def __init__(
+        self,
+        client_id,
+        client_key,
+        public_key,
+        private_key,
+        mnemonic,
+        date_created,
+        network,
+        version="1.0",
+        connection_limit=100,
+        signer=None,
+    ):
+        self.id = client_id
+        self.client_key = client_key
+        self.public_key = public_key
+        self.private_key = private_key
+        self.mnemonic = mnemonic
+        self.version = version
+        self.date_created = date_created
+        self.network = network
+        self.connection_limit = connection_limit
+        self.signer = signer
+
+    # --------------
+    # Wallet Methods
+    # --------------
+
+    async def get_balance(self, format="default") -> int:
+        endpoint = f"{Endpoints.GET_BALANCE}?client_id={self.id}"
+        empty_return_value = {"balance": 0}
+        res = await self._consensus_from_workers(
+            "sharders", endpoint, empty_return_value=empty_return_value
+        )
+        try:
+            bal = res.get("balance")
+            if format == "human":
+                return "%.10f" % (bal / 10000000000)
+            return bal
+
+        except AttributeError:
+            return res
+
+    async def send_token(self, to_client_id, amount, description=""):
+        return await wallet.send_token(self, to_client_id, amount, description)
+
+    async def add_tokens(self):
+        return await wallet.add_tokens(self)
+
+    # --------------
+    # Interest Methods
+    # --------------
+
+    async def list_lock_token(self):
+        endpoint = f"{Endpoints.GET_LOCKED_TOKENS}?client_id={self.id}"
+        empty_return_value = {
+            "message": "Failed to get locked tokens.",
+            "code": "resource_not_found",
+            "error": "resource_not_found: can't find user node",
+        }
+        return await self._consensus_from_workers(
+            "sharders", endpoint, empty_return_value=empty_return_value
+        )
+
+    async def get_lock_config(self):
+        return await self._consensus_from_workers("sharders", Endpoints.GET_LOCK_CONFIG)
+
+    async def lock_token(self, amount, hours=0, minutes=0):
+        return await interest.lock_token(self, amount, hours, minutes)
+
+    async def unlock_token(self, pool_id):
+        return await interest.unlock_token(self, pool_id)
+
+    # --------------------
+    # Miner methods
+    # --------------------
+
+    async def get_stake_pool_info(self, node_id, pool_id):
+        endpoint = f"{Endpoints.GET_MINERSC_POOL_STATS}?id={node_id}&pool_id={pool_id}"
+        return await self._consensus_from_workers(
+            "sharders", endpoint, empty_return_value={"pools": {}}
+        )
+
+    async def list_stake_pool_info(self):
+        endpoint = f"{Endpoints.GET_MINERSC_USER_STATS}?client_id={self.id}"
+        res = await self._consensus_from_workers(
+            "sharders", endpoint, empty_return_value={"pools": {}}
+        )
+        return allocation.return_pools(res)
+
+    async def miner_lock_token(
+        self,
+        amount,
+        node_id,
+    ):
+        return await miner.miner_lock_token(self, amount, node_id)
+
+    async def miner_unlock_token(self, node_id, pool_id):
+        return await miner.miner_unlock_token(self, node_id, pool_id)
+
+    # --------------------
+    # Vesting Pool methods
+    # --------------------
+
+    async def get_vesting_pool_config(self):
+        return await self._consensus_from_workers(
+            "sharders", Endpoints.GET_VESTING_CONFIG
+        )
+
+    async def get_vesting_pool_info(self, pool_id):
+        endpoint = f"{Endpoints.GET_VESTING_POOL_INFO}?pool_id={pool_id}"
+        return await self._consensus_from_workers("sharders", endpoint)
+
+    async def list_vesting_pool_info(self):
+        endpoint = f"{Endpoints.GET_VESTING_CLIENT_POOLS}?client_id={self.id}"
+        res = await self._consensus_from_workers("sharders", endpoint)
+        return allocation.return_pools(res)
+
+    async def vesting_pool_create(
+        self,
+        destinations,
+        hours=0,
+        minutes=0,
+        days=0,
+        description="",
+        start_time=int(time()),
+    ):
+        return await vesting.vesting_pool_create(
+            self, destinations, hours, minutes, days, description, start_time
+        )
+
+    async def vesting_pool_delete(self, pool_id):
+        return await vesting.vesting_pool_delete(self, pool_id)
+
+    async def vesting_pool_unlock(self, pool_id):
+        return await vesting.vesting_pool_unlock(self, pool_id)
+
+    async def vesting_pool_trigger(self, pool_id):
+        return await vesting.vesting_pool_trigger(self, pool_id)
+
+    async def vesting_pool_stop(self, miner_id, pool_id):
+        return await vesting.vesting_pool_stop(self, miner_id, pool_id)
+
+    # --------------------
+    # Allocation methods
+    # --------------------
+
+    async def get_sc_config(self):
+        return await self._consensus_from_workers("sharders", Endpoints.SC_GET_CONFIG)
+
+    async def list_read_pool_info(self, allocation_id=None):
+        url = f"{Endpoints.SC_REST_READPOOL_STATS}?client_id={self.id}"
+        res = await self._consensus_from_workers("sharders", url)
+        if allocation_id:
+            return allocation.filter_by_allocation_id(res, allocation_id)
+        return allocation.return_pools(res)
+
+    async def list_read_pool_by_allocation_id(self, allocation_id):
+        return await self.list_read_pool_info(allocation_id)
+
+    async def list_write_pool_info(self, allocation_id=None):
+        url = f"{Endpoints.SC_REST_WRITEPOOL_STATS}?client_id={self.id}"
+        res = await self._consensus_from_workers("sharders", url)
+        if allocation_id:
+            return allocation.filter_by_allocation_id(res, allocation_id)
+        return allocation.return_pools(res)
+
+    async def list_write_pool_by_allocation_id(self, allocation_id):
+        return await self.list_write_pool_info(allocation_id)
+
+    async def write_pool_lock(self):
+        pass
+
+    async def write_pool_unlock(self):
+        pass
+
+    async def create_read_pool(self):
+        return await allocation.create_read_pool(self)
+
+    async def read_pool_lock(
+        self,
+        amount,
+        allocation_id,
+        days=0,
+        hours=0,
+        minutes=0,
+        seconds=0,
+        blobber_id=None,
+    ):
+        return await allocation.read_pool_lock(
+            self, amount, allocation_id, days, hours, minutes, seconds, blobber_id
+        )
+
+    async def read_pool_unlock(self, pool_id):
+        return await allocation.read_pool_unlock(self, pool_id)
+
+    async def list_allocations(self):
+        url = f"{Endpoints.SC_REST_ALLOCATIONS}?client={self.id}"
+        return await self._consensus_from_workers("sharders", url)
+
+    async def get_allocation_info(self, allocation_id):
+        url = f"{Endpoints.SC_REST_ALLOCATION}?allocation={allocation_id}"
+        return await self._consensus_from_workers("sharders", url)
+
+    async def get_allocation(self, allocation_id) -> AsyncAllocation:
+        """Returns an instance of an allocation, its network methods are coroutines"""
+        alocs = await self.list_allocations()
+        aloc = allocation.filter_by_allocation_id(alocs, allocation_id, "list")
+        return AsyncAllocation(aloc["id"], self)
+
+    async def create_allocation(
+        self,
+        data_shards=AllocationConfig.DATA_SHARDS,
+        parity_shards=AllocationConfig.PARITY_SHARDS,
+        size=AllocationConfig.SIZE,
+        lock_tokens=AllocationConfig.TOKEN_LOCK,
+        preferred_blobbers=AllocationConfig.PREFERRED_BLOBBERS,
+        write_price=AllocationConfig.WRITE_PRICE,
+        read_price=AllocationConfig.READ_PRICE,
+        max_challenge_completion_time=AllocationConfig.MAX_CHALLENGE_COMPLETION_TIME,
+        expiration_date=time(),
+    ):
+        future_date = int(expiration_date + timedelta(days=30).total_seconds())
+        input = {
+            "data_shards": data_shards,
+            "parity_shards": parity_shards,
+            "owner_id": self.id,
+            "owner_public_key": self.public_key,
+            "size": size,
+            "expiration_date": future_date,
+            "read_price_range": read_price,
+            "write_price_range": write_price,
+            "max_challenge_completion_time": max_challenge_completion_time,
+            "preferred_blobbers": preferred_blobbers,
+        }
+
+        data = await self._handle_transaction(
+            transaction_name=TransactionName.NEW_ALLOCATION_REQUEST,
+            input=input,
+            value=lock_tokens,
+        )
+        return AsyncAllocation(data["hash"], self)
+
+    async def update_allocation(
+        self,
+        allocation_id,
+        extend_expiration_hours=1,
+        size=1628610719,
+        set_immutable=False,
+    ):
+        return await allocation.update_allocation(
+            self, allocation_id, extend_expiration_hours, size, set_immutable
+        )
+
+    async def allocation_min_lock(
+        self,
+        data_shards=AllocationConfig.DATA_SHARDS,
+        parity_shards=AllocationConfig.PARITY_SHARDS,
+        size=AllocationConfig.SIZE,
+        preferred_blobbers=AllocationConfig.PREFERRED_BLOBBERS,
+        write_price=AllocationConfig.WRITE_PRICE,
+        read_price=AllocationConfig.READ_PRICE,
+        max_challenge_completion_time=AllocationConfig.MAX_CHALLENGE_COMPLETION_TIME,
+        expiration_date=time(),
+    ):
+        future = int(expiration_date + timedelta(days=30).total_seconds())
+        payload = json.dumps(
+            {
+                "allocation_data": {
+                    "data_shards": data_shards,
+                    "parity_shards": parity_shards,
+                    "owner_id": self.id,
+                    "owner_public_key": self.public_key,
+                    "size": size,
+                    "expiration_date": future,
+                    "read_price_range": read_price,
+                    "write_price_range": write_price,
+                    "max_challenge_completion_time": max_challenge_completion_time,
+                    "preferred_blobbers": preferred_blobbers,
+                },
+            }
+        )
+        return await self._consensus_from_workers(
+            "sharders", endpoint=Endpoints.SC_REST_ALLOCATION_MIN_LOCK, data=payload
+        )
+
+    # --------------------
+    # Blobber methods
+    # --------------------
+
+    async def get_blobber_info(self, blobber_id):
+        blobbers = await self.list_blobbers()
+        for found_blobber in blobbers:
+            if found_blobber["id"] == blobber_id:
+                return found_blobber
+        return {"error": "Blobber with that ID not found"}
+
+    async def get_blobber_stats(self, blobber_url):
+        res = await self._request(f"{blobber_url}/getstats")
+        return self._check_status_code(res)
+
+    async def list_blobbers(self):
+        res = await self._consensus_from_workers("sharders", Endpoints.SC_BLOBBER_STATS)
+        try:
+            return res.get("Nodes")
+        except:
+            return res
+
+    async def list_blobbers_by_allocation_id(self, allocation_id):
+        res = await self.get_allocation_info(allocation_id)
+        try:
+            return res.get("blobbers")
+        except:
+            return res
+
+    async def blobber_lock_token(self, transaction_value, blobber_id):
+        return await blobber.blobber_lock_token(self, transaction_value, blobber_id)
+
+    async def blobber_unlock_token(self, pool_id, blobber_id):
+        return await blobber.blobber_unlock_token(self, pool_id, blobber_id)
+
+    async def update_blobber_settings(self, blobber_id, settings={}):
+        found_blobber = await self.get_blobber_info(blobber_id)
+        found_blobber["terms"]["read_price"] = 175350921
+        return await self._handle_transaction(
+            input=found_blobber,
+            transaction_name=TransactionName.STORAGESC_UPDATE_BLOBBER_SETTINGS,
+        )
+
+    # --------------------
+    # Network methods
+    # --------------------
+
+    async def list_network_dns(self):
+        res = await self._request(f"{self.network.hostname}/{Endpoints.NETWORK_DNS}")
+        return self._check_status_code(res)
+
+    async def list_miners(self):
+        res = await self._consensus_from_workers("miners", Endpoints.SC_MINERS_STATS)
+        try:
+            return res.get("Nodes")
+        except:
+            return res
+
+    async def get_miner_config(self):
+        return await self._consensus_from_workers("sharders", Endpoints.SC_CONFIGS)
+
+    async def get_node_stats(self, node_id=None):
+        if not node_id:
+            raise Exception("Please provide node ID")
+        endpoint = f"{Endpoints.SC_NODE_STAT}?id={node_id}"
+        return await self._consensus_from_workers("sharders", endpoint)
+
+    async def list_sharders(self):
+        res = await self.get_latest_finalized_magic_block()
+        try:
+            return res.get("magic_block").get("sharders").get("nodes")
+        except:
+            return {"error": "not found"}
+
+    async def get_miner_list(self):
+        return await self._consensus_from_workers("miners", Endpoints.SC_MINERS_STATS)
+
+    async def get_chain_stats(self):
+        return await self._consensus_from_workers("sharders", Endpoints.GET_CHAIN_STATS)
+
+    async def get_block_by_hash(self, block_id):
+        endpoint = f"{Endpoints.GET_BLOCK_INFO}?block={block_id}"
+        return await self._consensus_from_workers("sharders", endpoint)
+
+    async def get_block_by_round(self, round_num, content=None):
+        endpoint = f"{Endpoints.GET_BLOCK_INFO}?round={round_num}"
+        if content:
+            endpoint = f"{endpoint}&content={content}"
+        return await self._consensus_from_workers("sharders", endpoint)
+
+    async def get_latest_finalized_block(self):
+        return await self._consensus_from_workers(
+            "sharders", Endpoints.GET_LATEST_FINALIZED_BLOCK
+        )
+
+    async def get_latest_finalized_magic_block(self):
+        return await self._consensus_from_workers(
+            "sharders", Endpoints.GET_LATEST_FINALIZED_MAGIC_BLOCK
+        )
+
+    async def get_latest_finalized_magic_block_summary(self):
+        return await self._consensus_from_workers(
+            "miners", Endpoints.GET_LATEST_FINALIZED_MAGIC_BLOCK_SUMMARY
+        )
+
+    async def check_transaction_status(self, hash):
+        endpoint = f"{Endpoints.CHECK_TRANSACTION_STATUS}?hash={hash}"
+        return await self._consensus_from_workers("sharders", endpoint)
+
+    async def get_worker_stats(self, worker):
+        workers = self._get_workers(worker)
+        responses = await asyncio.gather(
+            *[self._request(f"{worker.url}/_nh/whoami") for worker in workers]
+        )
+        return {
+            worker.url: self._check_status_code(res)
+            for worker, res in zip(workers, responses)
+        }
+
+    async def get_worker_id(self, worker_url):
+        res = await self._request(f"{worker_url}/_nh/whoami")
+        return {worker_url: self._check_status_code(res)}
+
+    async def get_storage_smartcontract_for_key(self, key_name, key_value):
+        pass
+
+    @staticmethod
+    async def create_wallet(network_param, return_instance=False):
+        mnemonic = generate_mnemonic()
+        loop = asyncio.get_running_loop()
+        keys = await loop.run_in_executor(
+            None, network_param._get_signer().generate_keys, mnemonic
+        )
+        res = await AsyncClient.register_wallet(keys, network_param)
+        if not return_instance:
+            return res
+
+        data = {
+            "client_id": res["id"],
+            "client_key": keys["public_key"],
+            "keys": [
+                {
+                    "public_key": keys["public_key"],
+                    "private_key": keys["private_key"],
+                }
+            ],
+            "mnemonics": mnemonic,
+            "version": res["version"],
+            "date_created": res["creation_date"],
+        }
+        return AsyncClient.from_object(data, network_param)
+
+    @staticmethod
+    async def provision_wallets(
+        network_param,
+        count,
+        output_path=None,
+        max_in_flight=16,
+        signer=None,
+        return_instance=True,
+        raise_exception=False,
+    ):
+        """Async generator of network.provision_wallets, keys are generated in
+        the default executor and registrations run as tasks on the loop, all
+        sharing one session"""
+        own_signer = None
+        if not signer:
+            signer = network_param.signer
+        if not signer:
+            signer = own_signer = PersistentSigner(os.cpu_count() or 1)
+        loop = asyncio.get_running_loop()
+        # Registrations reuse the connections of one session, sized for
+        # every registration in flight reaching every miner
+        num_miners = max(len(network_param.miners), 1)
+        connection = AsyncClient(
+            None,
+            None,
+            None,
+            None,
+            None,
+            None,
+            network_param,
+            connection_limit=max_in_flight * num_miners,
+        )
+
+        async def provision_wallet():
+            mnemonic = generate_mnemonic()
+            keys = await loop.run_in_executor(None, signer.generate_keys, mnemonic)
+            if not keys:
+                raise ConnectionError("Wallet keys could not be generated")
+            res = await AsyncClient.register_wallet(keys, network_param, connection)
+            if not isinstance(res, dict) or "id" not in res:
+                raise ConnectionError(f"Wallet registration failed - {res}")
+            return wallet_data(keys, mnemonic, res)
+
+        output_file = open(output_path, "a") if output_path else None
+        try:
+            num_started = min(count, max_in_flight)
+            pending = {
+                asyncio.ensure_future(provision_wallet()) for _ in range(num_started)
+            }
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if num_started < count:
+                        pending.add(asyncio.ensure_future(provision_wallet()))
+                        num_started += 1
+
+                    try:
+                        data = task.result()
+                    except Exception:
+                        if raise_exception:
+                            raise
+                        continue
+
+                    if output_file:
+                        output_file.write(json.dumps(data) + "\n")
+                        output_file.flush()
+
+                    if return_instance:
+                        yield AsyncClient.from_object(data, network_param)
+                    else:
+                        yield data
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await connection.close()
+            if output_file:
+                output_file.close()
+            if own_signer:
+                own_signer.close()
+
+    @staticmethod
+    async def register_wallet(keys, network_param, connection=None):
+        """Register wallet keys with the miners
+        :param keys: Dict, wallet keys to register
+        :param network_param: Network to register the wallet on
+        :param connection: AsyncClient whose session is used, a session is
+            opened for this registration alone when not given
+        """
+        payload = json.dumps(
+            {
+                "id": keys["client_id"],
+                "version": None,
+                "creation_date": None,
+                "public_key": keys["public_key"],
+            }
+        )
+        headers = {"Accept": "application/json", "Content-Type": "application/json"}
+        if not connection:
+            connection = AsyncClient(None, None, None, None, None, None, network_param)
+            async with connection:
+                return await AsyncClient.register_wallet(
+                    keys, network_param, connection
+                )
+
+        return await connection._consensus_from_workers(
+            "miners",
+            endpoint=Endpoints.register_wallet,
+            method="PUT",
+            data=payload,
+            headers=headers,
+            min_confirmation=10,
+        )
+
+    # --------------------
+    # Batch methods
+    # --------------------
+
+    async def submit_transaction(
+        self,
+        input,
+        transaction_name=None,
+        transaction_type=TransactionType.SMART_CONTRACT,
+        value=0,
+        sc_address=STORAGE_SMART_CONTRACT_ADDRESS,
+        raise_exception=False,
+    ):
+        """Submit a transaction without waiting on its confirmation, returns
+        a TransactionFuture to await for the confirmation data"""
+        return await self._handle_transaction(
+            input,
+            transaction_name,
+            transaction_type,
+            value,
+            sc_address,
+            raise_exception,
+            wait=False,
+        )
+
+    async def submit_many(self, transactions, max_in_flight=8, raise_exception=False):
+        """Submit transactions concurrently, returning a task per transaction
+        resolving to its confirmation data. At most max_in_flight submissions
+        run at once, confirmations are left to the confirmation tracker of the
+        network so no transaction is polled on its own"""
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def process_transaction(transaction):
+            async with semaphore:
+                future = await transaction.submit()
+            return await future
+
+        return [
+            asyncio.ensure_future(
+                process_transaction(
+                    AsyncTransaction.from_args(self, transaction_args, raise_exception)
+                )
+            )
+            for transaction_args in transactions
+        ]
+
+    # --------------------
+    # Utility methods
+    # --------------------
+
+    def sign(self, payload):
+        return self._get_signer().sign(self.private_key, payload)
+
+    def verify(self, signature, payload):
+        return self._get_signer().verify(self.public_key, signature, payload)
+
+    def save(self, client_name=None):
+        return Client.save(self, client_name)
+
+    def get_wallet_info(self):
+        return {
+            "client_id": self.id,
+            "public_key": self.public_key,
+        }
+
+    # --------------
+    # Private Methods
+    # --------------
+
+    def _build_confirmation_tracker(self):
+        # The tracker follows blocks on a thread of its own, it reads through
+        # a blocking client of the same network
+        client = Client(None, None, None, None, None, None, self.network)
+        return ConfirmationTracker(client)
+
+    async def _handle_transaction(
+        self,
+        input,
+        transaction_name=None,
+        transaction_type=TransactionType.SMART_CONTRACT,
+        value=0,
+        sc_address=STORAGE_SMART_CONTRACT_ADDRESS,
+        raise_exception=False,
+        wait=True,
+    ):
+        if not wait:
+            transaction = AsyncTransaction(
+                transaction_name=transaction_name,
+                transaction_type=transaction_type,
+                input=input,
+                client=self,
+                value=value,
+                sc_address=sc_address,
+                raise_exception=raise_exception,
+            )
+            return await transaction.submit()
+
+        return await AsyncTransaction.process_transaction(
+            transaction_name=transaction_name,
+            transaction_type=transaction_type,
+            input=input,
+            client=self,
+            value=value,
+            sc_address=sc_address,
+            raise_exception=raise_exception,
+        )
+
+    @staticmethod
+    def from_object(config: dict, network: Network):
+        """Returns fully configured instance of async client
+        :param config: Client config object from json.loads function
+        :param network: Instance of configured network
+        """
+        return AsyncClient(
+            config.get("client_id"),
+            config.get("client_key"),
+            config.get("keys")[0]["public_key"],
+            config.get("keys")[0]["private_key"],
+            config.get("mnemonics"),
+            config.get("date_created"),
+            network,
+            config.get("version"),
+        )
+
+    def __repr__(self):
+        return f"AsyncClient(config, network)"
+
+    def __str__(self):
+        return f"client_id: {self.id} \nnetwork_url: {self.network.hostname}"
+
+    # -----------------
+    # TODO: Fix methods
+    # All below methods need confirmation
+    # -----------------
+
+    async def update_miner_settings(
+        self,
+        miner_id="",
+        miner_url="",
+        delegate_client="",
+        service_charge=0,
+        num_delegates=0,
+        min_stake=0,
+        max_stake=0,
+        block_reward=None,
+        service_charge_stat=None,
+        users_fee=None,
+        block_sharders_fee=None,
+        sharder_rewards=None,
+        pending_pools=[miner_delegate_pool],
+        active_pools=[miner_delegate_pool],
+        deleting_pools=[miner_delegate_pool],
+    ):
+        return await miner.update_miner_settings(
+            self,
+            miner_id,
+            miner_url,
+            delegate_client,
+            service_charge,
+            num_delegates,
+            min_stake,
+            max_stake,
+            block_reward,
+            service_charge_stat,
+            users_fee,
+            block_sharders_fee,
+            sharder_rewards,
+            pending_pools,
+            active_pools,
+            deleting_pools,
+        )
@@ -0,0 +1,354 @@
+import json
+import asyncio
+
+from zerochain.connection import ConnectionBase
+from zerochain.deadline import Deadline
+from zerochain.consensus import AckTally
+from zerochain.exceptions import ConsensusError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncResponse:
+    """Fully read worker response, exposes the parts of requests.Response
+    used when checking status codes and building consensus"""
+
+    def __init__(self, status_code, content) -> None:
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncConnectionBase(ConnectionBase):
+    """Asyncio counterpart of ConnectionBase, worker requests are raced as
+    tasks on the running event loop rather than threads"""
+
+    connection_limit = 100
+    _async_session = None
+    # Broadcast requests left running once enough workers acknowledged,
+    # the loop only keeps weak references to tasks
+    _background_tasks = set()
+
+    async def _request(
+        self,
+        url,
+        method="GET",
+        headers=None,
+        data=None,
+        files=None,
+        worker=None,
+        timeout=None,
+    ) -> AsyncResponse:
+        """Base request method for async model requests
+        Returns fully read response, or the exception raised on request error
+        :param method: String
+        :param url: String
+        :param headers: Dict, headers keys and values
+        :param data: Dict or String
+        :param files: Dict, form fields of file objects
+        :param worker: Worker, request statistics are recorded on the worker
+        :param timeout: Tuple, connect and read timeout, defaults to network
+            setting capped by the deadline
+        """
+        session = self._get_async_session()
+        if timeout is None:
+            timeout = self._get_request_timeout(self._get_deadline())
+        connect_timeout, read_timeout = timeout
+        client_timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        if files:
+            data = self._build_form_data(data, files)
+        if worker:
+            start_time = worker.stats.start_request()
+
+        try:
+            async with session.request(
+                method, url, headers=headers, data=data, timeout=client_timeout
+            ) as res:
+                content = await res.read()
+                res = AsyncResponse(res.status, content)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            res = e
+
+        except asyncio.CancelledError:
+            # Losing requests of a consensus round leave no latency sample
+            if worker:
+                worker.stats.cancel_request()
+            raise
+
+        if worker:
+            self._record_worker_result(worker, start_time, res)
+
+        return res
+
+    async def _consensus_from_workers(
+        self,
+        worker,
+        endpoint,
+        method="GET",
+        data=None,
+        files=None,
+        headers=None,
+        empty_return_value=None,
+        min_confirmation=None,
+        fingerprint=None,
+        strategy=None,
+        hedge_delay=None,
+        deadline=None,
+    ) -> dict:
+        """Get response from all workers, consolidate responses to get consesus of data,
+        return data of highest number of confirmations of a response
+        :param worker: String, name of worker to request data,
+        :param endpoint: String, endpoint to request from worker
+        :param fingerprint: String, ConsensusFingerprint mode, defaults to network setting
+        :param strategy: String, ConsensusStrategy, defaults to network setting
+        :param hedge_delay: Float, seconds before a hedged round adds a worker,
+            defaults to network setting, adapting to worker latency when unset
+        :param deadline: Float or Deadline, raise DeadlineExceededError when
+            consensus is not reached in time, defaults to the bound deadline
+        """
+        consensus = self._consensus_params(
+            headers, empty_return_value, min_confirmation, fingerprint, strategy
+        )
+        cache_key = self._response_cache_key(
+            worker, method, endpoint, data, files, consensus
+        )
+        if cache_key:
+            found, response_data = self._get_response_cache().get(cache_key)
+            if found:
+                return response_data
+
+        deadline = Deadline.from_value(deadline) or self._get_deadline()
+
+        def consensus_round():
+            return self._consensus_round(
+                worker,
+                endpoint,
+                method,
+                data,
+                files,
+                headers,
+                empty_return_value,
+                min_confirmation,
+                fingerprint,
+                strategy,
+                hedge_delay,
+                deadline,
+            )
+
+        # Identical reads in flight at the same time share one round
+        flight_key = self._single_flight_key(
+            worker, method, endpoint, data, files, consensus
+        )
+        if flight_key:
+            response_data = await self._get_single_flight().do_async(
+                flight_key, consensus_round, deadline
+            )
+        else:
+            response_data = await consensus_round()
+
+        self._cache_response(cache_key, endpoint, response_data)
+        return response_data
+
+    async def _consensus_round(
+        self,
+        worker,
+        endpoint,
+        method="GET",
+        data=None,
+        files=None,
+        headers=None,
+        empty_return_value=None,
+        min_confirmation=None,
+        fingerprint=None,
+        strategy=None,
+        hedge_delay=None,
+        deadline=None,
+    ) -> dict:
+        """Single consensus round across the workers, uncached"""
+        if not min_confirmation:
+            min_confirmation = self._get_min_confirmation()
+        if not fingerprint:
+            fingerprint = self._get_consensus_fingerprint()
+        if not strategy:
+            strategy = self._get_consensus_strategy()
+        if hedge_delay is None:
+            hedge_delay = self._get_hedge_delay()
+        deadline = Deadline.from_value(deadline) or self._get_deadline()
+        if deadline:
+            deadline.check(f"Deadline exceeded before requesting {endpoint}")
+
+        tally, queued_workers = self._start_consensus_round(worker, min_confirmation)
+        num_initial_workers = self._num_initial_workers(
+            tally, strategy, len(queued_workers)
+        )
+        if hedge_delay is None:
+            hedge_delay = self._adaptive_hedge_delay(
+                queued_workers[:num_initial_workers]
+            )
+        tasks = []
+
+        def start_next_worker():
+            worker = queued_workers.pop(0)
+            task = asyncio.ensure_future(
+                self._request(
+                    method=method,
+                    url=f"{worker.url}/{endpoint}",
+                    data=data,
+                    files=files,
+                    headers=headers,
+                    worker=worker,
+                    timeout=self._get_request_timeout(deadline),
+                )
+            )
+            tasks.append(task)
+            return task
+
+        try:
+            pending = {start_next_worker() for _ in range(num_initial_workers)}
+
+            while pending:
+                # Hedged rounds only wait hedge_delay before adding a worker
+                timeout = hedge_delay if queued_workers else None
+                if deadline:
+                    timeout = deadline.cap(timeout)
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    self._check_deadline(deadline, endpoint, tally)
+                    if queued_workers:
+                        pending.add(start_next_worker())
+                    continue
+
+                for task in done:
+                    self._tally_response(
+                        tally, task.result(), endpoint, empty_return_value, fingerprint
+                    )
+                    if self._check_tally(tally):
+                        return self._parse_consensus_response(
+                            tally.leader_data, endpoint, empty_return_value
+                        )
+
+                # Expand on disagreement, when requests in flight can no
+                # longer lift the leader to consensus on their own
+                while queued_workers and not tally.can_reach(len(pending)):
+                    pending.add(start_next_worker())
+        finally:
+            # Losing requests are cancelled, closing their connections
+            for task in tasks:
+                task.cancel()
+
+    async def _broadcast_to_workers(
+        self,
+        worker,
+        endpoint,
+        data=None,
+        headers=None,
+        is_ack=None,
+        min_acks=None,
+        deadline=None,
+    ):
+        """Post to every worker at once and return after min_acks of them
+        acknowledge, see ConnectionBase._broadcast_to_workers"""
+        if not min_acks:
+            min_acks = self._get_broadcast_min_acks()
+        deadline = Deadline.from_value(deadline) or self._get_deadline()
+        if deadline:
+            deadline.check(f"Deadline exceeded before posting to {endpoint}")
+
+        workers = [
+            worker
+            for worker in self._get_workers(worker)
+            if worker.breaker.allow_request()
+        ]
+        if not workers:
+            raise ConsensusError(
+                f"No {worker} available, circuit breakers of every worker are open"
+            )
+
+        timeout = self._get_request_timeout(deadline)
+        pending = {
+            asyncio.ensure_future(
+                self._request(
+                    method="POST",
+                    url=f"{worker.url}/{endpoint}",
+                    data=data,
+                    headers=headers,
+                    worker=worker,
+                    timeout=timeout,
+                )
+            )
+            for worker in workers
+        }
+
+        tally = AckTally(len(workers), min_acks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=deadline.cap(None) if deadline else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    deadline.check(
+                        f"Deadline exceeded waiting on {endpoint} - {tally.describe()}"
+                    )
+                    continue
+
+                for task in done:
+                    self._tally_ack(tally, task.result(), is_ack)
+                if tally.is_reached():
+                    return tally.ack_data
+                if tally.is_impossible():
+                    break
+        finally:
+            for task in pending:
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+        return self._broadcast_failure(tally, worker, endpoint)
+
+    async def close(self):
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _get_async_session(self):
+        """Session is created on first request so it binds to the running loop"""
+        if not aiohttp:
+            raise ImportError(
+                "aiohttp is required for async connections, install with 'pip install zerochain[async]'"
+            )
+
+        if not self._async_session or self._async_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            self._async_session = aiohttp.ClientSession(connector=connector)
+
+        return self._async_session
+
+    def _build_form_data(self, data, files):
+        form = aiohttp.FormData()
+        for key, value in (data or {}).items():
+            form.add_field(key, value)
+        for key, value in files.items():
+            form.add_field(key, value)
+        return form
@@ -0,0 +1,139 @@
+import json
+import asyncio
+from time import monotonic
+
+from zerochain.const import Endpoints, TransactionState
+from zerochain.transaction import Transaction, TransactionFuture
+from zerochain.polling import ConfirmationPoller
+from zerochain.exceptions import DeadlineExceededError, TransactionError
+
+
+class AsyncTransaction(Transaction):
+    """Transaction submitted and confirmed through an AsyncClient"""
+
+    @staticmethod
+    async def process_transaction(
+        client,
+        input,
+        transaction_name,
+        transaction_type,
+        value,
+        sc_address,
+        raise_exception,
+    ):
+        transaction = AsyncTransaction(
+            transaction_name=transaction_name,
+            transaction_type=transaction_type,
+            input=input,
+            client=client,
+            value=value,
+            sc_address=sc_address,
+            raise_exception=raise_exception,
+        )
+        await transaction.execute()
+        valid_res = await transaction.validate()
+        return valid_res
+
+    async def execute(self):
+        return await self._submit_transaction(
+            self._build_payload(),
+        )
+
+    async def submit(self):
+        """Submit the transaction and return as soon as it is accepted, the
+        returned TransactionFuture resolves once it is confirmed, await it
+
+        Confirmation is left to the confirmation tracker of the network, as
+        for Transaction.submit, nothing polls the transaction on the loop.
+        """
+        response_data = await self.execute()
+        if "error" in response_data:
+            raise TransactionError(
+                f"Transaction could not be submitted - {response_data['error']}"
+            )
+
+        future = TransactionFuture(self)
+        future.set_running_or_notify_cancel()
+        self._track(future)
+        return future
+
+    async def validate(self, hash=None):
+        if not hash:
+            hash = self.hash
+        deadline = self._get_deadline()
+        poller = ConfirmationPoller(
+            await self._get_block_time(), self.timeout, deadline, self.submitted_at
+        )
+        for delay in poller:
+            await asyncio.sleep(delay)
+            try:
+                confirmation_data = await self.client.check_transaction_status(hash)
+            except DeadlineExceededError:
+                raise
+            except:
+                confirmation_data = None
+
+            # Sharders without the transaction answer with error text
+            if isinstance(confirmation_data, dict):
+                self.confirmation_data = confirmation_data
+                self.status = confirmation_data.get("transaction_status")
+
+            if self.status == 1:
+                break
+
+        if self.status == 1:
+            self._journal_confirmation()
+            return self.confirmation_data
+
+        self._check_confirmation_deadline(deadline)
+        self._journal_confirmation()
+        if self.raise_exception:
+            raise TransactionError("Transaction could to be confirmed")
+        else:
+            return self.response_data
+
+    async def _get_block_time(self):
+        block_time = self.client._get_cached_block_time()
+        if block_time is not None:
+            return block_time
+
+        try:
+            chain_stats = await self.client.get_chain_stats()
+        except DeadlineExceededError:
+            raise
+        except Exception:
+            chain_stats = None
+        return self.client._observe_block_time(chain_stats)
+
+    async def _submit_transaction(self, payload):
+        # Signing is blocking, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        transaction_data = await loop.run_in_executor(
+            None, self._build_transaction_data, payload
+        )
+        self._journal(TransactionState.BUILT, transaction_data)
+
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        self.submitted_at = monotonic()
+        # Miners accepting the transaction echo its hash
+        self.response_data = await self.client._broadcast_to_workers(
+            "miners",
+            endpoint=Endpoints.PUT_TRANSACTION,
+            data=json.dumps(transaction_data),
+            headers=headers,
+            is_ack=self._is_accepted,
+        )
+        self._journal(
+            TransactionState.SUBMITTED
+            if self._is_accepted(self.response_data)
+            else TransactionState.FAILED
+        )
+        try:
+            response_hash = self.response_data.get("entity").get("hash")
+        except:
+            return {"error": (self.response_data)}
+
+        if response_hash != self.hash:
+            raise TransactionError("Request hash and response hash do not match")
+
+        return self.response_data
@@ -1,12 +1,253 @@
+import os
+import json
+import atexit
+import itertools
+import threading
 import subprocess
+from collections import deque
+from concurrent.futures import Future, TimeoutError
+
 from zerochain.utils import get_project_root
+from zerochain.exceptions import SigningError
 
 root_dir = get_project_root()
 
 PASSPHRASE = "0chain-client-split-key"
 
+SIGN_SERVER_PATH = f"{root_dir}/zerochain/lib/bn254_js/sign_server.js"
+
+
+class SigningWorker:
+    """Long lived signing process, bls-wasm and key material are loaded once
+    and every signature is served over the process stdin and stdout
+
+    Requests are single JSON lines tagged with an id, responses are matched
+    back to their request by id so any number of threads can sign at once.
+    The process is started on first use and restarted if it exits, or once
+    a request goes unanswered for timeout seconds.
+    :param command: List, command starting a process speaking the protocol
+    :param timeout: Float, seconds to wait on a response
+    """
+
+    def __init__(self, command=None, timeout=10) -> None:
+        self.command = command or ["node", SIGN_SERVER_PATH]
+        self.timeout = timeout
+        self.num_restarts = 0
+        self._process = None
+        self._pending = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def sign(self, private_key, hash_payload):
+        return self.request("sign", private_key=private_key, hash=hash_payload)
+
+    def generate_keys(self, mnemonic):
+        keys = self.request("generate_keys", mnemonic=mnemonic)
+        keys["mnemonic"] = mnemonic
+        return keys
+
+    def request(self, method, **params):
+        """Send a request and block until its response arrives
+        :param method: String, method served by the signing process
+        """
+        future = self.submit(method, **params)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.abandon()
+            raise SigningError(f"Signing worker did not respond to {method}")
+
+    def submit(self, method, **params) -> Future:
+        """Send a request without waiting, the future resolves to its result,
+        call its abandon method when giving up on the response"""
+        future = Future()
+        with self._lock:
+            process, pending = self._ensure_running()
+            request_id = next(self._ids)
+            pending[request_id] = future
+            future.abandon = lambda: self._abandon(process, pending, request_id)
+            line = json.dumps({"id": request_id, "method": method, **params})
+            try:
+                process.stdin.write(f"{line}\n".encode())
+                process.stdin.flush()
+            except OSError as e:
+                pending.pop(request_id, None)
+                raise SigningError(f"Signing worker unavailable - {e}")
+        return future
+
+    def close(self):
+        with self._lock:
+            process = self._process
+            self._process = None
+        if process and process.poll() is None:
+            process.stdin.close()
+            try:
+                process.wait(1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def _abandon(self, process, pending, request_id):
+        """Drop a request left unanswered and replace its process, a hung
+        process would fail every request sent to it after"""
+        pending.pop(request_id, None)
+        with self._lock:
+            if self._process is not process:
+                return
+            self._process = None
+            self.num_restarts += 1
+        # The reader fails the other requests sent to the process once it exits
+        process.kill()
+
+    def _ensure_running(self):
+        if self._process and self._process.poll() is None:
+            return self._process, self._pending
+
+        if self._process:
+            self.num_restarts += 1
+
+        try:
+            self._process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            self._process = None
+            raise SigningError(f"Unable to start signing worker - {e}")
+
+        # Each process gets its own pending map, so a dying process only
+        # fails the requests that were sent to it
+        self._pending = {}
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._process, self._pending),
+            name="zerochain-signer",
+            daemon=True,
+        ).start()
+        return self._process, self._pending
+
+    def _read_responses(self, process, pending):
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except ValueError:
+                continue
+
+            future = pending.pop(response.get("id"), None)
+            if not future:
+                continue
+            if "error" in response:
+                future.set_exception(SigningError(response["error"]))
+            else:
+                future.set_result(response.get("result"))
+
+        # Reap the process before failing its requests, so a caller retrying
+        # on the error always finds it gone and starts a new one
+        process.kill()
+        process.wait()
+        for request_id in list(pending):
+            future = pending.pop(request_id, None)
+            if future:
+                future.set_exception(SigningError("Signing worker exited"))
+
+
+class SignerPool:
+    """Signing processes spread across cores, each request goes to the
+    worker with the fewest requests in flight
+    :param size: Int, number of signing processes, defaults to CPU count
+    :param command: List, command starting each signing process
+    :param timeout: Float, seconds to wait on a response
+    """
+
+    def __init__(self, size=None, command=None, timeout=10) -> None:
+        self.size = size or os.cpu_count() or 1
+        self.timeout = timeout
+        self.workers = [SigningWorker(command, timeout) for _ in range(self.size)]
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(worker.in_flight for worker in self.workers)
+
+    def sign(self, private_key, hash_payload):
+        return self.request("sign", private_key=private_key, hash=hash_payload)
+
+    def generate_keys(self, mnemonic):
+        keys = self.request("generate_keys", mnemonic=mnemonic)
+        keys["mnemonic"] = mnemonic
+        return keys
+
+    def request(self, method, **params):
+        return self._result(self.submit(method, **params))
+
+    def sign_many(self, private_key, hashes, window=None):
+        """Sign every hash across the pool, signatures are yielded in the
+        order of the hashes as soon as each is ready
+        :param private_key: String, key signing every hash
+        :param hashes: Iterable of hash strings, consumed as signing proceeds
+        :param window: Int, max signatures in flight, defaults to 32 per worker
+        """
+        window = window or self.size * 32
+        futures = deque()
+        for hash_payload in hashes:
+            futures.append(
+                self.submit("sign", private_key=private_key, hash=hash_payload)
+            )
+            if len(futures) >= window:
+                yield self._result(futures.popleft())
+
+        while futures:
+            yield self._result(futures.popleft())
+
+    def submit(self, method, **params) -> Future:
+        with self._lock:
+            worker = min(self.workers, key=lambda worker: worker.in_flight)
+            return worker.submit(method, **params)
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+
+    def _result(self, future):
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.abandon()
+            raise SigningError("Signing worker did not respond")
+
+
+_signing_worker = None
+_signing_worker_lock = threading.Lock()
+
+
+def get_signing_worker() -> SigningWorker:
+    """Process wide signing worker, started on first use"""
+    global _signing_worker
+    with _signing_worker_lock:
+        if not _signing_worker:
+            _signing_worker = SigningWorker()
+            atexit.register(_signing_worker.close)
+        return _signing_worker
+
 
 def sign_payload(private_key, hash_payload):
+    try:
+        sig = get_signing_worker().sign(private_key, hash_payload)
+    except SigningError:
+        return False
+
+    if not sig or len(sig) != 64:
+        return False
+    return sig
+
+
+def spawn_sign_payload(private_key, hash_payload):
+    """Sign in a Node process started for this signature alone"""
     file_path = f"{root_dir}/zerochain/lib/bn254_js/sign.js"
 
     command = subprocess.Popen(
@@ -25,6 +266,20 @@ def sign_payload(private_key, hash_payload):
         return False
 
 
+def spawn_verify(public_key, signature, hash_payload):
+    """Verify in a Node process started for this signature alone"""
+    file_path = f"{root_dir}/zerochain/lib/bn254_js/verify.js"
+
+    command = subprocess.Popen(
+        ["node", file_path, public_key, signature, hash_payload],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+    valid, err = command.communicate()
+    return err == None and valid.decode() == "true"
+
+
 def generate_keys(mnemonic):
     file_path = f"{root_dir}/zerochain/lib/bn254_js/generate_keys.js"
 
@@ -0,0 +1,177 @@
+import json
+import threading
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from zerochain.const import Endpoints
+from zerochain.transaction import Transaction
+from zerochain.exceptions import SigningError
+
+TRANSACTION_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+
+def write_bundle(client, transactions, path, chunk_size=256):
+    """Build and sign transactions ahead of submission into a bundle file,
+    one signed transaction per line, each line is the body posted to miners
+
+    No requests are made, the hashes of each chunk are signed together with
+    sign_many so a pool signer spreads the chunk across its processes.
+    Miners reject transactions created too long before they are received,
+    a bundle is to be broadcast soon after it is written.
+    :param client: Client whose wallet signs the transactions
+    :param transactions: Iterable of dicts of Transaction arguments, see
+        Transaction.from_args
+    :param path: String, path of the bundle file, lines are appended
+    :param chunk_size: Int, transactions signed together
+    Returns number of transactions written
+    """
+    signer = client._get_signer()
+    transactions = iter(transactions)
+    num_written = 0
+
+    with open(path, "a") as f:
+        while True:
+            chunk = list(islice(transactions, chunk_size))
+            if not chunk:
+                return num_written
+
+            records = []
+            for transaction_args in chunk:
+                transaction = Transaction.from_args(client, transaction_args)
+                records.append(
+                    transaction._build_unsigned_data(transaction._build_payload())
+                )
+
+            hashes = [record["hash"] for record in records]
+            signatures = signer.sign_many(client.private_key, hashes)
+            for record, signature in zip(records, signatures):
+                if not signature:
+                    raise SigningError(f"Unable to sign transaction {record['hash']}")
+                record["signature"] = signature
+                f.write(f"{json.dumps(record)}\n")
+            num_written += len(records)
+
+
+def read_bundle(path):
+    """Yield the signed transactions of a bundle file in order"""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class BundleBroadcaster:
+    """Stream signed transactions to the miners, many at once
+
+    Bundles are read lazily, at most max_in_flight transactions are being
+    broadcast at any time, and reading pauses while results are not consumed.
+    Each transaction is broadcast with the network broadcast, so it counts
+    as accepted once min_acks miners echo its hash. Requests to the miners
+    fan out on an executor of the broadcaster sized for every transaction
+    in flight, not on the executor shared by the network.
+    :param client: Client the transactions are posted through, any client
+        of the network, the signing wallet is not needed
+    :param max_in_flight: Int, transactions being broadcast at once
+    :param min_acks: Int, miners acknowledging each transaction, defaults
+        to network setting
+    :param confirm: Bool, track confirmation of accepted transactions, the
+        result of each then holds a future of its confirmation data
+    """
+
+    def __init__(self, client, max_in_flight=64, min_acks=None, confirm=False):
+        self.max_in_flight = max_in_flight
+        self.min_acks = min_acks
+        self.confirm = confirm
+        self.num_accepted = 0
+        self.num_rejected = 0
+        self._lock = threading.Lock()
+        # Own executor, broadcasts wait on the requests they fan out
+        self.executor = ThreadPoolExecutor(
+            max_in_flight, thread_name_prefix="zerochain-broadcast"
+        )
+        num_miners = max(len(client._get_workers("miners")), 1)
+        self.fan_out_executor = ThreadPoolExecutor(
+            max_in_flight * num_miners, thread_name_prefix="zerochain-broadcast-fan-out"
+        )
+        self.client = client.with_executor(self.fan_out_executor)
+
+    def broadcast(self, records):
+        """Broadcast signed transactions, a result dict is yielded per
+        transaction in order with its hash, whether it was accepted and the
+        response of the miners
+        :param records: Iterable of signed transaction dicts, or path of a
+            bundle file
+        """
+        if isinstance(records, str):
+            records = read_bundle(records)
+
+        futures = deque()
+        try:
+            for record in records:
+                futures.append(self.executor.submit(self._broadcast_record, record))
+                if len(futures) >= self.max_in_flight:
+                    yield futures.popleft().result()
+
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            # Results no longer consumed, such as on reading a bad bundle
+            # line, leave no broadcast queued behind the generator
+            for future in futures:
+                future.cancel()
+
+    def json(self):
+        return {
+            "num_accepted": self.num_accepted,
+            "num_rejected": self.num_rejected,
+        }
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        # Requests to miners beyond the acknowledgements needed may still run
+        self.fan_out_executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _broadcast_record(self, record):
+        hash = record["hash"]
+
+        def is_accepted(response_data):
+            try:
+                return response_data.get("entity").get("hash") == hash
+            except AttributeError:
+                return False
+
+        try:
+            response_data = self.client._broadcast_to_workers(
+                "miners",
+                endpoint=Endpoints.PUT_TRANSACTION,
+                data=json.dumps(record),
+                headers=TRANSACTION_HEADERS,
+                is_ack=is_accepted,
+                min_acks=self.min_acks,
+            )
+        except Exception as e:
+            # Any failure, a deadline or an unreachable network included,
+            # rejects this transaction alone
+            response_data = str(e)
+
+        result = {
+            "hash": hash,
+            "accepted": is_accepted(response_data),
+            "response": response_data,
+        }
+        with self._lock:
+            if result["accepted"]:
+                self.num_accepted += 1
+            else:
+                self.num_rejected += 1
+
+        if result["accepted"] and self.confirm:
+            result["confirmation"] = self.client._get_confirmation_tracker().track(hash)
+        return result
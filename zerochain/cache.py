@@ -0,0 +1,105 @@
+import copy
+import threading
+from time import monotonic
+from collections import OrderedDict
+
+from zerochain.const import DEFAULT_CACHE_TTLS, Endpoints
+
+
+class ResponseCache:
+    """In memory LRU cache of consensus results, only endpoints with a TTL
+    are cached so every other read still goes to the workers
+    :param ttls: Dict, seconds each endpoint is cached for, keyed by endpoint
+        path or Endpoints attribute name
+    :param max_size: Int, entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, ttls=None, max_size=256) -> None:
+        if ttls is None:
+            ttls = DEFAULT_CACHE_TTLS
+        self.ttls = {getattr(Endpoints, key, key): ttl for key, ttl in ttls.items()}
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, worker, method, endpoint, data=None, consensus=None):
+        """Reads are cached apart when their consensus arguments differ, a
+        strict quorum read is never answered by a lenient one
+        :param consensus: Hashable, consensus arguments of the read
+        """
+        return (worker, method, endpoint, data, consensus)
+
+    def is_cacheable(self, method, endpoint, data=None, files=None):
+        return method == "GET" and not data and not files and bool(self.ttl(endpoint))
+
+    def ttl(self, endpoint):
+        return self.ttls.get(endpoint.split("?")[0])
+
+    def get(self, key):
+        """Return a tuple of found and a copy of the cached data, callers
+        are free to mutate what they are given"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] <= monotonic():
+                del self._entries[key]
+                entry = None
+
+            if not entry:
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+
+        return True, copy.deepcopy(data)
+
+    def set(self, key, endpoint, data):
+        ttl = self.ttl(endpoint)
+        if not ttl:
+            return
+
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint=None):
+        """Drop cached results of an endpoint, every result when no endpoint given"""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+
+            endpoint = getattr(Endpoints, endpoint, endpoint)
+            for key in list(self._entries):
+                if key[2].split("?")[0] == endpoint.split("?")[0]:
+                    del self._entries[key]
+
+    def json(self):
+        with self._lock:
+            num_lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / num_lookups if num_lookups else 0,
+            }
+
+    @staticmethod
+    def from_object(config_obj):
+        """Cache of config, None unless cache or cache_ttls is set"""
+        if not config_obj.get("cache") and not config_obj.get("cache_ttls"):
+            return None
+        return ResponseCache(
+            ttls=config_obj.get("cache_ttls"),
+            max_size=config_obj.get("cache_max_size", 256),
+        )
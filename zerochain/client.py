@@ -20,7 +20,6 @@ from zerochain.actions.allocation import AllocationConfig
 from zerochain.actions.miner import miner_delegate_pool
 
 from zerochain.utils import generate_random_letters
-from zerochain.bls import sign_payload
 from zerochain.const import (
     STORAGE_SMART_CONTRACT_ADDRESS,
     TransactionType,
@@ -38,6 +37,7 @@ class Client(ConnectionBase):
         date_created,
         network,
         version="1.0",
+        signer=None,
     ):
         self.id = client_id
         self.client_key = client_key
@@ -47,6 +47,7 @@ class Client(ConnectionBase):
         self.version = version
         self.date_created = date_created
         self.network = network
+        self.signer = signer
 
     # --------------
     # Wallet Methods
@@ -289,8 +290,8 @@ class Client(ConnectionBase):
     def get_block_by_hash(self, block_id):
         return network.get_block_by_hash(self, block_id)
 
-    def get_block_by_round(self, round_num):
-        return network.get_block_by_round(self, round_num)
+    def get_block_by_round(self, round_num, content=None):
+        return network.get_block_by_round(self, round_num, content)
 
     def get_latest_finalized_block(self):
         return network.get_latest_finalized_block(self)
@@ -317,6 +318,10 @@ class Client(ConnectionBase):
     def create_wallet(network_param, return_instance=False):
         return network.create_wallet(network_param, return_instance)
 
+    @staticmethod
+    def provision_wallets(network_param, count, output_path=None, **kwargs):
+        return network.provision_wallets(network_param, count, output_path, **kwargs)
+
     # @staticmethod
     # def restore_wallet(mnemonic, network_param, return_instance=False):
     #     return network.restore_wallet(mnemonic, network_param, return_instance)
@@ -325,12 +330,46 @@ class Client(ConnectionBase):
     def register_wallet(keys, network_param):
         return network.register_wallet(keys, network_param)
 
+    # --------------------
+    # Batch methods
+    # --------------------
+
+    def submit_transaction(
+        self,
+        input,
+        transaction_name=None,
+        transaction_type=TransactionType.SMART_CONTRACT,
+        value=0,
+        sc_address=STORAGE_SMART_CONTRACT_ADDRESS,
+        raise_exception=False,
+    ):
+        """Submit a transaction without waiting on its confirmation, returns
+        a TransactionFuture resolving to the confirmation data"""
+        return self._handle_transaction(
+            input,
+            transaction_name,
+            transaction_type,
+            value,
+            sc_address,
+            raise_exception,
+            wait=False,
+        )
+
+    def submit_many(self, transactions, max_in_flight=8, raise_exception=False):
+        """Submit transactions concurrently, see Transaction.submit_many"""
+        return Transaction.submit_many(
+            self, transactions, max_in_flight, raise_exception
+        )
+
     # --------------------
     # Utility methods
     # --------------------
 
     def sign(self, payload):
-        return sign_payload(self.private_key, payload)
+        return self._get_signer().sign(self.private_key, payload)
+
+    def verify(self, signature, payload):
+        return self._get_signer().verify(self.public_key, signature, payload)
 
     def save(self, client_name=None):
         if not client_name:
@@ -369,7 +408,20 @@ class Client(ConnectionBase):
         value=0,
         sc_address=STORAGE_SMART_CONTRACT_ADDRESS,
         raise_exception=False,
+        wait=True,
     ):
+        if not wait:
+            transaction = Transaction(
+                transaction_name=transaction_name,
+                transaction_type=transaction_type,
+                input=input,
+                client=self,
+                value=value,
+                sc_address=sc_address,
+                raise_exception=raise_exception,
+            )
+            return transaction.submit()
+
         return Transaction.process_transaction(
             transaction_name=transaction_name,
             transaction_type=transaction_type,
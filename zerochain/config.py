@@ -7,5 +7,22 @@ HOME_PATH = get_home_path()
 DEFUALT_PUBLIC_URL = "https://beta.0chain.net"
 
 # Change default paths to home dir in production
-default_network_config_obj = from_yaml(os.path.join(HOME_PATH, ".zcn/config.yaml"))
-default_client_config_obj = from_json(os.path.join(HOME_PATH, ".zcn/wallet.json"))
+CONFIG_LOADERS = {
+    "default_network_config_obj": lambda: from_yaml(
+        os.path.join(HOME_PATH, ".zcn/config.yaml")
+    ),
+    "default_client_config_obj": lambda: from_json(
+        os.path.join(HOME_PATH, ".zcn/wallet.json")
+    ),
+}
+
+
+def __getattr__(name):
+    """Default configs are parsed on first access rather than on import"""
+    loader = CONFIG_LOADERS.get(name)
+    if not loader:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = loader()
+    globals()[name] = value
+    return value
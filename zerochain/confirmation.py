@@ -0,0 +1,226 @@
+import copy
+import threading
+from time import monotonic
+from concurrent.futures import Future
+
+from zerochain.const import DEFAULT_CONFIRMATION_TIMEOUT
+
+
+class PendingTransaction:
+    """Transaction hash awaiting confirmation by a ConfirmationTracker"""
+
+    def __init__(self, hash, future, submitted_at, timeout) -> None:
+        self.hash = hash
+        self.future = future
+        self.submitted_at = submitted_at
+        self.expires_at = submitted_at + timeout
+        self.queried_at = None
+
+
+class ConfirmationTracker:
+    """Confirm many pending transactions by following finalized blocks
+
+    One background thread requests the latest finalized block, then every
+    finalized block since the last one with its transactions, and resolves
+    each pending hash found in a block. Requests made grow with the number
+    of blocks rather than the number of transactions. Transactions missed
+    by the blocks followed, such as those finalized before tracking began,
+    are queried by hash once they have been pending for straggler_blocks.
+    The thread exits whenever nothing is pending.
+    :param client: Client the blocks are requested through
+    :param timeout: Float, seconds after submission a transaction is tracked
+    :param straggler_blocks: Int, blocks a hash is pending before it is
+        queried on its own, and again every other block after that
+    :param lookback: Int, finalized blocks before the latest that are
+        searched when following starts
+    :param max_catch_up: Int, most blocks requested in a single pass, blocks
+        beyond are skipped and their transactions left to straggler queries
+    """
+
+    def __init__(
+        self,
+        client,
+        timeout=DEFAULT_CONFIRMATION_TIMEOUT,
+        straggler_blocks=4,
+        lookback=2,
+        max_catch_up=16,
+    ) -> None:
+        # Blocks are followed on behalf of every client, never under the
+        # deadline or executor bound to the client that started the tracker
+        self.client = copy.copy(client)
+        self.client.deadline = None
+        self.client.executor = None
+        self.timeout = timeout
+        self.straggler_blocks = straggler_blocks
+        self.lookback = lookback
+        self.max_catch_up = max_catch_up
+        self.last_round = None
+        self.num_blocks = 0
+        self.num_confirmed_by_block = 0
+        self.num_confirmed_by_query = 0
+        self.num_expired = 0
+        self._pending = {}
+        self._thread = None
+        self._closed = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def num_pending(self) -> int:
+        return len(self._pending)
+
+    def track(self, hash, submitted_at=None, timeout=None) -> Future:
+        """Track a submitted transaction, the future resolves to its
+        confirmation data, or None when it is not confirmed in time
+        :param hash: String, hash of the transaction
+        :param submitted_at: Float, monotonic time the transaction was submitted
+        :param timeout: Float, seconds after submission to track, defaults
+            to the tracker timeout
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        pending = PendingTransaction(
+            hash,
+            future,
+            submitted_at or monotonic(),
+            self.timeout if timeout is None else timeout,
+        )
+
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("Confirmation tracker is closed")
+            self._pending[hash] = pending
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="zerochain-confirmation", daemon=True
+                )
+                self._thread.start()
+        return future
+
+    def close(self):
+        """Stop following blocks, transactions still pending resolve to None"""
+        with self._lock:
+            self._closed.set()
+            pending, self._pending = self._pending, {}
+        for transaction in pending.values():
+            transaction.future.set_result(None)
+
+    def json(self):
+        return {
+            "num_pending": self.num_pending,
+            "last_round": self.last_round,
+            "num_blocks": self.num_blocks,
+            "num_confirmed_by_block": self.num_confirmed_by_block,
+            "num_confirmed_by_query": self.num_confirmed_by_query,
+            "num_expired": self.num_expired,
+        }
+
+    def _run(self):
+        while not self._closed.is_set():
+            with self._lock:
+                if not self._pending:
+                    # Following restarts from the latest block on next track
+                    self._thread = None
+                    self.last_round = None
+                    return
+
+            block_time = self._get_block_time()
+            try:
+                self._follow_blocks()
+            except Exception:
+                pass
+            self._query_stragglers(block_time)
+            self._expire()
+            self._closed.wait(block_time)
+
+        with self._lock:
+            self._thread = None
+
+    def _follow_blocks(self):
+        """Request the blocks finalized since the last pass, resolving every
+        pending hash found in them"""
+        latest_block = self.client.get_latest_finalized_block()
+        latest_round = int(latest_block["round"])
+        if self.last_round is None:
+            self.last_round = latest_round - self.lookback - 1
+        self.last_round = max(self.last_round, latest_round - self.max_catch_up)
+
+        while self.last_round < latest_round and self._pending:
+            round_num = self.last_round + 1
+            block = self.client.get_block_by_round(round_num, content="full")
+            self._match_block(block.get("block", block))
+            self.num_blocks += 1
+            self.last_round = round_num
+
+    def _match_block(self, block):
+        for transaction in block.get("transactions") or []:
+            with self._lock:
+                pending = self._pending.pop(transaction.get("hash"), None)
+            if not pending:
+                continue
+
+            self.num_confirmed_by_block += 1
+            pending.future.set_result(
+                {
+                    "hash": pending.hash,
+                    "block_hash": block.get("hash"),
+                    "round": block.get("round"),
+                    "creation_date": block.get("creation_date"),
+                    "txn": transaction,
+                    "transaction_status": transaction.get("transaction_status", 1),
+                }
+            )
+
+    def _query_stragglers(self, block_time):
+        """Query each hash pending longer than straggler_blocks on its own"""
+        now = monotonic()
+        straggle_after = self.straggler_blocks * block_time
+        with self._lock:
+            stragglers = [
+                pending
+                for pending in self._pending.values()
+                if now - pending.submitted_at >= straggle_after
+                and (
+                    pending.queried_at is None
+                    or now - pending.queried_at >= 2 * block_time
+                )
+            ]
+
+        for pending in stragglers:
+            pending.queried_at = now
+            try:
+                confirmation_data = self.client.check_transaction_status(pending.hash)
+            except Exception:
+                continue
+            if not isinstance(confirmation_data, dict):
+                continue
+            if confirmation_data.get("transaction_status") not in (1, 2):
+                continue
+
+            with self._lock:
+                if not self._pending.pop(pending.hash, None):
+                    continue
+            self.num_confirmed_by_query += 1
+            pending.future.set_result(confirmation_data)
+
+    def _expire(self):
+        now = monotonic()
+        with self._lock:
+            expired = [
+                self._pending.pop(hash)
+                for hash, pending in list(self._pending.items())
+                if now >= pending.expires_at
+            ]
+        for pending in expired:
+            self.num_expired += 1
+            pending.future.set_result(None)
+
+    def _get_block_time(self):
+        block_time = self.client._get_cached_block_time()
+        if block_time is not None:
+            return block_time
+
+        try:
+            chain_stats = self.client.get_chain_stats()
+        except Exception:
+            chain_stats = None
+        return self.client._observe_block_time(chain_stats)
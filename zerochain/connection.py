@@ -1,16 +1,72 @@
 import json
+import copy
 from abc import ABC
-from time import sleep
+from time import monotonic, sleep
 from requests.models import Response
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from zerochain.const import Endpoints
-from zerochain.utils import hash_string
+import random
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from zerochain.const import (
+    BLOCK_TIME_MAX_AGE,
+    DEFAULT_BLOCK_TIME,
+    DEFAULT_BROADCAST_MIN_ACKS,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_REQUEST_TIMEOUT,
+    ConsensusFingerprint,
+    ConsensusStrategy,
+    Endpoints,
+    QuorumPolicy,
+)
+from zerochain.utils import hash_bytes, hash_string
 from zerochain.exceptions import ConsensusError
+from zerochain.deadline import Deadline
+from zerochain.consensus import AckTally, ConsensusTally
+from zerochain.confirmation import ConfirmationTracker
+from zerochain.executor import get_default_executor
+from zerochain.signer import get_default_signer
+
+_confirmation_tracker_lock = threading.Lock()
 
 
 class ConnectionBase(ABC):
+    deadline = None
+    executor = None
+    consensus_strategy = None
+    hedge_delay = None
+
+    def with_deadline(self, seconds):
+        """Copy bound to a deadline, every request, consensus round and
+        confirmation poll made through the copy ends by the deadline
+        :param seconds: Float or Deadline, a Deadline can be shared across copies
+        """
+        bound = copy.copy(self)
+        bound.deadline = Deadline.from_value(seconds)
+        return bound
+
+    def with_strategy(self, strategy, hedge_delay=None):
+        """Copy bound to a consensus strategy, every consensus round made
+        through the copy uses it rather than the strategy of the network
+        :param strategy: String, ConsensusStrategy
+        :param hedge_delay: Float, seconds before a hedged round adds a worker,
+            defaults to the hedge delay of the network
+        """
+        bound = copy.copy(self)
+        bound.consensus_strategy = strategy
+        if hedge_delay is not None:
+            bound.hedge_delay = hedge_delay
+        return bound
+
+    def with_executor(self, executor):
+        """Copy fanning requests out on its own executor rather than the
+        executor of the network, for callers running many rounds at once
+        :param executor: Executor, sized to the requests the caller runs at once
+        """
+        bound = copy.copy(self)
+        bound.executor = executor
+        return bound
+
     def _check_status_code(
         self,
         res,
@@ -46,7 +102,14 @@ class ConnectionBase(ABC):
                 return res.text
 
     def _request(
-        self, url, method="GET", headers=None, data=None, files=None
+        self,
+        url,
+        method="GET",
+        headers=None,
+        data=None,
+        files=None,
+        worker=None,
+        timeout=None,
     ) -> Response:
         """Base request method for model requests
         Returns valid res data as json string
@@ -55,59 +118,112 @@ class ConnectionBase(ABC):
         :param headers: Dict, headers keys and values
         :param data: Dict
         :param files: Tuple or List
-        :param error_message: String, message to display if error
+        :param worker: Worker, request statistics are recorded on the worker
+        :param timeout: Tuple, connect and read timeout, defaults to network
+            setting capped by the deadline
         """
+        if timeout is None:
+            timeout = self._get_request_timeout(self._get_deadline())
+        session_pool = self._get_session_pool()
+        if worker:
+            start_time = worker.stats.start_request()
+
         try:
-            res = requests.request(method, url, headers=headers, data=data, files=files)
-            return res
+            if session_pool:
+                res = session_pool.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data,
+                    files=files,
+                    timeout=timeout,
+                )
+            else:
+                res = requests.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data,
+                    files=files,
+                    timeout=timeout,
+                )
 
         except requests.exceptions.RequestException as e:
-            return e
+            res = e
 
-    def _append_response_to_consensus_data(self, response_data, consensus_data):
-        """Build consensus data as each response comes in"""
-        confirmation_weight = self._calculate_confirmation_weighting(response_data)
+        if worker:
+            self._record_worker_result(worker, start_time, res)
 
-        # Build response hash string
+        return res
+
+    def _record_worker_result(self, worker, start_time, res):
+        success = self._is_successful_response(res)
+        worker.stats.end_request(start_time, success)
+        worker.breaker.record(success)
+
+    def _is_successful_response(self, res):
+        """Worker answered, client errors such as missing values are answers"""
+        return not isinstance(res, Exception) and res.status_code < 500
+
+    def _tally_response(
+        self, tally, response, endpoint, empty_return_value=None, fingerprint=None
+    ):
+        """Add worker response to the consensus tally, keyed by fingerprint.
+        Successful JSON bodies are fingerprinted without being parsed, the raw
+        response is kept so only the winning body is parsed"""
+        if isinstance(response, Exception):
+            # Worker could not be reached, it counts as responded without weight
+            tally.skip()
+            return
+
+        if response.status_code == 200 and self._is_json_content(response.content):
+            content = response.content
+            if fingerprint == ConsensusFingerprint.CANONICAL:
+                content = self._canonical_content(content)
+            tally.add(hash_bytes(content), response)
+            return
+
+        # Error responses and other text bodies, such as error pages served
+        # with a 200, are parsed so equivalent errors and empty return values
+        # land in the same bucket, text is given half weight
+        response_data = self._parse_consensus_response(
+            response, endpoint, empty_return_value
+        )
+        confirmation_weight = self._calculate_confirmation_weighting(response_data)
         response_hash_string = hash_string(json.dumps(response_data))
+        tally.add(response_hash_string, response, confirmation_weight)
 
-        # Check if key exists in response map
-        existing_response_key = consensus_data.get(response_hash_string)
-
-        # Increment consensus count if key exists
-        if existing_response_key:
-            prev_count = existing_response_key.get("num_confirmations")
-            consensus_data[response_hash_string] = {
-                "data": response_data,
-                "num_confirmations": prev_count + confirmation_weight,
-            }
-        # Add key to response map if does not exists
-        else:
-            consensus_data[response_hash_string] = {
-                "data": response_data,
-                "num_confirmations": confirmation_weight,
-            }
-
-    def _check_highest_consensus(self, consensus_data, num_total_workers=0):
-        """Check consensus data for highest confirmation count,
-        return object and percentage of confirmations"""
-        greatest_num_confirmations = 0
-        key_for_highest_confirmations = ""
-
-        # Get data for highest confirmation count
-        for key, value in consensus_data.items():
-            num_confirmations = value.get("num_confirmations")
-            if num_confirmations >= greatest_num_confirmations:
-                greatest_num_confirmations = num_confirmations
-                key_for_highest_confirmations = key
-
-        # Check num confirmations reaches min_confirm amount
-        percentage_confirmations = (
-            greatest_num_confirmations / num_total_workers
-        ) * 100
-        highest_confirmations = consensus_data.get(key_for_highest_confirmations)
-
-        return (percentage_confirmations, highest_confirmations.get("data"))
+    def _parse_consensus_response(self, response, endpoint, empty_return_value=None):
+        response_data = self._check_status_code(response)
+        return self._handle_empty_return_value(
+            response_data, empty_return_value, endpoint
+        )
+
+    def _is_json_content(self, content):
+        """Body is a JSON object or array, judged by its first character
+        rather than parsing it"""
+        return content.lstrip()[:1] in (b"{", b"[")
+
+    def _canonical_content(self, content):
+        """Key sorted compact JSON encoding, non JSON bodies are left as is"""
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return content
+        return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+    def _check_tally(self, tally):
+        """Return True once consensus is reached, raise as soon as the
+        outstanding workers can no longer lift the leader to consensus"""
+        if tally.is_reached():
+            return True
+
+        if tally.is_impossible():
+            raise ConsensusError(
+                f"Minimum consesus requirement not met, check network config settings or network worker availability - {tally.describe()}"
+            )
+
+        return False
 
     # -----------------------------------------------------
 
@@ -121,61 +237,343 @@ class ConnectionBase(ABC):
         headers=None,
         empty_return_value=None,
         min_confirmation=None,
+        fingerprint=None,
+        strategy=None,
+        hedge_delay=None,
+        deadline=None,
     ) -> dict:
         """Get response from all workers, consolidate responses to get consesus of data,
         return data of highest number of confirmations of a response
         :param worker: String, name of worker to request data,
         :param endpoint: String, endpoint to request from worker
+        :param fingerprint: String, ConsensusFingerprint mode, defaults to network setting
+        :param strategy: String, ConsensusStrategy, defaults to network setting
+        :param hedge_delay: Float, seconds before a hedged round adds a worker,
+            defaults to network setting, adapting to worker latency when unset
+        :param deadline: Float or Deadline, raise DeadlineExceededError when
+            consensus is not reached in time, defaults to the bound deadline
         """
+        consensus = self._consensus_params(
+            headers, empty_return_value, min_confirmation, fingerprint, strategy
+        )
+        cache_key = self._response_cache_key(
+            worker, method, endpoint, data, files, consensus
+        )
+        if cache_key:
+            found, response_data = self._get_response_cache().get(cache_key)
+            if found:
+                return response_data
+
+        deadline = Deadline.from_value(deadline) or self._get_deadline()
+
+        def consensus_round():
+            return self._consensus_round(
+                worker,
+                endpoint,
+                method,
+                data,
+                files,
+                headers,
+                empty_return_value,
+                min_confirmation,
+                fingerprint,
+                strategy,
+                hedge_delay,
+                deadline,
+            )
+
+        # Identical reads in flight at the same time share one round
+        flight_key = self._single_flight_key(
+            worker, method, endpoint, data, files, consensus
+        )
+        if flight_key:
+            response_data = self._get_single_flight().do(
+                flight_key, consensus_round, deadline
+            )
+        else:
+            response_data = consensus_round()
+
+        self._cache_response(cache_key, endpoint, response_data)
+        return response_data
+
+    def _consensus_round(
+        self,
+        worker,
+        endpoint,
+        method="GET",
+        data=None,
+        files=None,
+        headers=None,
+        empty_return_value=None,
+        min_confirmation=None,
+        fingerprint=None,
+        strategy=None,
+        hedge_delay=None,
+        deadline=None,
+    ) -> dict:
+        """Single consensus round across the workers, uncached"""
         if not min_confirmation:
             min_confirmation = self._get_min_confirmation()
-        worker_string = worker
-        workers = self._get_workers(worker_string)
-        num_requests = 0
-
+        if not fingerprint:
+            fingerprint = self._get_consensus_fingerprint()
+        if not strategy:
+            strategy = self._get_consensus_strategy()
+        if hedge_delay is None:
+            hedge_delay = self._get_hedge_delay()
+        deadline = Deadline.from_value(deadline) or self._get_deadline()
+        if deadline:
+            deadline.check(f"Deadline exceeded before requesting {endpoint}")
+
+        tally, queued_workers = self._start_consensus_round(worker, min_confirmation)
+        num_initial_workers = self._num_initial_workers(
+            tally, strategy, len(queued_workers)
+        )
+        if hedge_delay is None:
+            hedge_delay = self._adaptive_hedge_delay(
+                queued_workers[:num_initial_workers]
+            )
         future_responses = []
-        consensus_data = {}
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            for worker in workers:
-                url = f"{worker.url}/{endpoint}"
-                future = executor.submit(
-                    self._request,
-                    method=method,
-                    url=url,
-                    data=data,
-                    files=files,
-                    headers=headers,
-                )
-
-                future_responses.append(future)
 
-            for future in as_completed(future_responses):
-                response = future.result()
+        executor = self._get_executor()
+
+        def submit_next_worker():
+            worker = queued_workers.pop(0)
+            future = executor.submit(
+                self._request,
+                method=method,
+                url=f"{worker.url}/{endpoint}",
+                data=data,
+                files=files,
+                headers=headers,
+                worker=worker,
+                timeout=self._get_request_timeout(deadline),
+            )
+            future_responses.append(future)
+            return future
 
-                # Error checking and parsing
-                response_data = self._check_status_code(response)
-                response_data = self._handle_empty_return_value(
-                    response_data, empty_return_value, endpoint
+        try:
+            pending = {submit_next_worker() for _ in range(num_initial_workers)}
+
+            while pending:
+                # Hedged rounds only wait hedge_delay before adding a worker
+                timeout = hedge_delay if queued_workers else None
+                if deadline:
+                    timeout = deadline.cap(timeout)
+                done, pending = wait(pending, timeout, FIRST_COMPLETED)
+
+                if not done:
+                    self._check_deadline(deadline, endpoint, tally)
+                    if queued_workers:
+                        pending.add(submit_next_worker())
+                    continue
+
+                for future in done:
+                    self._tally_response(
+                        tally,
+                        future.result(),
+                        endpoint,
+                        empty_return_value,
+                        fingerprint,
+                    )
+                    if self._check_tally(tally):
+                        return self._parse_consensus_response(
+                            tally.leader_data, endpoint, empty_return_value
+                        )
+
+                # Expand on disagreement, when requests in flight can no
+                # longer lift the leader to consensus on their own
+                while queued_workers and not tally.can_reach(len(pending)):
+                    pending.add(submit_next_worker())
+        finally:
+            # Drop requests still queued once the outcome is known, requests
+            # already running finish in the background without being awaited
+            for future in future_responses:
+                future.cancel()
+
+    def _broadcast_to_workers(
+        self,
+        worker,
+        endpoint,
+        data=None,
+        headers=None,
+        is_ack=None,
+        min_acks=None,
+        deadline=None,
+    ):
+        """Post to every worker at once and return after min_acks of them
+        acknowledge, requests to the remaining workers finish in the background
+        Returns data of the first acknowledgement, or of the first rejection
+        once too few workers are left to acknowledge
+        :param worker: String, name of workers to post to
+        :param endpoint: String, endpoint to post to
+        :param is_ack: Callable, True when parsed response data acknowledges
+            the post, defaults to any successful response
+        :param min_acks: Int, acknowledgements needed, defaults to network setting
+        :param deadline: Float or Deadline, raise DeadlineExceededError when
+            not acknowledged in time, defaults to the bound deadline
+        """
+        if not min_acks:
+            min_acks = self._get_broadcast_min_acks()
+        deadline = Deadline.from_value(deadline) or self._get_deadline()
+        if deadline:
+            deadline.check(f"Deadline exceeded before posting to {endpoint}")
+
+        workers = [
+            worker
+            for worker in self._get_workers(worker)
+            if worker.breaker.allow_request()
+        ]
+        if not workers:
+            raise ConsensusError(
+                f"No {worker} available, circuit breakers of every worker are open"
+            )
+
+        executor = self._get_executor()
+        timeout = self._get_request_timeout(deadline)
+        pending = {
+            executor.submit(
+                self._request,
+                method="POST",
+                url=f"{worker.url}/{endpoint}",
+                data=data,
+                headers=headers,
+                worker=worker,
+                timeout=timeout,
+            )
+            for worker in workers
+        }
+
+        tally = AckTally(len(workers), min_acks)
+        while pending:
+            done, pending = wait(
+                pending, deadline.cap(None) if deadline else None, FIRST_COMPLETED
+            )
+            if not done:
+                deadline.check(
+                    f"Deadline exceeded waiting on {endpoint} - {tally.describe()}"
                 )
+                continue
+
+            for future in done:
+                self._tally_ack(tally, future.result(), is_ack)
+            if tally.is_reached():
+                return tally.ack_data
+            if tally.is_impossible():
+                break
+
+        return self._broadcast_failure(tally, worker, endpoint)
+
+    def _tally_ack(self, tally, response, is_ack=None):
+        if isinstance(response, Exception):
+            tally.skip()
+            return
+
+        response_data = self._check_status_code(response)
+        tally.add(
+            response_data,
+            response.status_code == 200 and (not is_ack or is_ack(response_data)),
+        )
+
+    def _broadcast_failure(self, tally, worker, endpoint):
+        """Data of the first rejection, as a consensus round returns error
+        text, raise when no worker answered at all"""
+        if tally.rejection_data is not None:
+            return tally.rejection_data
+        raise ConsensusError(
+            f"Broadcast of {endpoint} to {worker} not acknowledged - {tally.describe()}"
+        )
+
+    def _check_deadline(self, deadline, endpoint, tally):
+        if deadline:
+            deadline.check(
+                f"Deadline exceeded waiting for consensus on {endpoint} - {tally.describe()}"
+            )
+
+    def _consensus_params(
+        self,
+        headers=None,
+        empty_return_value=None,
+        min_confirmation=None,
+        fingerprint=None,
+        strategy=None,
+    ):
+        """Hashable arguments deciding the outcome of a consensus read, with
+        network defaults applied, reads only share a result when these match"""
+        return (
+            min_confirmation or self._get_min_confirmation(),
+            fingerprint or self._get_consensus_fingerprint(),
+            strategy or self._get_consensus_strategy(),
+            json.dumps(empty_return_value, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True, default=str),
+        )
+
+    def _response_cache_key(
+        self, worker, method, endpoint, data=None, files=None, consensus=None
+    ):
+        """Cache key of a consensus read, None when it is not to be cached"""
+        cache = self._get_response_cache()
+        if not cache or not cache.is_cacheable(method, endpoint, data, files):
+            return None
+        return cache.key(worker, method, endpoint, data, consensus)
+
+    def _single_flight_key(
+        self, worker, method, endpoint, data=None, files=None, consensus=None
+    ):
+        """Coalescing key of a read, None for writes which must each be sent
+        :param consensus: Hashable, consensus arguments of the read, reads
+            only share a round when these match
+        """
+        if method != "GET" or files or not self._get_single_flight():
+            return None
+        return (worker, method, endpoint, data, consensus)
+
+    def _cache_response(self, cache_key, endpoint, response_data):
+        # Error text of a failed read is never cached
+        if cache_key and isinstance(response_data, (dict, list)):
+            self._get_response_cache().set(cache_key, endpoint, response_data)
+
+    def _order_workers(self, workers):
+        """Healthy, fast workers first, ties broken randomly to spread load"""
+        return sorted(
+            workers, key=lambda worker: (worker.stats.score(), random.random())
+        )
+
+    def _adaptive_hedge_delay(self, workers):
+        """Hedge once the slowest of the first workers passes its usual latency"""
+        estimates = [worker.stats.latency_estimate() for worker in workers]
+        estimates = [estimate for estimate in estimates if estimate is not None]
+        if not estimates:
+            return DEFAULT_HEDGE_DELAY
+        return max(estimates)
+
+    def _num_initial_workers(self, tally, strategy, num_available):
+        if strategy == ConsensusStrategy.HEDGED:
+            return min(tally.num_needed(), num_available)
+        return num_available
+
+    def _start_consensus_round(self, worker, min_confirmation):
+        """Build the tally and worker queue of a consensus round, workers with
+        an open circuit breaker are left out and counted per quorum policy"""
+        workers = self._get_workers(worker)
+        available_workers = [
+            worker for worker in workers if worker.breaker.allow_request()
+        ]
+
+        if self._get_quorum_policy() == QuorumPolicy.AVAILABLE:
+            tally = ConsensusTally(len(available_workers), min_confirmation)
+        else:
+            tally = ConsensusTally(len(workers), min_confirmation)
+            tally.skip(len(workers) - len(available_workers))
 
-                # Build consesus data object
-                num_requests += 1
-                self._append_response_to_consensus_data(response_data, consensus_data)
-
-                # Check highest percentage of consensus as each future is completed
-                percentage_consensus, highest_consensus = self._check_highest_consensus(
-                    consensus_data, len(workers)
-                )
+        if not available_workers:
+            raise ConsensusError(
+                f"No {worker} available, circuit breakers of every worker are open"
+            )
 
-                # Raise exception if minimum consensus not acheived
-                is_min_consensus_reached = self._check_min_consensus_achieved(
-                    percentage_consensus, min_confirmation, num_requests, len(workers)
-                )
+        # Raises when too many workers are ejected for consensus to be reached
+        self._check_tally(tally)
 
-                if is_min_consensus_reached:
-                    executor.shutdown(wait=False)
-                    return highest_consensus
+        return tally, self._order_workers(available_workers)
 
     def _calculate_confirmation_weighting(
         self, response_data, endpoint="", current_weighting=1
@@ -189,35 +587,129 @@ class ConnectionBase(ABC):
             return weight
         return current_weighting
 
-    def _check_min_consensus_achieved(
-        self, percentage_consensus, min_confirmation, num_requests, num_workers
-    ):
-        if num_requests >= num_workers:
-            if int(percentage_consensus) < min_confirmation:
-                raise ConsensusError(
-                    "Minimum consesus requirement not met, check network config settings or network worker availability"
-                )
-        else:
-            if int(percentage_consensus) > min_confirmation:
-                return True
-
-        return False
-
-    def _get_workers(self, worker):
+    def _get_network(self):
         if self.__class__.__name__ == "Network":
-            return getattr(self, worker)
+            return self
         elif self.__class__.__name__ == "Allocation":
-            return getattr(self.client.network, worker)
+            return getattr(self.client, "network", None)
         else:
-            return getattr(self.network, worker)
+            return getattr(self, "network", None)
+
+    def _get_workers(self, worker):
+        return getattr(self._get_network(), worker)
 
     def _get_min_confirmation(self):
-        if self.__class__.__name__ == "Network":
-            return getattr(self, "min_confirmation")
-        elif self.__class__.__name__ == "Allocation":
-            return getattr(self.client.network, "min_confirmation")
-        else:
-            return getattr(self.network, "min_confirmation")
+        return getattr(self._get_network(), "min_confirmation")
+
+    def _get_consensus_fingerprint(self):
+        return getattr(
+            self._get_network(), "consensus_fingerprint", ConsensusFingerprint.RAW
+        )
+
+    def _get_consensus_strategy(self):
+        """Strategy bound to this object or the client it acts for, then the
+        strategy of the network"""
+        return (
+            self.consensus_strategy
+            or getattr(getattr(self, "client", None), "consensus_strategy", None)
+            or getattr(self._get_network(), "consensus_strategy", None)
+            or ConsensusStrategy.ALL
+        )
+
+    def _get_hedge_delay(self):
+        """Hedge delay bound to this object or the client it acts for, then
+        the hedge delay of the network, None adapts to worker latency"""
+        for owner in (self, getattr(self, "client", None), self._get_network()):
+            hedge_delay = getattr(owner, "hedge_delay", None)
+            if hedge_delay is not None:
+                return hedge_delay
+        return None
+
+    def _get_quorum_policy(self):
+        return getattr(self._get_network(), "quorum_policy", QuorumPolicy.ALL)
+
+    def _get_executor(self):
+        """Executor bound to this object or the client it acts for, then the
+        executor of the network, falls back to the process wide executor"""
+        return (
+            self.executor
+            or getattr(getattr(self, "client", None), "executor", None)
+            or getattr(self._get_network(), "executor", None)
+            or get_default_executor()
+        )
+
+    def _get_cached_block_time(self):
+        """Seconds per block observed on the network, None when not yet
+        observed or the observation is too old"""
+        network = self._get_network()
+        observed_at = getattr(network, "block_time_observed_at", None)
+        if observed_at is None or monotonic() - observed_at > BLOCK_TIME_MAX_AGE:
+            return None
+        return network.block_time
+
+    def _observe_block_time(self, chain_stats):
+        """Store the mean block finalization time of chain stats on the network,
+        the default block time is stored when stats are unavailable"""
+        try:
+            block_time = float(chain_stats["mean"]) / 1000
+        except (TypeError, KeyError, ValueError):
+            block_time = DEFAULT_BLOCK_TIME
+
+        network = self._get_network()
+        network.block_time = block_time
+        network.block_time_observed_at = monotonic()
+        return block_time
+
+    def _get_deadline(self):
+        """Deadline bound to this object, or to the client it acts for"""
+        return self.deadline or getattr(getattr(self, "client", None), "deadline", None)
+
+    def _get_request_timeout(self, deadline=None):
+        """Connect and read timeout of the network, neither runs past the deadline"""
+        timeout = getattr(self._get_network(), "timeout", DEFAULT_REQUEST_TIMEOUT)
+        if not deadline:
+            return timeout
+        deadline.check()
+        return tuple(deadline.cap(seconds) for seconds in timeout)
+
+    def _get_signer(self):
+        """Signer of this object, then of its network, then the process default"""
+        signer = getattr(self, "signer", None)
+        return (
+            signer
+            or getattr(self._get_network(), "signer", None)
+            or get_default_signer()
+        )
+
+    def _get_confirmation_tracker(self):
+        """Confirmation tracker of the network, started on first use"""
+        network = self._get_network()
+        with _confirmation_tracker_lock:
+            if not getattr(network, "confirmation_tracker", None):
+                network.confirmation_tracker = self._build_confirmation_tracker()
+            return network.confirmation_tracker
+
+    def _build_confirmation_tracker(self):
+        return ConfirmationTracker(self)
+
+    def _get_broadcast_min_acks(self):
+        return getattr(
+            self._get_network(), "broadcast_min_acks", DEFAULT_BROADCAST_MIN_ACKS
+        )
+
+    def _get_journal(self):
+        return getattr(self._get_network(), "journal", None)
+
+    def _get_single_flight(self):
+        return getattr(self._get_network(), "single_flight", None)
+
+    def _get_response_cache(self):
+        return getattr(self._get_network(), "cache", None)
+
+    def _get_session_pool(self):
+        """Shared keep-alive sessions of the network, None when requests
+        are made outside of a configured network"""
+        return getattr(self._get_network(), "session_pool", None)
 
     def _handle_empty_return_value(self, response, empty_value: dict, endpoint: str):
         try:
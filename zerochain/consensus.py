@@ -0,0 +1,151 @@
+import math
+
+
+class ConsensusTally:
+    """Running tally of worker responses for a single consensus round
+
+    Responses with the same key share one bucket holding the first payload
+    seen for that key. The leading bucket and its weight are updated as each
+    response is added, so every check on the tally is constant time.
+    :param num_workers: Int, number of workers the percentage is taken over
+    :param min_confirmation: Int, percentage of workers needed for consensus
+    """
+
+    def __init__(self, num_workers, min_confirmation) -> None:
+        self.num_workers = num_workers
+        self.min_confirmation = min_confirmation
+        self.num_responses = 0
+        self.buckets = {}
+        self.leader_key = None
+        self.leader_weight = 0
+
+    def add(self, key, data, weight=1):
+        """Add a response to its bucket and move the lead if it overtakes
+        :param key: String, fingerprint of the response
+        :param data: Response payload, only kept for the first response of a key
+        :param weight: Float, confirmation weight of the response
+        """
+        self.num_responses += 1
+
+        bucket = self.buckets.get(key)
+        if not bucket:
+            bucket = {"data": data, "num_confirmations": 0}
+            self.buckets[key] = bucket
+
+        bucket["num_confirmations"] += weight
+
+        if bucket["num_confirmations"] >= self.leader_weight:
+            self.leader_key = key
+            self.leader_weight = bucket["num_confirmations"]
+
+    def skip(self, num_workers=1):
+        """Count workers that gave no answer, they add no weight to any bucket"""
+        self.num_responses += num_workers
+
+    @property
+    def leader_data(self):
+        if self.leader_key is None:
+            return None
+        return self.buckets[self.leader_key]["data"]
+
+    @property
+    def num_remaining(self) -> int:
+        return max(self.num_workers - self.num_responses, 0)
+
+    def percentage(self, weight=None) -> float:
+        if weight is None:
+            weight = self.leader_weight
+        if not self.num_workers:
+            return 0
+        return (weight / self.num_workers) * 100
+
+    def is_complete(self) -> bool:
+        return self.num_responses >= self.num_workers
+
+    def is_reached(self) -> bool:
+        """Consensus is reached early once the leader passes min confirmation,
+        once every worker has responded it only needs to meet it"""
+        percentage = int(self.percentage())
+        if self.is_complete():
+            return percentage >= self.min_confirmation
+        return percentage > self.min_confirmation
+
+    def num_needed(self) -> int:
+        """Fewest agreeing responses that pass min confirmation"""
+        num_needed = math.ceil((self.min_confirmation + 1) * self.num_workers / 100)
+        return min(max(num_needed, 1), self.num_workers)
+
+    def can_reach(self, num_in_flight) -> bool:
+        """True when the in flight requests alone could carry the leader past
+        min confirmation"""
+        best_weight = self.leader_weight + num_in_flight
+        return int(self.percentage(best_weight)) > self.min_confirmation
+
+    def is_impossible(self) -> bool:
+        """True when the leader could not reach min confirmation even if every
+        outstanding worker agreed with it"""
+        best_weight = self.leader_weight + self.num_remaining
+        return int(self.percentage(best_weight)) < self.min_confirmation
+
+    def describe(self) -> str:
+        """Diagnostic of the round, weight per bucket by shortened key"""
+        best_percentage = self.percentage(self.leader_weight + self.num_remaining)
+        tallies = ", ".join(
+            f"{key[:8]}: {weight}" for key, weight in self.summary().items()
+        )
+        return (
+            f"{self.num_responses}/{self.num_workers} workers responded, "
+            f"best achievable {best_percentage:.1f}% of {self.min_confirmation}% required, "
+            f"tallies {{{tallies}}}"
+        )
+
+    def summary(self) -> dict:
+        """Confirmation weight per response key"""
+        return {
+            key: bucket["num_confirmations"] for key, bucket in self.buckets.items()
+        }
+
+
+class AckTally:
+    """Running count of worker acknowledgements for a single broadcast
+
+    Only the data of the first acknowledgement and of the first rejection
+    are kept, unreachable workers count as responded without either.
+    :param num_workers: Int, number of workers the broadcast was sent to
+    :param min_acks: Int, acknowledgements needed
+    """
+
+    def __init__(self, num_workers, min_acks) -> None:
+        self.num_workers = num_workers
+        self.min_acks = min(min_acks, num_workers)
+        self.num_responses = 0
+        self.num_acks = 0
+        self.ack_data = None
+        self.rejection_data = None
+
+    def add(self, response_data, is_ack):
+        self.num_responses += 1
+        if is_ack:
+            self.num_acks += 1
+            if self.num_acks == 1:
+                self.ack_data = response_data
+        elif self.rejection_data is None:
+            self.rejection_data = response_data
+
+    def skip(self):
+        self.num_responses += 1
+
+    def is_reached(self) -> bool:
+        return self.num_acks >= self.min_acks
+
+    def is_impossible(self) -> bool:
+        """True when the outstanding workers could not make up the
+        acknowledgements still needed"""
+        num_remaining = self.num_workers - self.num_responses
+        return self.num_acks + num_remaining < self.min_acks
+
+    def describe(self) -> str:
+        return (
+            f"{self.num_acks} of {self.num_workers} workers acknowledged, "
+            f"{self.min_acks} needed"
+        )
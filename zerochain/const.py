@@ -72,6 +72,78 @@ class TransactionType:
     SMART_CONTRACT = 1000
 
 
+# Seconds a hedged consensus round waits on a worker before adding another,
+# used until worker latency has been observed
+DEFAULT_HEDGE_DELAY = 0.5
+
+# Seconds to connect to, and then wait on, a worker
+DEFAULT_REQUEST_TIMEOUT = (5, 30)
+
+# Seconds per block until the block time is observed from chain stats,
+# observations are refreshed once older than BLOCK_TIME_MAX_AGE seconds
+DEFAULT_BLOCK_TIME = 1.0
+BLOCK_TIME_MAX_AGE = 300
+
+# Seconds a worker discovery snapshot is trusted without a DNS request,
+# snapshots are revalidated against the magic block on every start
+DISCOVERY_MAX_AGE = 24 * 60 * 60
+
+# Seconds a transaction is polled for confirmation
+DEFAULT_CONFIRMATION_TIMEOUT = 30
+
+# Miners acknowledging a broadcast transaction before submission returns,
+# the remaining miners keep receiving it in the background
+DEFAULT_BROADCAST_MIN_ACKS = 2
+
+
+class ConsensusStrategy:
+    # Query every worker at once
+    ALL = "all"
+    # Query just enough workers for consensus, add more on disagreement or delay
+    HEDGED = "hedged"
+
+
+class QuorumPolicy:
+    # Percentage is taken over every worker, ejected workers count as missing
+    ALL = "all"
+    # Percentage is taken over workers whose circuit breaker is not open
+    AVAILABLE = "available"
+
+
+class BreakerState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class SignerBackend:
+    # Node process spawned for every operation
+    NODE = "node"
+    # Long lived Node processes serving every operation
+    PERSISTENT = "persistent"
+    # herumi BLS library called in process
+    NATIVE = "native"
+
+
+class TransactionState:
+    # Built and signed, not yet acknowledged by miners
+    BUILT = "built"
+    # Acknowledged by miners, awaiting confirmation
+    SUBMITTED = "submitted"
+    CONFIRMED = "confirmed"
+    # Rejected by miners, or confirmed as failed
+    FAILED = "failed"
+    # Not confirmed before the confirmation timeout
+    EXPIRED = "expired"
+
+
+class ConsensusFingerprint:
+    # Hash raw response bytes, workers must return byte identical bodies
+    RAW = "raw"
+    # Hash key sorted JSON, tolerates workers differing only in key order
+    CANONICAL = "canonical"
+
+
 class Endpoints:
     NETWORK_DNS = "dns/network"
     register_wallet = "v1/client/put"
@@ -163,3 +235,13 @@ class Endpoints:
     ZEROBOX_SERVER_SAVE_MNEMONIC_ENDPOINT = "/savemnemonic"
     ZEROBOX_SERVER_DELETE_MNEMONIC_ENDPOINT = "/shareinfo"
     ZEROBOX_SERVER_REFERRALS_INFO_ENDPOINT = "/getreferrals"
+
+
+# Seconds slow changing smart contract config is served from the response cache
+DEFAULT_CACHE_TTLS = {
+    Endpoints.SC_GET_CONFIG: 60,
+    Endpoints.GET_LOCK_CONFIG: 60,
+    Endpoints.GET_VESTING_CONFIG: 60,
+    Endpoints.SC_CONFIGS: 60,
+    Endpoints.SC_BLOBBER_STATS: 30,
+}
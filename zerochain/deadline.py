@@ -0,0 +1,40 @@
+from time import monotonic
+
+from zerochain.exceptions import DeadlineExceededError
+
+
+class Deadline:
+    """Wall time budget shared by every request, retry and poll of an SDK call
+    :param seconds: Float, seconds from now until the deadline expires
+    """
+
+    def __init__(self, seconds) -> None:
+        self.seconds = seconds
+        self.expires_at = monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(self.expires_at - monotonic(), 0)
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, message="Deadline exceeded"):
+        if self.expired():
+            raise DeadlineExceededError(f"{message} - budget of {self.seconds}s spent")
+
+    def cap(self, seconds):
+        """Shorten a timeout so it ends no later than the deadline, None waits
+        for the deadline itself"""
+        if seconds is None:
+            return self.remaining()
+        return min(seconds, self.remaining())
+
+    @staticmethod
+    def from_value(value):
+        """Deadline from seconds, an existing deadline is returned as is"""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return Deadline(value)
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.seconds})"
@@ -0,0 +1,183 @@
+import os
+import re
+import json
+import threading
+from time import time
+
+from zerochain.const import DISCOVERY_MAX_AGE, Endpoints
+from zerochain.utils import get_home_path, request_dns_workers
+
+# Revalidation running for each snapshot path, shared by every network started
+# from the snapshot while it runs
+_revalidations = {}
+_revalidations_lock = threading.Lock()
+
+
+class Revalidation:
+    """Background revalidation of a snapshot and the networks awaiting it"""
+
+    def __init__(self, thread, networks) -> None:
+        self.thread = thread
+        self.networks = networks
+
+
+class WorkerDiscovery:
+    """Miners and sharders of a network, persisted to a local snapshot so a
+    new Network starts without waiting on DNS
+
+    A snapshot is used as is on startup and revalidated in the background
+    against the latest magic block of the network. Workers only change with
+    the magic block, DNS is requested again, once, when the magic block
+    number differs from the snapshot, cannot be read, or the snapshot is
+    older than max_age.
+    :param directory: String, directory of snapshots, one file per hostname,
+        defaults to ~/.zcn/discovery
+    :param max_age: Float, seconds a snapshot is trusted without a DNS request
+    """
+
+    def __init__(self, directory=None, max_age=DISCOVERY_MAX_AGE) -> None:
+        self.directory = directory or os.path.join(get_home_path(), ".zcn", "discovery")
+        self.max_age = max_age
+        self.num_dns_requests = 0
+        self.revalidation = None
+
+    def discover(self, hostname):
+        """Workers of the network from the snapshot, or from a single DNS
+        request when there is no snapshot
+        Returns tuple of workers dict and whether it came from the snapshot
+        """
+        snapshot = self.load(hostname)
+        if snapshot:
+            return snapshot, True
+        return self.request_workers(hostname), False
+
+    def request_workers(self, hostname):
+        """Miners and sharders of a single DNS request"""
+        self.num_dns_requests += 1
+        workers = request_dns_workers(hostname)
+        for worker in ["miners", "sharders"]:
+            if not workers.get(worker):
+                raise KeyError(f"No {worker} found")
+        return workers
+
+    def revalidate_in_background(self, network, snapshot=None):
+        """Start revalidating the workers of the network, see revalidate. A
+        revalidation already running for the snapshot is joined instead, the
+        network is given the workers it finds"""
+        path = self.path(network.hostname)
+        with _revalidations_lock:
+            running = _revalidations.get(path)
+            if running:
+                running.networks.append(network)
+                self.revalidation = running.thread
+                return self.revalidation
+
+            self.revalidation = threading.Thread(
+                target=self._revalidate,
+                args=(path, network, snapshot),
+                name="zerochain-discovery",
+                daemon=True,
+            )
+            _revalidations[path] = Revalidation(self.revalidation, [])
+        self.revalidation.start()
+        return self.revalidation
+
+    def revalidate(self, network, snapshot=None):
+        """Check the workers of the network against its latest magic block,
+        replace them from DNS when the snapshot they came from is stale, then
+        save the workers with the magic block number
+        :param network: Network, started from the snapshot or from DNS
+        :param snapshot: Dict, snapshot the network was started from, None
+            when its workers were just requested from DNS
+        Returns the workers requested from DNS, None when the snapshot held
+        """
+        workers = None
+        magic_block_number = self._get_magic_block_number(network)
+        if snapshot and self._is_stale(snapshot, magic_block_number):
+            workers = self.request_workers(network.hostname)
+            network.update_workers(workers["miners"], workers["sharders"])
+            if magic_block_number is None:
+                magic_block_number = self._get_magic_block_number(network)
+
+        self.save(
+            network.hostname,
+            [worker.url for worker in network.miners],
+            [worker.url for worker in network.sharders],
+            magic_block_number,
+        )
+        return workers
+
+    def load(self, hostname):
+        """Snapshot of the hostname, None when missing or unreadable"""
+        try:
+            with open(self.path(hostname)) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not snapshot.get("miners") or not snapshot.get("sharders"):
+            return None
+        return snapshot
+
+    def save(self, hostname, miners, sharders, magic_block_number=None):
+        """Write the snapshot, replacing the previous one in a single step so
+        a reader never sees a partial file"""
+        path = self.path(hostname)
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {
+            "hostname": hostname,
+            "miners": miners,
+            "sharders": sharders,
+            "magic_block_number": magic_block_number,
+            "validated_at": time(),
+        }
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+
+    def path(self, hostname):
+        name = re.sub(r"[^A-Za-z0-9]+", "_", hostname).strip("_")
+        return os.path.join(self.directory, f"{name}.json")
+
+    @staticmethod
+    def from_object(config_obj):
+        """Discovery of config, None unless discovery_dir is set, True uses
+        the default directory"""
+        directory = config_obj.get("discovery_dir")
+        if not directory:
+            return None
+        return WorkerDiscovery(
+            None if directory is True else directory,
+            config_obj.get("discovery_max_age", DISCOVERY_MAX_AGE),
+        )
+
+    def _revalidate(self, path, network, snapshot):
+        workers = None
+        try:
+            workers = self.revalidate(network, snapshot)
+        except Exception:
+            # The networks keep the workers they started with
+            pass
+
+        with _revalidations_lock:
+            joined_networks = _revalidations.pop(path).networks
+        if workers:
+            for joined_network in joined_networks:
+                joined_network.update_workers(workers["miners"], workers["sharders"])
+
+    def _is_stale(self, snapshot, magic_block_number):
+        if magic_block_number is None:
+            return True
+        if magic_block_number != snapshot.get("magic_block_number"):
+            return True
+        return time() - snapshot.get("validated_at", 0) > self.max_age
+
+    def _get_magic_block_number(self, network):
+        try:
+            res = network._consensus_from_workers(
+                "sharders", Endpoints.GET_LATEST_FINALIZED_MAGIC_BLOCK
+            )
+            return res["magic_block"]["magic_block_number"]
+        except Exception:
+            return None
@@ -4,3 +4,11 @@ class ConsensusError(ConnectionError):
 
 class TransactionError(ConnectionError):
     pass
+
+
+class DeadlineExceededError(TimeoutError):
+    pass
+
+
+class SigningError(RuntimeError):
+    pass
@@ -0,0 +1,38 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Threads of the process wide executor, requests are I/O bound and every
+# network, client and thread without an executor of its own shares them
+DEFAULT_MAX_WORKERS = max(32, (os.cpu_count() or 1) * 5)
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> ThreadPoolExecutor:
+    """Process wide executor shared by every network without its own,
+    threads are created once and reused for each consensus fan-out"""
+    global _default_executor
+    if _default_executor:
+        return _default_executor
+
+    with _default_executor_lock:
+        if not _default_executor:
+            _default_executor = build_executor(DEFAULT_MAX_WORKERS)
+        return _default_executor
+
+
+def set_default_executor(max_workers=DEFAULT_MAX_WORKERS) -> ThreadPoolExecutor:
+    """Replace the process wide executor, networks without their own pick
+    it up on their next request. The previous executor is not shut down, a
+    consensus round running on it may still submit requests, its idle threads
+    exit once it is no longer referenced"""
+    global _default_executor
+    with _default_executor_lock:
+        _default_executor = build_executor(max_workers)
+        return _default_executor
+
+
+def build_executor(max_workers) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zerochain")
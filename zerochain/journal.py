@@ -0,0 +1,166 @@
+import json
+import sqlite3
+import threading
+from time import time
+
+from zerochain.const import TransactionState
+
+# States of transactions that may still be confirmed
+UNRESOLVED_STATES = (TransactionState.BUILT, TransactionState.SUBMITTED)
+
+
+class TransactionJournal:
+    """Local record of every transaction built, kept in SQLite so the
+    transactions in flight survive the process
+
+    Each transaction is written when it is built, then updated as it is
+    acknowledged and resolved. A restarted process resumes confirmation of
+    the unresolved transactions alone from the journal, rather than
+    rebuilding its state from the network.
+    :param path: String, path of the SQLite database, created when missing
+    """
+
+    def __init__(self, path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        # Write ahead logging keeps every committed write through a crash of
+        # the process without syncing the disk on each write
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("""CREATE TABLE IF NOT EXISTS transactions (
+                hash TEXT PRIMARY KEY,
+                client_id TEXT,
+                state TEXT NOT NULL,
+                data TEXT,
+                confirmation TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )""")
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS transactions_state ON transactions (state)"
+        )
+        self._connection.commit()
+
+    def record(self, hash, client_id, state, data=None, confirmation=None):
+        """Write the state of a transaction, data and confirmation already
+        recorded are kept when not given
+        :param hash: String, hash of the transaction
+        :param client_id: String, id of the wallet that signed it
+        :param state: String, TransactionState
+        :param data: Dict, signed transaction data as posted to miners
+        :param confirmation: Dict, confirmation data of the transaction
+        """
+        now = time()
+        with self._lock:
+            self._connection.execute(
+                """INSERT INTO transactions
+                    (hash, client_id, state, data, confirmation, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (hash) DO UPDATE SET
+                    state = excluded.state,
+                    data = COALESCE(excluded.data, data),
+                    confirmation = COALESCE(excluded.confirmation, confirmation),
+                    updated_at = excluded.updated_at""",
+                (
+                    hash,
+                    client_id,
+                    state,
+                    json.dumps(data) if data is not None else None,
+                    json.dumps(confirmation) if confirmation is not None else None,
+                    now,
+                    now,
+                ),
+            )
+            self._connection.commit()
+
+    def get(self, hash):
+        """Journal entry of a transaction, None when not recorded"""
+        entries = self._select("WHERE hash = ?", (hash,))
+        return entries[0] if entries else None
+
+    def unresolved(self, client_id=None):
+        """Entries of transactions not yet confirmed, failed or expired,
+        oldest first
+        :param client_id: String, only entries of this wallet
+        """
+        placeholders = ", ".join("?" for _ in UNRESOLVED_STATES)
+        where = f"WHERE state IN ({placeholders})"
+        params = UNRESOLVED_STATES
+        if client_id:
+            where += " AND client_id = ?"
+            params += (client_id,)
+        return self._select(f"{where} ORDER BY created_at", params)
+
+    def resume(self, client, client_id=None, timeout=None):
+        """Track confirmation of every unresolved transaction, recording the
+        outcome of each as it resolves
+        Returns dict of hash to a future of the confirmation data
+        :param client: Client of the network the transactions were sent to
+        :param client_id: String, only resume transactions of this wallet
+        :param timeout: Float, seconds each transaction is tracked, defaults
+            to the tracker timeout
+        """
+        tracker = client._get_confirmation_tracker()
+        futures = {}
+        for entry in self.unresolved(client_id):
+            future = tracker.track(entry["hash"], timeout=timeout)
+            future.add_done_callback(
+                lambda future, entry=entry: self.record_confirmation(
+                    entry["hash"], entry["client_id"], future.result()
+                )
+            )
+            futures[entry["hash"]] = future
+        return futures
+
+    def record_confirmation(self, hash, client_id, confirmation_data):
+        """Record the outcome of confirming a transaction, confirmation data
+        is None, or error text, when the transaction was not confirmed in time"""
+        if not isinstance(confirmation_data, dict):
+            confirmation_data = None
+        status = (confirmation_data or {}).get("transaction_status")
+        if status == 1:
+            state = TransactionState.CONFIRMED
+        elif status == 2:
+            state = TransactionState.FAILED
+        else:
+            state = TransactionState.EXPIRED
+        self.record(hash, client_id, state, confirmation=confirmation_data)
+
+    def prune(self, older_than=0):
+        """Delete resolved entries not updated for older_than seconds
+        Returns number of entries deleted
+        """
+        placeholders = ", ".join("?" for _ in UNRESOLVED_STATES)
+        with self._lock:
+            cursor = self._connection.execute(
+                f"DELETE FROM transactions WHERE state NOT IN ({placeholders}) AND updated_at <= ?",
+                UNRESOLVED_STATES + (time() - older_than,),
+            )
+            self._connection.commit()
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _select(self, clause, params=()):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT hash, client_id, state, data, confirmation, created_at, updated_at "
+                f"FROM transactions {clause}",
+                params,
+            ).fetchall()
+
+        return [
+            {
+                "hash": hash,
+                "client_id": client_id,
+                "state": state,
+                "data": json.loads(data) if data else None,
+                "confirmation": json.loads(confirmation) if confirmation else None,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            for hash, client_id, state, data, confirmation, created_at, updated_at in rows
+        ]
@@ -0,0 +1,94 @@
+import readline from 'readline'
+import bls from 'bls-wasm';
+import bip39 from 'bip39'
+import sha3 from 'js-sha3'
+
+// Long lived signer, one JSON request per line on stdin and one JSON
+// response per line on stdout, responses carry the id of their request
+await bls.init(bls.BN254)
+
+// Deserialized keys of the most recently used wallets, least recently used
+// keys are evicted so key material is not held for every wallet ever seen
+const MAX_SECRET_KEYS = 16
+const secretKeys = new Map()
+
+function hexStringToByte(str) {
+    if (!str) {
+        return new Uint8Array();
+    }
+    var a = [];
+    for (var i = 0, len = str.length; i < len; i += 2) {
+        a.push(parseInt(str.substr(i, 2), 16));
+    }
+    return new Uint8Array(a);
+}
+
+const getSecretKey = (secretKey) => {
+    let sec = secretKeys.get(secretKey)
+    if (sec) {
+        // Map keeps insertion order, move the key to the most recent end
+        secretKeys.delete(secretKey)
+    } else {
+        sec = new bls.SecretKey()
+        sec.deserializeHexStr(secretKey)
+    }
+    secretKeys.set(secretKey, sec)
+    if (secretKeys.size > MAX_SECRET_KEYS) {
+        secretKeys.delete(secretKeys.keys().next().value)
+    }
+    return sec
+}
+
+const sign = (request) => {
+    const byteHash = hexStringToByte(request.hash)
+    const sig = getSecretKey(request.private_key).sign(byteHash)
+    return sig.serializeToHexStr()
+}
+
+const verify = (request) => {
+    const pub = new bls.PublicKey()
+    pub.deserializeHexStr(request.public_key)
+    const sig = new bls.Signature()
+    sig.deserializeHexStr(request.signature)
+    return pub.verify(sig, hexStringToByte(request.hash))
+}
+
+const generate_keys = async (request) => {
+    const seed = await bip39.mnemonicToSeed(request.mnemonic, "0chain-client-split-key");
+    const buffer = new Uint8Array(seed)
+    const blsSecret = new bls.SecretKey();
+
+    bls.setRandFunc(buffer)
+    blsSecret.setLittleEndian(buffer)
+
+    const public_key = blsSecret.getPublicKey().serializeToHexStr();
+    return {
+        public_key: public_key,
+        private_key: blsSecret.serializeToHexStr(),
+        client_id: sha3.sha3_256(hexStringToByte(public_key)),
+    }
+}
+
+const methods = { sign, verify, generate_keys }
+
+const respond = (response) => {
+    process.stdout.write(JSON.stringify(response) + '\n')
+}
+
+const handle = async (line) => {
+    let request = {}
+    try {
+        request = JSON.parse(line)
+        const method = methods[request.method]
+        if (!method) {
+            throw new Error(`Unknown method ${request.method}`)
+        }
+        respond({ id: request.id, result: await method(request) })
+    } catch (e) {
+        respond({ id: request.id, error: String(e) })
+    }
+}
+
+const lines = readline.createInterface({ input: process.stdin })
+lines.on('line', handle)
+lines.on('close', () => process.exit(0))
@@ -0,0 +1,27 @@
+import bls from 'bls-wasm';
+
+await bls.init(bls.BN254)
+
+function hexStringToByte(str) {
+    if (!str) {
+        return new Uint8Array();
+    }
+    var a = [];
+    for (var i = 0, len = str.length; i < len; i += 2) {
+        a.push(parseInt(str.substr(i, 2), 16));
+    }
+    return new Uint8Array(a);
+}
+
+const verify = (publicKey, signature, hashPayload) => {
+    const pub = new bls.PublicKey()
+    pub.deserializeHexStr(publicKey)
+    const sig = new bls.Signature()
+    sig.deserializeHexStr(signature)
+
+    process.stdout.write(pub.verify(sig, hexStringToByte(hashPayload)) ? 'true' : 'false')
+}
+
+const args = process.argv.slice(2)
+
+verify(args[0], args[1], args[2])
@@ -1,17 +1,103 @@
 from zerochain.connection import ConnectionBase
-from zerochain.workers import Blobber, Miner, Sharder
+from zerochain.const import (
+    DEFAULT_BROADCAST_MIN_ACKS,
+    DEFAULT_REQUEST_TIMEOUT,
+    ConsensusFingerprint,
+    ConsensusStrategy,
+    QuorumPolicy,
+)
+from zerochain.cache import ResponseCache
+from zerochain.confirmation import ConfirmationTracker
+from zerochain.discovery import WorkerDiscovery
+from zerochain.journal import TransactionJournal
+from zerochain.session import SessionPool
+from zerochain.signer import Signer
+from zerochain.singleflight import SingleFlight
+from zerochain.executor import build_executor
+from zerochain.workers import Blobber, CircuitBreaker, Miner, Sharder
 from zerochain.utils import hostname_from_config_obj, request_dns_workers
 
 
 class Network(ConnectionBase):
     def __init__(
-        self, hostname, miners, sharders, preferred_blobbers, min_confirmation
+        self,
+        hostname,
+        miners,
+        sharders,
+        preferred_blobbers,
+        min_confirmation,
+        session_pool=None,
+        executor=None,
+        consensus_fingerprint=ConsensusFingerprint.RAW,
+        consensus_strategy=ConsensusStrategy.ALL,
+        hedge_delay=None,
+        quorum_policy=QuorumPolicy.ALL,
+        breaker_failure_threshold=5,
+        breaker_cooldown=30,
+        timeout=DEFAULT_REQUEST_TIMEOUT,
+        cache=None,
+        single_flight=None,
+        signer=None,
+        broadcast_min_acks=DEFAULT_BROADCAST_MIN_ACKS,
+        journal=None,
     ) -> None:
         self.hostname: str = hostname
         self.miners: list = miners
         self.sharders: list = sharders
         self.preferred_blobbers: list = preferred_blobbers
         self.min_confirmation: int = min_confirmation
+        self.session_pool: SessionPool = session_pool or SessionPool()
+        # None uses the process wide executor, resolved on each request
+        self.executor = executor
+        self.consensus_fingerprint: str = consensus_fingerprint
+        self.consensus_strategy: str = consensus_strategy
+        self.hedge_delay: float = hedge_delay
+        self.quorum_policy: str = quorum_policy
+        self.timeout: tuple = timeout
+        # Miners acknowledging a transaction before submission returns
+        self.broadcast_min_acks: int = broadcast_min_acks
+        # Any object with the ResponseCache interface, None disables caching
+        self.cache: ResponseCache = cache
+        # Seconds per block, observed from chain stats when polling confirmations
+        self.block_time: float = None
+        self.block_time_observed_at: float = None
+        # Signer of clients on the network without their own
+        self.signer: Signer = signer
+        # Coalesces identical concurrent reads, False disables coalescing
+        self.single_flight: SingleFlight = (
+            SingleFlight() if single_flight is None else single_flight
+        )
+        # Records transactions built on the network, None disables journaling
+        self.journal: TransactionJournal = journal
+        # Persists the workers for the next start, set by from_object
+        self.discovery: WorkerDiscovery = None
+        # Follows finalized blocks confirming transactions, started on first use
+        self.confirmation_tracker: ConfirmationTracker = None
+
+        self.breaker_failure_threshold: int = breaker_failure_threshold
+        self.breaker_cooldown: float = breaker_cooldown
+
+        for worker in self.miners + self.sharders:
+            worker.breaker = CircuitBreaker(breaker_failure_threshold, breaker_cooldown)
+
+    def update_workers(self, miner_urls, sharder_urls):
+        """Replace the miners and sharders, workers already known keep their
+        statistics and circuit breakers"""
+        self.miners = self._merge_workers(self.miners, miner_urls, Miner)
+        self.sharders = self._merge_workers(self.sharders, sharder_urls, Sharder)
+
+    def _merge_workers(self, workers, urls, worker_class):
+        known_workers = {worker.url: worker for worker in workers}
+        merged_workers = []
+        for url in urls:
+            worker = known_workers.get(url)
+            if not worker:
+                worker = worker_class(url)
+                worker.breaker = CircuitBreaker(
+                    self.breaker_failure_threshold, self.breaker_cooldown
+                )
+            merged_workers.append(worker)
+        return merged_workers
 
     def json(self):
         return {
@@ -19,22 +105,100 @@ class Network(ConnectionBase):
             "miners": [worker.url for worker in self.miners],
             "sharders": [worker.url for worker in self.sharders],
             "preferred_blobbers": [worker.url for worker in self.preferred_blobbers],
+            "worker_stats": {
+                "miners": {worker.url: worker.json() for worker in self.miners},
+                "sharders": {worker.url: worker.json() for worker in self.sharders},
+            },
+            "cache": self.cache.json() if self.cache else None,
+            "single_flight": (
+                self.single_flight.json() if self.single_flight else None
+            ),
+            "confirmation_tracker": (
+                self.confirmation_tracker.json() if self.confirmation_tracker else None
+            ),
         }
 
     @staticmethod
     def from_object(config_obj, hostname=None):
+        """Network of config, workers are requested from DNS. With
+        discovery_dir set they are read from the discovery snapshot when
+        there is one and revalidated in the background"""
         if not hostname:
             hostname = hostname_from_config_obj(config_obj)
-        miners = [Miner(url) for url in request_dns_workers(hostname, "miners")]
-        sharders = [Sharder(url) for url in request_dns_workers(hostname, "sharders")]
+
+        discovery = WorkerDiscovery.from_object(config_obj)
+        if discovery:
+            workers, from_snapshot = discovery.discover(hostname)
+        else:
+            workers = request_dns_workers(hostname)
+        miners = [Miner(url) for url in workers["miners"]]
+        sharders = [Sharder(url) for url in workers["sharders"]]
 
         # Todo: Error check blobber load
         preferred_blobbers = [
             Blobber(url) for url in config_obj.get("preferred_blobbers")
         ]
         min_confirmation = config_obj["min_confirmation"]
+        session_pool = SessionPool.from_object(config_obj)
+
+        # Networks share the process wide executor unless sized in config
+        executor = None
+        if config_obj.get("max_workers"):
+            executor = build_executor(config_obj["max_workers"])
+
+        consensus_fingerprint = config_obj.get(
+            "consensus_fingerprint", ConsensusFingerprint.RAW
+        )
+        consensus_strategy = config_obj.get("consensus_strategy", ConsensusStrategy.ALL)
+        hedge_delay = config_obj.get("hedge_delay")
+        quorum_policy = config_obj.get("quorum_policy", QuorumPolicy.ALL)
+        breaker_failure_threshold = config_obj.get("breaker_failure_threshold", 5)
+        breaker_cooldown = config_obj.get("breaker_cooldown", 30)
+        connect_timeout, read_timeout = DEFAULT_REQUEST_TIMEOUT
+        timeout = (
+            config_obj.get("connect_timeout", connect_timeout),
+            config_obj.get("read_timeout", read_timeout),
+        )
+        cache = ResponseCache.from_object(config_obj)
+        signer = Signer.from_object(config_obj)
+        single_flight = (
+            SingleFlight() if config_obj.get("coalesce_reads", True) else False
+        )
+        broadcast_min_acks = config_obj.get(
+            "broadcast_min_acks", DEFAULT_BROADCAST_MIN_ACKS
+        )
+        journal = None
+        if config_obj.get("journal_path"):
+            journal = TransactionJournal(config_obj["journal_path"])
+
+        network = Network(
+            hostname,
+            miners,
+            sharders,
+            preferred_blobbers,
+            min_confirmation,
+            session_pool,
+            executor,
+            consensus_fingerprint,
+            consensus_strategy,
+            hedge_delay,
+            quorum_policy,
+            breaker_failure_threshold,
+            breaker_cooldown,
+            timeout,
+            cache,
+            single_flight,
+            signer,
+            broadcast_min_acks,
+            journal,
+        )
 
-        return Network(hostname, miners, sharders, preferred_blobbers, min_confirmation)
+        if discovery:
+            network.discovery = discovery
+            discovery.revalidate_in_background(
+                network, workers if from_snapshot else None
+            )
+        return network
 
     def __str__(self) -> str:
         return f"hostname: {self.hostname}"
@@ -0,0 +1,72 @@
+import random
+from time import monotonic
+
+from zerochain.const import DEFAULT_BLOCK_TIME
+
+
+class ConfirmationPoller:
+    """Delays between transaction confirmation polls
+
+    The first poll is made about one block after submission, when the
+    transaction can first be confirmed. Later polls back off exponentially
+    from half a block with jitter, so slow confirmations are polled less
+    often and concurrent transactions do not poll in lock step. Iteration
+    stops once the timeout is spent, no delay runs past the deadline.
+    :param block_time: Float, observed seconds per block
+    :param timeout: Float, seconds after the start that polling stops
+    :param deadline: Deadline, polling ends no later than the deadline
+    :param started_at: Float, monotonic time the transaction was submitted
+    :param multiplier: Float, growth of the delay after each poll
+    :param max_delay: Float, longest delay, defaults to two blocks
+    """
+
+    def __init__(
+        self,
+        block_time=None,
+        timeout=None,
+        deadline=None,
+        started_at=None,
+        multiplier=1.5,
+        max_delay=None,
+    ) -> None:
+        self.block_time = block_time or DEFAULT_BLOCK_TIME
+        self.timeout = timeout
+        self.deadline = deadline
+        self.started_at = started_at or monotonic()
+        self.multiplier = multiplier
+        self.max_delay = max_delay or max(2 * self.block_time, 0.5)
+        self.num_polls = 0
+
+    def __iter__(self):
+        # Time spent since submission counts towards the first delay
+        delay = self.block_time - (monotonic() - self.started_at)
+        backoff = self.block_time / 2
+
+        while True:
+            if self.num_polls and self._is_spent():
+                return
+
+            yield self._cap(max(delay, 0))
+            self.num_polls += 1
+
+            delay = self._jitter(backoff)
+            backoff = min(backoff * self.multiplier, self.max_delay)
+
+    def _jitter(self, delay):
+        """Between half and the full delay"""
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _cap(self, delay):
+        if self.timeout is not None:
+            delay = min(delay, max(self._remaining(), 0))
+        if self.deadline:
+            delay = self.deadline.cap(delay)
+        return delay
+
+    def _remaining(self):
+        return self.timeout - (monotonic() - self.started_at)
+
+    def _is_spent(self):
+        if self.deadline and self.deadline.expired():
+            return True
+        return self.timeout is not None and self._remaining() <= 0
@@ -0,0 +1,256 @@
+import queue
+import asyncio
+import threading
+from time import monotonic, sleep
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from zerochain.const import BreakerState
+from zerochain.transaction import TransactionFuture
+from zerochain.workers import EWMA_ALPHA
+
+# Seconds between checks of the breaker of a miner at its cap, a miner whose
+# breaker opens is not broadcast to so it is no longer waited on
+MINER_POLL_INTERVAL = 0.1
+
+
+class TokenBucket:
+    """Rate limit, a token is taken per operation and tokens refill at rate
+    per second up to burst
+    :param rate: Float, operations per second
+    :param burst: Int, operations allowed at once after idling, defaults to rate
+    """
+
+    def __init__(self, rate, burst=None) -> None:
+        self.rate = rate
+        self.capacity = burst or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            sleep(wait_time)
+
+
+class TransactionScheduler:
+    """Queue submitting transactions of many clients under shared limits
+
+    Transactions are submitted no faster than the rate limit, with at most
+    max_in_flight submissions running, and submission holds while any miner
+    is serving max_per_miner requests. A submission holds a request on every
+    miner from dispatch until the miners accepted it, so with other requests
+    sharing the miners a miner never serves more than max_per_miner. Miners
+    with an open breaker are not broadcast to and are not waited on. Each
+    wallet submits in the order its transactions were queued, the next one
+    only once the miners accepted the previous, while wallets take turns. The queue holds max_queue_size transactions, producers block
+    once it is full. Submitted transactions are confirmed by the
+    confirmation tracker of their network.
+    :param rate: Float, transactions submitted per second, unlimited when None
+    :param burst: Int, transactions submitted at once after idling
+    :param max_in_flight: Int, submissions running at once
+    :param max_per_miner: Int, requests in flight per miner before
+        submission holds, counting every request to the miner and every
+        submission held for it, None disables the cap
+    :param max_queue_size: Int, queued transactions before producers block
+    """
+
+    def __init__(
+        self,
+        rate=None,
+        burst=None,
+        max_in_flight=32,
+        max_per_miner=32,
+        max_queue_size=1024,
+    ) -> None:
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.max_in_flight = max_in_flight
+        self.max_per_miner = max_per_miner
+        self.max_queue_size = max_queue_size
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.in_flight = 0
+        self.num_submitted = 0
+        self.num_failed = 0
+        self.ewma_queue_latency = None
+        self.ewma_submit_latency = None
+        self._queues = {}
+        self._ready = deque()
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_in_flight, thread_name_prefix="zerochain-scheduler"
+        )
+        self._dispatcher = threading.Thread(
+            target=self._dispatch, name="zerochain-scheduler-dispatch", daemon=True
+        )
+        self._dispatcher.start()
+
+    def submit(self, transaction, block=True, timeout=None) -> TransactionFuture:
+        """Queue a transaction, the returned TransactionFuture resolves to its
+        confirmation data
+        :param transaction: Transaction, queued behind earlier transactions
+            of the same wallet
+        :param block: Bool, wait for room in a full queue, raise queue.Full
+            right away when False
+        :param timeout: Float, seconds to wait for room before queue.Full
+        """
+        future = TransactionFuture(transaction)
+        wallet_id = transaction.client.id
+        wait_until = None if timeout is None else monotonic() + timeout
+
+        with self._condition:
+            while self.queue_depth >= self.max_queue_size and not self._closed:
+                if not block:
+                    raise queue.Full("Transaction queue is full")
+                remaining = None if wait_until is None else wait_until - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Full("Transaction queue is full")
+                self._condition.wait(remaining)
+
+            if self._closed:
+                raise RuntimeError("Transaction scheduler is closed")
+
+            wallet_queue = self._queues.get(wallet_id)
+            if wallet_queue is None:
+                # Wallet has nothing queued or submitting, it is ready
+                wallet_queue = self._queues[wallet_id] = deque()
+                self._ready.append(wallet_id)
+            wallet_queue.append((future, monotonic()))
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            self._condition.notify_all()
+
+        return future
+
+    async def submit_async(self, transaction) -> TransactionFuture:
+        """Queue a transaction without blocking the event loop while the
+        queue is full, await the returned future for confirmation data"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.submit, transaction)
+
+    def close(self, wait=True):
+        """Stop accepting transactions, those already queued are submitted"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            self._dispatcher.join()
+            self._executor.shutdown(wait=True)
+
+    def json(self):
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "num_wallets": len(self._queues),
+            "in_flight": self.in_flight,
+            "num_submitted": self.num_submitted,
+            "num_failed": self.num_failed,
+            "ewma_queue_latency": self.ewma_queue_latency,
+            "ewma_submit_latency": self.ewma_submit_latency,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _dispatch(self):
+        while True:
+            with self._condition:
+                while not self._ready or self.in_flight >= self.max_in_flight:
+                    if self._closed and not self.queue_depth:
+                        return
+                    self._condition.wait()
+
+                wallet_id = self._ready.popleft()
+                future, queued_at = self._queues[wallet_id].popleft()
+                self.queue_depth -= 1
+                self.in_flight += 1
+                self._condition.notify_all()
+
+            started_at = monotonic()
+            miners = []
+            try:
+                if self.bucket:
+                    self.bucket.acquire()
+                miners = self._reserve_miners(future.transaction)
+                self._executor.submit(
+                    self._submit, wallet_id, future, queued_at, miners
+                )
+            except Exception as e:
+                # The dispatcher keeps going, only this transaction fails
+                self._release_miners(miners)
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+                self._finish(wallet_id, queued_at, started_at, failed=True)
+
+    def _submit(self, wallet_id, future, queued_at, miners):
+        started_at = monotonic()
+        failed = False
+        try:
+            if future.set_running_or_notify_cancel():
+                future.transaction._submit_and_track(future)
+        except Exception as e:
+            failed = True
+            future.set_exception(e)
+        self._release_miners(miners)
+        self._finish(wallet_id, queued_at, started_at, failed)
+
+    def _finish(self, wallet_id, queued_at, started_at, failed):
+        with self._condition:
+            self.in_flight -= 1
+            self.num_submitted += 1
+            self.num_failed += failed
+            self.ewma_queue_latency = self._ewma(
+                self.ewma_queue_latency, started_at - queued_at
+            )
+            self.ewma_submit_latency = self._ewma(
+                self.ewma_submit_latency, monotonic() - started_at
+            )
+
+            # The next transaction of the wallet is ready once this one is in
+            if self._queues[wallet_id]:
+                self._ready.append(wallet_id)
+            else:
+                del self._queues[wallet_id]
+            self._condition.notify_all()
+
+    def _reserve_miners(self, transaction):
+        """Hold a request on every miner the transaction is broadcast to,
+        waiting for as long as a miner is at its cap, returns the miners held"""
+        if not self.max_per_miner:
+            return []
+
+        reserved = []
+        try:
+            for miner in transaction.client._get_workers("miners"):
+                while miner.breaker.state != BreakerState.OPEN:
+                    if miner.stats.reserve(self.max_per_miner, MINER_POLL_INTERVAL):
+                        reserved.append(miner)
+                        break
+        except BaseException:
+            self._release_miners(reserved)
+            raise
+        return reserved
+
+    def _release_miners(self, miners):
+        for miner in miners:
+            miner.stats.release()
+
+    def _ewma(self, average, sample):
+        if average is None:
+            return sample
+        return average + EWMA_ALPHA * (sample - average)
@@ -0,0 +1,94 @@
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class SessionPool:
+    """Keep-alive HTTP sessions with one connection pool per worker host,
+    safe to share between the threads of a consensus fan-out
+    :param pool_maxsize: Int, max connections kept open per host
+    :param keep_alive: Bool, reuse connections between requests
+    :param max_retries: Int, retries on connection errors and 502/503/504
+    :param backoff_factor: Float, sleep factor between retries
+    """
+
+    def __init__(
+        self, pool_maxsize=10, keep_alive=True, max_retries=0, backoff_factor=0
+    ) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        return self.get_session(url).request(method, url, **kwargs)
+
+    def get_session(self, url) -> requests.Session:
+        host = self._host_from_url(url)
+        session = self._sessions.get(host)
+        if session:
+            return session
+
+        with self._lock:
+            # Another thread may have built the session while waiting on the lock
+            session = self._sessions.get(host)
+            if not session:
+                session = self._build_session()
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+    def json(self):
+        return {
+            "pool_maxsize": self.pool_maxsize,
+            "keep_alive": self.keep_alive,
+            "max_retries": self.max_retries,
+            "backoff_factor": self.backoff_factor,
+            "hosts": list(self._sessions.keys()),
+        }
+
+    def _build_session(self) -> requests.Session:
+        retries = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retries
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def _host_from_url(self, url) -> str:
+        split = urlsplit(url)
+        return f"{split.scheme}://{split.netloc}"
+
+    @staticmethod
+    def from_object(config_obj):
+        """Build session pool from network config, missing keys use defaults"""
+        return SessionPool(
+            pool_maxsize=config_obj.get("pool_maxsize", 10),
+            keep_alive=config_obj.get("keep_alive", True),
+            max_retries=config_obj.get("max_retries", 0),
+            backoff_factor=config_obj.get("backoff_factor", 0),
+        )
+
+    def __repr__(self) -> str:
+        return f"SessionPool()"
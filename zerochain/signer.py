@@ -0,0 +1,288 @@
+import os
+import ctypes
+import ctypes.util
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from hashlib import pbkdf2_hmac, sha3_256
+
+from zerochain.const import SignerBackend
+from zerochain.exceptions import SigningError
+from zerochain.bls import (
+    PASSPHRASE,
+    SignerPool,
+    generate_keys,
+    get_signing_worker,
+    spawn_sign_payload,
+    spawn_verify,
+)
+
+# herumi BLS curve id of BN254
+MCL_BN254 = 0
+
+
+class Signer(ABC):
+    """Signing backend, signs transaction hashes, verifies signatures and
+    generates wallet keys. Signatures are hex strings, sign returns False
+    when a signature could not be made"""
+
+    name = None
+
+    @abstractmethod
+    def sign(self, private_key, hash_payload):
+        pass
+
+    @abstractmethod
+    def verify(self, public_key, signature, hash_payload) -> bool:
+        pass
+
+    @abstractmethod
+    def generate_keys(self, mnemonic) -> dict:
+        pass
+
+    def sign_many(self, private_key, hashes):
+        """Sign every hash, signatures are yielded in the order of the hashes"""
+        for hash_payload in hashes:
+            yield self.sign(private_key, hash_payload)
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def from_object(config_obj):
+        """Signer named by the signer key of config, None when not set"""
+        backend = config_obj.get("signer")
+        if not backend:
+            return None
+        return build_signer(
+            backend,
+            pool_size=config_obj.get("signer_pool_size", 1),
+            library_path=config_obj.get("bls_library"),
+        )
+
+
+class NodeSigner(Signer):
+    """Node process spawned for every operation"""
+
+    name = SignerBackend.NODE
+
+    def sign(self, private_key, hash_payload):
+        return spawn_sign_payload(private_key, hash_payload)
+
+    def verify(self, public_key, signature, hash_payload) -> bool:
+        return spawn_verify(public_key, signature, hash_payload)
+
+    def generate_keys(self, mnemonic) -> dict:
+        return generate_keys(mnemonic)
+
+
+class PersistentSigner(Signer):
+    """Long lived Node processes, a single signing worker or a pool of them
+    :param pool_size: Int, signing processes, the process wide worker when 1
+    :param command: List, command starting each signing process
+    :param worker: SigningWorker or SignerPool to serve requests
+    """
+
+    name = SignerBackend.PERSISTENT
+
+    def __init__(self, pool_size=1, command=None, worker=None) -> None:
+        if not worker:
+            if pool_size > 1 or command:
+                worker = SignerPool(pool_size, command)
+            else:
+                worker = get_signing_worker()
+        self.worker = worker
+
+    def sign(self, private_key, hash_payload):
+        try:
+            signature = self.worker.sign(private_key, hash_payload)
+        except SigningError:
+            return False
+        if not signature or len(signature) != 64:
+            return False
+        return signature
+
+    def verify(self, public_key, signature, hash_payload) -> bool:
+        try:
+            return self.worker.request(
+                "verify", public_key=public_key, signature=signature, hash=hash_payload
+            )
+        except SigningError:
+            return False
+
+    def generate_keys(self, mnemonic) -> dict:
+        try:
+            return self.worker.generate_keys(mnemonic)
+        except SigningError:
+            return False
+
+    def sign_many(self, private_key, hashes):
+        if isinstance(self.worker, SignerPool):
+            return self.worker.sign_many(private_key, hashes)
+        return super().sign_many(private_key, hashes)
+
+    def close(self):
+        if self.worker is not get_signing_worker():
+            self.worker.close()
+
+
+class NativeSigner(Signer):
+    """In process signing with herumi's BLS library, the same engine bls-wasm
+    is compiled from, loaded through ctypes so no subprocess is involved.
+    Calls release the GIL, threads sign in parallel.
+    :param library_path: String, path of libbls384_256, defaults to the
+        ZEROCHAIN_BLS_LIBRARY environment variable then the library search path
+    :param fr_unit_size: Int, MCLBN_FR_UNIT_SIZE the library was built with
+    :param fp_unit_size: Int, MCLBN_FP_UNIT_SIZE the library was built with
+    """
+
+    name = SignerBackend.NATIVE
+
+    _init_lock = threading.Lock()
+
+    def __init__(self, library_path=None, fr_unit_size=4, fp_unit_size=6) -> None:
+        library_path = (
+            library_path
+            or os.environ.get("ZEROCHAIN_BLS_LIBRARY")
+            or ctypes.util.find_library("bls384_256")
+        )
+        if not library_path:
+            raise ImportError(
+                "herumi bls library is required for the native signer, build libbls384_256 and set ZEROCHAIN_BLS_LIBRARY"
+            )
+
+        self._lib = ctypes.CDLL(library_path)
+        self._fr_size = fr_unit_size * 8
+        self._g1_size = fp_unit_size * 8 * 3
+        self._g2_size = fp_unit_size * 8 * 6
+        self._declare_functions()
+
+        with self._init_lock:
+            compiled_time_var = fr_unit_size * 10 + fp_unit_size
+            if self._lib.blsInit(MCL_BN254, compiled_time_var) != 0:
+                raise SigningError("Unable to initialise bls library for BN254")
+
+    def sign(self, private_key, hash_payload):
+        try:
+            secret_key = self._deserialize(
+                "blsSecretKeyDeserialize", self._fr_size, private_key
+            )
+            message = bytes.fromhex(hash_payload)
+        except (SigningError, ValueError):
+            return False
+
+        signature = ctypes.create_string_buffer(self._g1_size)
+        self._lib.blsSign(signature, secret_key, message, len(message))
+        return self._serialize("blsSignatureSerialize", signature)
+
+    def verify(self, public_key, signature, hash_payload) -> bool:
+        try:
+            public_key = self._deserialize(
+                "blsPublicKeyDeserialize", self._g2_size, public_key
+            )
+            signature = self._deserialize(
+                "blsSignatureDeserialize", self._g1_size, signature
+            )
+            message = bytes.fromhex(hash_payload)
+        except (SigningError, ValueError):
+            return False
+
+        return self._lib.blsVerify(signature, public_key, message, len(message)) == 1
+
+    def generate_keys(self, mnemonic) -> dict:
+        # BIP39 seed of the mnemonic, as bip39.mnemonicToSeed in Node
+        seed = pbkdf2_hmac(
+            "sha512",
+            unicodedata.normalize("NFKD", mnemonic).encode(),
+            unicodedata.normalize("NFKD", f"mnemonic{PASSPHRASE}").encode(),
+            2048,
+        )
+        secret_key = ctypes.create_string_buffer(self._fr_size)
+        if self._lib.blsSecretKeySetLittleEndian(secret_key, seed, len(seed)) != 0:
+            return False
+
+        public_key = ctypes.create_string_buffer(self._g2_size)
+        self._lib.blsGetPublicKey(public_key, secret_key)
+        public_key_hex = self._serialize("blsPublicKeySerialize", public_key)
+        return {
+            "public_key": public_key_hex,
+            "private_key": self._serialize("blsSecretKeySerialize", secret_key),
+            "mnemonic": mnemonic,
+            "client_id": sha3_256(bytes.fromhex(public_key_hex)).hexdigest(),
+        }
+
+    def _serialize(self, function_name, value):
+        buffer = ctypes.create_string_buffer(self._g2_size)
+        size = getattr(self._lib, function_name)(buffer, len(buffer), value)
+        return buffer.raw[:size].hex()
+
+    def _deserialize(self, function_name, size, hex_string):
+        data = bytes.fromhex(hex_string)
+        value = ctypes.create_string_buffer(size)
+        if not getattr(self._lib, function_name)(value, data, len(data)):
+            raise SigningError(f"Invalid value for {function_name}")
+        return value
+
+    def _declare_functions(self):
+        size_t = ctypes.c_size_t
+        buffer = ctypes.c_void_p
+        self._lib.blsInit.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._lib.blsInit.restype = ctypes.c_int
+
+        for function_name in [
+            "blsSecretKeySerialize",
+            "blsPublicKeySerialize",
+            "blsSignatureSerialize",
+            "blsSecretKeyDeserialize",
+            "blsPublicKeyDeserialize",
+            "blsSignatureDeserialize",
+        ]:
+            function = getattr(self._lib, function_name)
+            function.argtypes = [buffer, size_t, buffer]
+            function.restype = size_t
+
+        # Deserialize takes the value first, then the source bytes and size
+        for function_name in [
+            "blsSecretKeyDeserialize",
+            "blsPublicKeyDeserialize",
+            "blsSignatureDeserialize",
+        ]:
+            getattr(self._lib, function_name).argtypes = [buffer, buffer, size_t]
+
+        self._lib.blsSecretKeySetLittleEndian.argtypes = [buffer, buffer, size_t]
+        self._lib.blsSecretKeySetLittleEndian.restype = ctypes.c_int
+        self._lib.blsGetPublicKey.argtypes = [buffer, buffer]
+        self._lib.blsGetPublicKey.restype = None
+        self._lib.blsSign.argtypes = [buffer, buffer, buffer, size_t]
+        self._lib.blsSign.restype = None
+        self._lib.blsVerify.argtypes = [buffer, buffer, buffer, size_t]
+        self._lib.blsVerify.restype = ctypes.c_int
+
+
+_default_signer = None
+_default_signer_lock = threading.Lock()
+
+
+def build_signer(backend, pool_size=1, library_path=None) -> Signer:
+    """Signer of a SignerBackend name
+    :param backend: String, SignerBackend
+    :param pool_size: Int, signing processes of the persistent backend
+    :param library_path: String, herumi bls library of the native backend
+    """
+    if backend == SignerBackend.PERSISTENT:
+        return PersistentSigner(pool_size)
+    if backend == SignerBackend.NATIVE:
+        return NativeSigner(library_path)
+    if backend == SignerBackend.NODE:
+        return NodeSigner()
+    raise ValueError(f"Unknown signer backend {backend}")
+
+
+def get_default_signer() -> Signer:
+    """Signer of every client and network without their own, the process
+    wide persistent signing worker"""
+    global _default_signer
+    with _default_signer_lock:
+        if not _default_signer:
+            _default_signer = PersistentSigner()
+        return _default_signer
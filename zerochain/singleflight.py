@@ -0,0 +1,130 @@
+import copy
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError
+
+from zerochain.exceptions import DeadlineExceededError
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls, callers arriving while a call is in
+    flight wait for it and share its result rather than making their own
+
+    The caller that starts a call is the leader, the result or exception of
+    its call is handed to every caller that joined while it ran. A call that
+    ran out of the leader's deadline is made again by each joined caller
+    with time left. Threads and event loops coalesce separately, a loop only
+    shares with its own tasks.
+    """
+
+    def __init__(self) -> None:
+        self.num_calls = 0
+        self.num_shared = 0
+        self._calls = {}
+        # Callers awaiting each task of do_async, only touched on its loop
+        self._num_waiting = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, deadline=None):
+        """Call fn, or wait on the identical call already in flight
+        :param key: Hashable, identity of the call
+        :param fn: Callable, makes the call when no identical call is in flight
+        :param deadline: Deadline, bounds how long a joining caller waits
+        """
+        call, is_leader = self._join(key, Future)
+        if not is_leader:
+            try:
+                result = call.result(deadline.cap(None) if deadline else None)
+            except DeadlineExceededError:
+                # The leader ran out of its own deadline, a caller with time
+                # left makes the call itself
+                if deadline and deadline.expired():
+                    raise
+                return fn()
+            except TimeoutError:
+                raise DeadlineExceededError(
+                    f"Deadline exceeded waiting on in flight call - {key}"
+                )
+            return copy.deepcopy(result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._leave(key, call)
+            call.set_exception(e)
+            raise
+
+        self._leave(key, call)
+        call.set_result(result)
+        return result
+
+    async def do_async(self, key, fn, deadline=None):
+        """Await fn(), or the identical call already in flight on this loop
+
+        The call runs as a task of its own that every caller awaits through
+        a shield, a cancelled caller leaves the call running for the others.
+        The task is cancelled once no caller is waiting on it.
+        :param key: Hashable, identity of the call
+        :param fn: Callable returning an awaitable, makes the call
+        :param deadline: Deadline, bounds how long a joining caller waits
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        call, is_leader = self._join(key, lambda: self._start_task(loop, key, fn))
+        self._num_waiting[call] = self._num_waiting.get(call, 0) + 1
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(call), deadline.cap(None) if deadline else None
+            )
+        except DeadlineExceededError:
+            if is_leader or (deadline and deadline.expired()):
+                raise
+            return await fn()
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                f"Deadline exceeded waiting on in flight call - {key[1]}"
+            )
+        finally:
+            self._num_waiting[call] -= 1
+            if not self._num_waiting[call]:
+                del self._num_waiting[call]
+                call.cancel()
+
+        return result if is_leader else copy.deepcopy(result)
+
+    def _start_task(self, loop, key, fn):
+        task = loop.create_task(fn())
+
+        def done(task):
+            self._leave(key, task)
+            # Retrieve the exception so a call nobody awaited logs no warning
+            if not task.cancelled():
+                task.exception()
+
+        task.add_done_callback(done)
+        return task
+
+    def _join(self, key, build_call):
+        with self._lock:
+            call = self._calls.get(key)
+            if call:
+                self.num_shared += 1
+                return call, False
+
+            call = build_call()
+            self._calls[key] = call
+            self.num_calls += 1
+            return call, True
+
+    def _leave(self, key, call):
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def json(self):
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "calls": self.num_calls,
+                "shared": self.num_shared,
+            }
@@ -1,11 +1,40 @@
 import json
-from time import time, sleep
+import asyncio
+import threading
+from time import monotonic, time, sleep
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from zerochain.const import Endpoints
+from zerochain.const import DEFAULT_CONFIRMATION_TIMEOUT, Endpoints
+from zerochain.polling import ConfirmationPoller
 from zerochain.utils import hash_string
 from zerochain.connection import ConnectionBase
-from zerochain.exceptions import TransactionError
-from zerochain.const import STORAGE_SMART_CONTRACT_ADDRESS, TransactionType
+from zerochain.exceptions import DeadlineExceededError, TransactionError
+from zerochain.const import (
+    STORAGE_SMART_CONTRACT_ADDRESS,
+    TransactionState,
+    TransactionType,
+)
+
+
+class TransactionFuture(Future):
+    """Handle of a submitted transaction, resolves to the confirmation data
+    once the transaction is confirmed
+
+    Wait with result(timeout), check with done(), be called back on
+    resolution with add_done_callback, or await the handle on an event loop.
+    :param transaction: Transaction the handle tracks
+    """
+
+    def __init__(self, transaction) -> None:
+        super().__init__()
+        self.transaction = transaction
+
+    @property
+    def hash(self):
+        return self.transaction.hash
+
+    def __await__(self):
+        return asyncio.wrap_future(self).__await__()
 
 
 class Transaction(ConnectionBase):
@@ -18,7 +47,7 @@ class Transaction(ConnectionBase):
         value,
         client,
         raise_exception,
-        timeout=5,
+        timeout=DEFAULT_CONFIRMATION_TIMEOUT,
         fee=0,
     ) -> None:
         self.sc_address = sc_address
@@ -32,6 +61,7 @@ class Transaction(ConnectionBase):
         self.response_data = None
         self.confirmation_data = None
         self.timeout = timeout
+        self.submitted_at = None
         self.raise_exception = raise_exception
         self.fee = fee * 10000000000
 
@@ -58,52 +88,222 @@ class Transaction(ConnectionBase):
         valid_res = transaction.validate()
         return valid_res
 
-    def execute(self):
-        if not self.name:
-            payload = self.input
-        else:
-            payload = json.dumps({"name": self.name, "input": self.input})
+    @staticmethod
+    def submit_many(client, transactions, max_in_flight=8, raise_exception=False):
+        """Build, sign and submit transactions concurrently, returning a
+        TransactionFuture per transaction without waiting on any of them
+
+        At most max_in_flight transactions are submitted at once, submitted
+        transactions are confirmed together by the confirmation tracker of
+        the network while later ones are still submitted.
+        :param client: Client submitting the transactions
+        :param transactions: List of dicts of Transaction arguments, input is
+            required, sc_address, transaction_name, transaction_type and value
+            default as for a storage smart contract call
+        :param max_in_flight: Int, transactions submitted at once
+        :param raise_exception: Bool, fail the future of an unconfirmed transaction
+        """
+        submit_executor = ThreadPoolExecutor(
+            max_in_flight, thread_name_prefix="zerochain-submit"
+        )
+        # Each submission broadcasts to every miner, requests fan out on an
+        # executor sized for every submission in flight
+        num_miners = max(len(client._get_workers("miners")), 1)
+        fan_out_executor = ThreadPoolExecutor(
+            max_in_flight * num_miners, thread_name_prefix="zerochain-submit-fan-out"
+        )
+        fan_out_client = client.with_executor(fan_out_executor)
 
+        futures = [
+            TransactionFuture(
+                Transaction.from_args(fan_out_client, transaction_args, raise_exception)
+            )
+            for transaction_args in transactions
+        ]
+        num_unfinished = len(futures)
+        lock = threading.Lock()
+
+        def submit(future):
+            nonlocal num_unfinished
+            try:
+                if future.set_running_or_notify_cancel():
+                    future.transaction._submit_and_track(future)
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with lock:
+                    num_unfinished -= 1
+                    finished = not num_unfinished
+                if finished:
+                    # Requests beyond the acknowledgements needed may still run
+                    fan_out_executor.shutdown(wait=False)
+
+        for future in futures:
+            submit_executor.submit(submit, future)
+        if not futures:
+            fan_out_executor.shutdown(wait=False)
+
+        submit_executor.shutdown(wait=False)
+        return futures
+
+    @classmethod
+    def from_args(cls, client, transaction_args, raise_exception=False):
+        """Transaction of a dict of arguments, defaults as for a storage
+        smart contract call"""
+        return cls(
+            sc_address=transaction_args.get(
+                "sc_address", STORAGE_SMART_CONTRACT_ADDRESS
+            ),
+            transaction_name=transaction_args.get("transaction_name"),
+            transaction_type=transaction_args.get(
+                "transaction_type", TransactionType.SMART_CONTRACT
+            ),
+            input=transaction_args["input"],
+            value=transaction_args.get("value", 0),
+            client=client,
+            raise_exception=raise_exception,
+        )
+
+    def execute(self):
         return self._submit_transaction(
-            payload,
+            self._build_payload(),
         )
 
+    def submit(self):
+        """Submit the transaction and return as soon as it is accepted,
+        the returned TransactionFuture resolves once it is confirmed
+
+        Confirmation is left to the confirmation tracker of the network, no
+        thread waits on the transaction. Raises TransactionError when the
+        transaction is not accepted.
+        """
+        future = TransactionFuture(self)
+        future.set_running_or_notify_cancel()
+        self._submit_and_track(future)
+        return future
+
     def validate(self, hash=None):
         if not hash:
             hash = self.hash
-        for i in range(5):
-            if i == self.timeout:
-                break
-            sleep(1)
+        deadline = self._get_deadline()
+        poller = ConfirmationPoller(
+            self._get_block_time(), self.timeout, deadline, self.submitted_at
+        )
+        for delay in poller:
+            sleep(delay)
             try:
-                self.confirmation_data = self.client.check_transaction_status(hash)
-                self.status = self.confirmation_data.get("transaction_status")
+                confirmation_data = self.client.check_transaction_status(hash)
+            except DeadlineExceededError:
+                raise
             except:
-                pass
+                confirmation_data = None
+
+            # Sharders without the transaction answer with error text
+            if isinstance(confirmation_data, dict):
+                self.confirmation_data = confirmation_data
+                self.status = confirmation_data.get("transaction_status")
 
             if self.status == 1:
                 break
 
         if self.status == 1:
+            self._journal_confirmation()
             return self.confirmation_data
 
+        self._check_confirmation_deadline(deadline)
+        self._journal_confirmation()
         if self.raise_exception:
             raise TransactionError("Transaction could to be confirmed")
         else:
             return self.response_data
 
+    def _get_block_time(self):
+        """Seconds per block of the network, chain stats are requested when
+        the block time has not been observed recently"""
+        block_time = self.client._get_cached_block_time()
+        if block_time is not None:
+            return block_time
+
+        try:
+            chain_stats = self.client.get_chain_stats()
+        except DeadlineExceededError:
+            raise
+        except Exception:
+            chain_stats = None
+        return self.client._observe_block_time(chain_stats)
+
+    def _submit_and_track(self, future):
+        response_data = self.execute()
+        if "error" in response_data:
+            raise TransactionError(
+                f"Transaction could not be submitted - {response_data['error']}"
+            )
+
+        self._track(future)
+
+    def _track(self, future):
+        """Hand the submitted transaction to the confirmation tracker of the
+        network, the future is resolved once the tracker confirms it"""
+        tracked = self.client._get_confirmation_tracker().track(
+            self.hash, self.submitted_at, self._get_confirmation_timeout()
+        )
+        tracked.add_done_callback(
+            lambda tracked: self._resolve(future, tracked.result())
+        )
+
+    def _get_confirmation_timeout(self):
+        """Seconds confirmation is awaited, no later than the deadline"""
+        deadline = self._get_deadline()
+        if not deadline:
+            return self.timeout
+        return deadline.cap(self.timeout)
+
+    def _resolve(self, future, confirmation_data):
+        """Resolve the future of this transaction with the confirmation data
+        found by a confirmation tracker, None when it was not confirmed"""
+        if isinstance(confirmation_data, dict):
+            self.confirmation_data = confirmation_data
+            self.status = confirmation_data.get("transaction_status")
+
+        if self.status == 1:
+            self._journal_confirmation()
+            future.set_result(self.confirmation_data)
+            return
+
+        try:
+            self._check_confirmation_deadline(self._get_deadline())
+            self._journal_confirmation()
+            if self.raise_exception:
+                raise TransactionError("Transaction could to be confirmed")
+        except Exception as e:
+            future.set_exception(e)
+            return
+        future.set_result(self.response_data)
+
+    def _check_confirmation_deadline(self, deadline):
+        if deadline:
+            deadline.check(f"Deadline exceeded confirming transaction {self.hash}")
+
     def _submit_transaction(self, payload):
         transaction_data = self._build_transaction_data(payload)
+        self._journal(TransactionState.BUILT, transaction_data)
 
         # Manipulate data here if needed
 
         headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
-        self.response_data = self.client._consensus_from_workers(
+        self.submitted_at = monotonic()
+        # Miners accepting the transaction echo its hash
+        self.response_data = self.client._broadcast_to_workers(
             "miners",
             endpoint=Endpoints.PUT_TRANSACTION,
-            method="POST",
             data=json.dumps(transaction_data),
             headers=headers,
+            is_ack=self._is_accepted,
+        )
+        self._journal(
+            TransactionState.SUBMITTED
+            if self._is_accepted(self.response_data)
+            else TransactionState.FAILED
         )
         try:
             response_hash = self.response_data.get("entity").get("hash")
@@ -115,7 +315,36 @@ class Transaction(ConnectionBase):
 
         return self.response_data
 
+    def _journal(self, state, transaction_data=None):
+        journal = self.client._get_journal()
+        if journal:
+            journal.record(self.hash, self.client.id, state, transaction_data)
+
+    def _journal_confirmation(self):
+        journal = self.client._get_journal()
+        if journal:
+            journal.record_confirmation(
+                self.hash, self.client.id, self.confirmation_data
+            )
+
+    def _is_accepted(self, response_data):
+        try:
+            return response_data.get("entity").get("hash") == self.hash
+        except AttributeError:
+            return False
+
+    def _build_payload(self):
+        if not self.name:
+            return self.input
+        return json.dumps({"name": self.name, "input": self.input})
+
     def _build_transaction_data(self, payload):
+        data = self._build_unsigned_data(payload)
+        data["signature"] = self.client.sign(self.hash)
+        return data
+
+    def _build_unsigned_data(self, payload):
+        """Transaction data without its signature, sets the hash to be signed"""
         hash_payload = hash_string(payload)
         ts = int(time())
 
@@ -124,7 +353,6 @@ class Transaction(ConnectionBase):
         )
 
         self.hash = hash_string(hashdata)
-        signature = self.client.sign(self.hash)
 
         data = {
             "client_id": self.client.id,
@@ -136,7 +364,7 @@ class Transaction(ConnectionBase):
             "to_client_id": self.sc_address,
             "hash": self.hash,
             "transaction_fee": self.fee,
-            "signature": signature,
+            "signature": None,
             "version": "1.0",
         }
 
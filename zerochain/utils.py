@@ -10,7 +10,7 @@ from hashlib import sha3_256
 from bip39 import encode_bytes
 import requests
 
-from zerochain.const import Endpoints
+from zerochain.const import DEFAULT_REQUEST_TIMEOUT, Endpoints
 
 
 def generate_random_letters(num_letters=5):
@@ -28,6 +28,11 @@ def hash_string(payload_string):
     return f"{hash_object.hexdigest()}"
 
 
+def hash_bytes(payload_bytes):
+    hash_object = sha3_256(payload_bytes)
+    return f"{hash_object.hexdigest()}"
+
+
 def get_project_root():
     return Path(__file__).parent.resolve().parent.resolve()
 
@@ -109,7 +114,9 @@ def get_duration_nanoseconds(days=0, hours=0, minutes=0, seconds=0):
 
 
 def request_dns_workers(url, worker=None):
-    res = requests.get(f"{url}/{Endpoints.NETWORK_DNS}")
+    res = requests.get(
+        f"{url}/{Endpoints.NETWORK_DNS}", timeout=DEFAULT_REQUEST_TIMEOUT
+    )
 
     if res.status_code != 200:
         raise ConnectionError(f"An error occured requesting workers - {res.text}")
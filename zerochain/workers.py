@@ -1,16 +1,188 @@
-class Sharder:
+import threading
+from time import time
+
+from zerochain.const import DEFAULT_HEDGE_DELAY, BreakerState
+
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+
+
+class WorkerStats:
+    """Live request statistics of a single worker, updated by each request
+
+    Latency and error rate are exponentially weighted moving averages, the
+    latency deviation is tracked alongside so a p95 style estimate can be
+    derived for hedging.
+    """
+
+    def __init__(self) -> None:
+        self.ewma_latency = None
+        self.ewma_deviation = 0
+        self.error_rate = 0
+        self.last_success = None
+        self.in_flight = 0
+        # Requests held for submissions about to run, see reserve
+        self.reserved = 0
+        self.num_requests = 0
+        # Notified whenever a request finishes, see wait_for_capacity
+        self._condition = threading.Condition()
+
+    def start_request(self):
+        with self._condition:
+            self.in_flight += 1
+        return time()
+
+    def cancel_request(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def wait_for_capacity(self, max_in_flight, timeout=None):
+        """Wait until fewer than max_in_flight requests are running or
+        reserved, returns False when the timeout passes first"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.in_flight + self.reserved < max_in_flight, timeout
+            )
+
+    def reserve(self, max_in_flight, timeout=None):
+        """Wait for capacity as wait_for_capacity, then hold a request until
+        release, returns False without holding when the timeout passes first"""
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self.in_flight + self.reserved < max_in_flight, timeout
+            ):
+                return False
+            self.reserved += 1
+            return True
+
+    def release(self):
+        with self._condition:
+            self.reserved -= 1
+            self._condition.notify_all()
+
+    def end_request(self, start_time, success):
+        latency = time() - start_time
+        with self._condition:
+            self.in_flight -= 1
+            self.num_requests += 1
+            self._condition.notify_all()
+            self.error_rate += EWMA_ALPHA * ((0 if success else 1) - self.error_rate)
+
+            if not success:
+                return
+
+            self.last_success = time()
+            if self.ewma_latency is None:
+                self.ewma_latency = latency
+                self.ewma_deviation = latency / 2
+            else:
+                self.ewma_deviation += EWMA_ALPHA * (
+                    abs(latency - self.ewma_latency) - self.ewma_deviation
+                )
+                self.ewma_latency += EWMA_ALPHA * (latency - self.ewma_latency)
+
+    def latency_estimate(self):
+        """Upper latency estimate, roughly p95, None until a request succeeds"""
+        if self.ewma_latency is None:
+            return None
+        return self.ewma_latency + 2 * self.ewma_deviation
+
+    def score(self):
+        """Lower is better, workers never requested score 0 so they are tried,
+        workers that have only failed are scored at the default hedge delay"""
+        latency = self.ewma_latency
+        if latency is None:
+            if not self.num_requests:
+                return 0
+            latency = DEFAULT_HEDGE_DELAY
+        return latency * (1 + 10 * self.error_rate) * (1 + self.in_flight)
+
+    def json(self):
+        return {
+            "ewma_latency": self.ewma_latency,
+            "latency_estimate": self.latency_estimate(),
+            "error_rate": self.error_rate,
+            "last_success": self.last_success,
+            "in_flight": self.in_flight,
+            "reserved": self.reserved,
+            "num_requests": self.num_requests,
+        }
+
+
+class CircuitBreaker:
+    """Ejects a failing worker from requests until a cool down has passed
+
+    Consecutive failures open the breaker, once the cool down passes a single
+    probe request is let through in the half open state. A successful probe
+    closes the breaker, a failed one opens it for another cool down.
+    :param failure_threshold: Int, consecutive failures that open the breaker
+    :param cooldown: Float, seconds before an open breaker lets a probe through
+    """
+
+    def __init__(self, failure_threshold=5, cooldown=30) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = BreakerState.CLOSED
+        self.num_failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == BreakerState.CLOSED:
+                return True
+
+            if time() - self.opened_at < self.cooldown:
+                return False
+
+            # Let a probe through, restart the window in case it never reports
+            self.state = BreakerState.HALF_OPEN
+            self.opened_at = time()
+            return True
+
+    def record(self, success):
+        with self._lock:
+            if success:
+                self.state = BreakerState.CLOSED
+                self.num_failures = 0
+                return
+
+            self.num_failures += 1
+            if (
+                self.state == BreakerState.HALF_OPEN
+                or self.num_failures >= self.failure_threshold
+            ):
+                self.state = BreakerState.OPEN
+                self.opened_at = time()
+
+    def json(self):
+        return {"state": self.state, "num_failures": self.num_failures}
+
+
+class Worker:
+    def __init__(self, url) -> None:
+        self.url = url
+        self.stats = WorkerStats()
+        self.breaker = CircuitBreaker()
+
+    def json(self):
+        return {**self.stats.json(), "breaker": self.breaker.json()}
+
+
+class Sharder(Worker):
     def __init__(self, sharder_url) -> None:
-        self.url = sharder_url
+        super().__init__(sharder_url)
 
 
-class Miner:
+class Miner(Worker):
     def __init__(self, miner_url) -> None:
-        self.url = miner_url
+        super().__init__(miner_url)
 
 
-class Blobber:
+class Blobber(Worker):
     def __init__(self, blobber_url, blobber_id=None) -> None:
-        self.url = blobber_url
+        super().__init__(blobber_url)
         self.id = blobber_id
 
     @staticmethod